@@ -0,0 +1,372 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (access/accesscontrol/enumerable/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.math import assert_lt, assert_nn
+from starkware.cairo.common.math_cmp import is_le
+from starkware.starknet.common.syscalls import get_caller_address
+
+from openzeppelin.access.accesscontrol.library import (
+    AccessControl, _assert_new_role, _role_run_len
+)
+from openzeppelin.introspection.erc165.library import ERC165
+from openzeppelin.utils.constants.library import IACCESSCONTROL_ENUMERABLE_ID
+
+#
+# Storage
+#
+
+@storage_var
+func AccessControlEnumerable_role_members_len(role: felt) -> (len: felt):
+end
+
+@storage_var
+func AccessControlEnumerable_role_members(role: felt, index: felt) -> (account: felt):
+end
+
+@storage_var
+func AccessControlEnumerable_role_members_index(role: felt, account: felt) -> (index: felt):
+end
+
+# Extends `AccessControl` with the list of members of each role. Members are
+# kept in a dense array per role, removals move the last member into the
+# freed index. Roles must only be granted and revoked through this namespace
+# for the enumeration to stay in sync.
+namespace AccessControlEnumerable:
+
+    #
+    # Initializer
+    #
+
+    func initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }():
+        AccessControl.initializer()
+        ERC165.register_interface(IACCESSCONTROL_ENUMERABLE_ID)
+        return ()
+    end
+
+    #
+    # Getters
+    #
+
+    func get_role_member_count{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt) -> (count: felt):
+        let (count) = AccessControlEnumerable_role_members_len.read(role)
+        return (count)
+    end
+
+    func get_role_member{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, index: felt) -> (account: felt):
+        let (len) = AccessControlEnumerable_role_members_len.read(role)
+        with_attr error_message("AccessControlEnumerable: index out of bounds"):
+            assert_nn(index)
+            assert_lt(index, len)
+        end
+        let (account) = AccessControlEnumerable_role_members.read(role, index)
+        return (account)
+    end
+
+    # Returns up to `limit` members of `role` starting at index `offset`.
+    # The page is truncated at the end of the enumeration.
+    func get_role_members{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, offset: felt, limit: felt) -> (accounts_len: felt, accounts: felt*):
+        alloc_locals
+        let (len) = AccessControlEnumerable_role_members_len.read(role)
+        let (accounts_len) = _page_len(len, offset, limit)
+
+        let (local accounts) = alloc()
+        _read_role_members(role, offset, accounts_len, accounts)
+        return (accounts_len, accounts)
+    end
+
+    #
+    # Externals
+    #
+
+    func grant_role{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, user: felt):
+        let (admin: felt) = AccessControl.get_role_admin(role)
+        AccessControl.assert_only_role(admin)
+        _grant_role(role, user)
+        return ()
+    end
+
+    func revoke_role{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, user: felt):
+        let (admin: felt) = AccessControl.get_role_admin(role)
+        AccessControl.assert_only_role(admin)
+        _revoke_role(role, user)
+        return ()
+    end
+
+    func grant_roles{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, users_len: felt, users: felt*):
+        let (admin: felt) = AccessControl.get_role_admin(role)
+        AccessControl.assert_only_role(admin)
+        _grant_roles(role, users_len, users)
+        return ()
+    end
+
+    func revoke_roles{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, users_len: felt, users: felt*):
+        let (admin: felt) = AccessControl.get_role_admin(role)
+        AccessControl.assert_only_role(admin)
+        _revoke_roles(role, users_len, users)
+        return ()
+    end
+
+    func grant_roles_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+        with_attr error_message("AccessControl: roles and users length mismatch"):
+            assert roles_len = users_len
+        end
+        let (run_roles) = alloc()
+        _grant_roles_batch(roles_len, roles, users, 0, run_roles)
+        return ()
+    end
+
+    func revoke_roles_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+        with_attr error_message("AccessControl: roles and users length mismatch"):
+            assert roles_len = users_len
+        end
+        let (run_roles) = alloc()
+        _revoke_roles_batch(roles_len, roles, users, 0, run_roles)
+        return ()
+    end
+
+    func renounce_role{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, user: felt):
+        let (caller: felt) = get_caller_address()
+        with_attr error_message("AccessControl: can only renounce roles for self"):
+            assert user = caller
+        end
+        _revoke_role(role, user)
+        return ()
+    end
+
+    #
+    # Unprotected
+    #
+
+    func _grant_role{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, user: felt):
+        let (user_has_role: felt) = AccessControl.has_role(role, user)
+        if user_has_role == FALSE:
+            _add_role_member(role, user)
+            AccessControl._grant_role(role, user)
+            return ()
+        end
+        return ()
+    end
+
+    func _revoke_role{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, user: felt):
+        let (user_has_role: felt) = AccessControl.has_role(role, user)
+        if user_has_role == TRUE:
+            _remove_role_member(role, user)
+            AccessControl._revoke_role(role, user)
+            return ()
+        end
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+func _add_role_member{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt):
+    let (len) = AccessControlEnumerable_role_members_len.read(role)
+    AccessControlEnumerable_role_members.write(role, len, user)
+    AccessControlEnumerable_role_members_index.write(role, user, len)
+    AccessControlEnumerable_role_members_len.write(role, len + 1)
+    return ()
+end
+
+func _remove_role_member{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt):
+    alloc_locals
+    let (len) = AccessControlEnumerable_role_members_len.read(role)
+    # the user has the role, so the role has at least one member
+    let last_index = len - 1
+    let (index) = AccessControlEnumerable_role_members_index.read(role, user)
+
+    AccessControlEnumerable_role_members_index.write(role, user, 0)
+    AccessControlEnumerable_role_members_len.write(role, last_index)
+
+    if index == last_index:
+        AccessControlEnumerable_role_members.write(role, last_index, 0)
+        return ()
+    end
+
+    # Reposition the last member to the removed member's index
+    let (last_member) = AccessControlEnumerable_role_members.read(role, last_index)
+    AccessControlEnumerable_role_members.write(role, last_index, 0)
+    AccessControlEnumerable_role_members_index.write(role, last_member, index)
+    AccessControlEnumerable_role_members.write(role, index, last_member)
+    return ()
+end
+
+func _grant_roles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    if users_len == 0:
+        return ()
+    end
+
+    AccessControlEnumerable._grant_role(role, [users])
+    return _grant_roles(role, users_len - 1, users + 1)
+end
+
+func _revoke_roles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    if users_len == 0:
+        return ()
+    end
+
+    AccessControlEnumerable._revoke_role(role, [users])
+    return _revoke_roles(role, users_len - 1, users + 1)
+end
+
+func _grant_roles_batch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users: felt*, run_roles_len: felt, run_roles: felt*):
+    alloc_locals
+    if roles_len == 0:
+        return ()
+    end
+
+    # each role gets a single run, so its admin is checked once
+    local role = [roles]
+    with_attr error_message("AccessControl: roles are not grouped"):
+        _assert_new_role(role, run_roles_len, run_roles)
+    end
+    assert run_roles[run_roles_len] = role
+    let (local run_len) = _role_run_len(role, roles_len, roles, 0)
+    AccessControlEnumerable.grant_roles(role, run_len, users)
+    return _grant_roles_batch(
+        roles_len - run_len, roles + run_len, users + run_len, run_roles_len + 1, run_roles
+    )
+end
+
+func _revoke_roles_batch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users: felt*, run_roles_len: felt, run_roles: felt*):
+    alloc_locals
+    if roles_len == 0:
+        return ()
+    end
+
+    # each role gets a single run, so its admin is checked once
+    local role = [roles]
+    with_attr error_message("AccessControl: roles are not grouped"):
+        _assert_new_role(role, run_roles_len, run_roles)
+    end
+    assert run_roles[run_roles_len] = role
+    let (local run_len) = _role_run_len(role, roles_len, roles, 0)
+    AccessControlEnumerable.revoke_roles(role, run_len, users)
+    return _revoke_roles_batch(
+        roles_len - run_len, roles + run_len, users + run_len, run_roles_len + 1, run_roles
+    )
+end
+
+# Returns the number of items in a page of at most `limit` items
+# starting at `offset`, out of `len` items.
+func _page_len{range_check_ptr}(
+        len: felt,
+        offset: felt,
+        limit: felt
+    ) -> (page_len: felt):
+    alloc_locals
+    with_attr error_message("AccessControlEnumerable: offset and limit cannot be negative"):
+        assert_nn(offset)
+        assert_nn(limit)
+    end
+
+    let (is_past_end) = is_le(len, offset)
+    if is_past_end == TRUE:
+        return (0)
+    end
+
+    let remaining = len - offset
+    let (is_limit_le) = is_le(limit, remaining)
+    if is_limit_le == TRUE:
+        return (limit)
+    end
+    return (remaining)
+end
+
+func _read_role_members{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, index: felt, accounts_len: felt, accounts: felt*):
+    if accounts_len == 0:
+        return ()
+    end
+
+    let (account) = AccessControlEnumerable_role_members.read(role, index)
+    assert [accounts] = account
+    return _read_role_members(role, index + 1, accounts_len - 1, accounts + 1)
+end
@@ -4,8 +4,10 @@
 %lang starknet
 
 from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin
 from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.math import assert_not_equal
 
 from openzeppelin.introspection.erc165.library import ERC165
 from openzeppelin.utils.constants.library import IACCESSCONTROL_ID
@@ -118,6 +120,57 @@ namespace AccessControl:
         return ()
     end
 
+    func grant_roles{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, users_len: felt, users: felt*):
+        let (admin: felt) = get_role_admin(role)
+        assert_only_role(admin)
+        _grant_roles(role, users_len, users)
+        return ()
+    end
+
+    func revoke_roles{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(role: felt, users_len: felt, users: felt*):
+        let (admin: felt) = get_role_admin(role)
+        assert_only_role(admin)
+        _revoke_roles(role, users_len, users)
+        return ()
+    end
+
+    # Grants `roles[i]` to `users[i]`. Entries must be grouped by role, so
+    # that the admin role is checked once for each distinct role.
+    func grant_roles_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+        with_attr error_message("AccessControl: roles and users length mismatch"):
+            assert roles_len = users_len
+        end
+        let (run_roles) = alloc()
+        _grant_roles_batch(roles_len, roles, users, 0, run_roles)
+        return ()
+    end
+
+    # Revokes `roles[i]` from `users[i]`, see `grant_roles_batch`.
+    func revoke_roles_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+        with_attr error_message("AccessControl: roles and users length mismatch"):
+            assert roles_len = users_len
+        end
+        let (run_roles) = alloc()
+        _revoke_roles_batch(roles_len, roles, users, 0, run_roles)
+        return ()
+    end
+
     func renounce_role{
             syscall_ptr : felt*,
             pedersen_ptr : HashBuiltin*,
@@ -176,3 +229,102 @@ namespace AccessControl:
         return ()
     end
 end
+
+#
+# Private
+#
+
+func _grant_roles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    if users_len == 0:
+        return ()
+    end
+
+    AccessControl._grant_role(role, [users])
+    return _grant_roles(role, users_len - 1, users + 1)
+end
+
+func _revoke_roles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    if users_len == 0:
+        return ()
+    end
+
+    AccessControl._revoke_role(role, [users])
+    return _revoke_roles(role, users_len - 1, users + 1)
+end
+
+func _grant_roles_batch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users: felt*, run_roles_len: felt, run_roles: felt*):
+    alloc_locals
+    if roles_len == 0:
+        return ()
+    end
+
+    # each role gets a single run, so its admin is checked once
+    local role = [roles]
+    with_attr error_message("AccessControl: roles are not grouped"):
+        _assert_new_role(role, run_roles_len, run_roles)
+    end
+    assert run_roles[run_roles_len] = role
+    let (local run_len) = _role_run_len(role, roles_len, roles, 0)
+    AccessControl.grant_roles(role, run_len, users)
+    return _grant_roles_batch(
+        roles_len - run_len, roles + run_len, users + run_len, run_roles_len + 1, run_roles
+    )
+end
+
+func _revoke_roles_batch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users: felt*, run_roles_len: felt, run_roles: felt*):
+    alloc_locals
+    if roles_len == 0:
+        return ()
+    end
+
+    # each role gets a single run, so its admin is checked once
+    local role = [roles]
+    with_attr error_message("AccessControl: roles are not grouped"):
+        _assert_new_role(role, run_roles_len, run_roles)
+    end
+    assert run_roles[run_roles_len] = role
+    let (local run_len) = _role_run_len(role, roles_len, roles, 0)
+    AccessControl.revoke_roles(role, run_len, users)
+    return _revoke_roles_batch(
+        roles_len - run_len, roles + run_len, users + run_len, run_roles_len + 1, run_roles
+    )
+end
+
+# Returns `run_len` plus the number of leading entries of `roles` equal to `role`.
+func _role_run_len(role: felt, roles_len: felt, roles: felt*, run_len: felt) -> (run_len: felt):
+    if roles_len == 0:
+        return (run_len)
+    end
+
+    if [roles] != role:
+        return (run_len)
+    end
+
+    return _role_run_len(role, roles_len - 1, roles + 1, run_len + 1)
+end
+
+# Asserts `role` is none of the `roles` whose run was already handled.
+func _assert_new_role(role: felt, roles_len: felt, roles: felt*):
+    if roles_len == 0:
+        return ()
+    end
+
+    assert_not_equal(role, [roles])
+    return _assert_new_role(role, roles_len - 1, roles + 1)
+end
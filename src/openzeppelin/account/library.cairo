@@ -8,16 +8,48 @@ from starkware.starknet.common.syscalls import get_contract_address
 from starkware.cairo.common.signature import verify_ecdsa_signature
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin, BitwiseBuiltin
 from starkware.cairo.common.alloc import alloc
-from starkware.cairo.common.uint256 import Uint256
+from starkware.cairo.common.hash_state import (
+    hash_init, hash_finalize, hash_update_single, hash_felts
+)
+from starkware.cairo.common.uint256 import (
+    Uint256, uint256_add, uint256_check, uint256_eq, uint256_le
+)
 from starkware.cairo.common.memcpy import memcpy
-from starkware.cairo.common.math import split_felt
-from starkware.cairo.common.bool import TRUE
-from starkware.starknet.common.syscalls import call_contract, get_caller_address, get_tx_info
-from starkware.cairo.common.cairo_secp.signature import verify_eth_signature_uint256
+from starkware.cairo.common.math import (
+    split_felt, assert_lt, assert_lt_felt, assert_not_equal, assert_not_zero
+)
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.starknet.common.syscalls import (
+    call_contract, get_block_timestamp, get_caller_address, get_tx_info
+)
+from starkware.cairo.common.cairo_secp.bigint import BigInt3, UnreducedBigInt3, uint256_to_bigint, bigint_to_uint256
+from starkware.cairo.common.cairo_secp.constants import BETA
+from starkware.cairo.common.cairo_secp.ec import EcPoint, ec_add, ec_mul
+from starkware.cairo.common.cairo_secp.field import reduce, unreduced_mul, unreduced_sqr, verify_zero
+from starkware.cairo.common.cairo_secp.signature import (
+    verify_eth_signature_uint256, get_generator_point, div_mod_n, validate_signature_entry
+)
 from openzeppelin.introspection.erc165.library import ERC165
 
 from openzeppelin.utils.constants.library import IACCOUNT_ID
 
+#
+# Constants
+#
+
+# Nonces are encoded as `channel * ACCOUNT_NONCE_CHANNEL_SHIFT + sequence`
+const ACCOUNT_NONCE_CHANNEL_SHIFT = 2 ** 128
+# Higher channels would not fit in a nonce below the field prime
+const ACCOUNT_MAX_NONCE_CHANNEL = 2 ** 123
+# Distinguishes relayed hashes from transaction hashes
+const ACCOUNT_RELAYED_HASH_PREFIX = 'StarkNet Relayed Execute'
+# Session keys sign (session_key, sig_r, sig_s), the account key (sig_r, sig_s)
+const ACCOUNT_SESSION_SIGNATURE_LEN = 3
+# ERC20 calls whose `amount` counts towards the spending cap of a session on the token
+const ACCOUNT_TRANSFER_SELECTOR = 0x83afd3f4caedc6eebf44246fe54e38c95e3179a5ec9ea81740eca5b482d12e
+const ACCOUNT_APPROVE_SELECTOR = 0x219209e083275171774dab1df80982e9df2096516f06319c5c6d71ae0a8480c
+const ACCOUNT_INCREASE_ALLOWANCE_SELECTOR = 0x16cc063b8338363cf388ce7fe1df408bf10f16cd51635d392e21d852fafb683
+
 #
 # Storage
 #
@@ -26,10 +58,53 @@ from openzeppelin.utils.constants.library import IACCOUNT_ID
 func Account_current_nonce() -> (res: felt):
 end
 
+# Nonces of the parallel channels, channel 0 uses `Account_current_nonce`
+@storage_var
+func Account_channel_nonces(channel: felt) -> (res: felt):
+end
+
 @storage_var
 func Account_public_key() -> (res: felt):
 end
 
+# Uncompressed secp256k1 public key, checked to be on the curve when set
+@storage_var
+func Account_secp256k1_public_key() -> (point: EcPoint):
+end
+
+@storage_var
+func Account_discard_responses() -> (res: felt):
+end
+
+@storage_var
+func Account_frame_responses() -> (res: felt):
+end
+
+@storage_var
+func Account_session_count() -> (res: felt):
+end
+
+@storage_var
+func Account_session_ids(session_key: felt) -> (session_id: felt):
+end
+
+# Revoking a session key only resets its expiry
+@storage_var
+func Account_session_expires_at(session_key: felt) -> (res: felt):
+end
+
+@storage_var
+func Account_session_scopes(session_id: felt, to: felt, selector: felt) -> (allowed: felt):
+end
+
+@storage_var
+func Account_session_spending_caps(session_id: felt, token: felt) -> (res: Uint256):
+end
+
+@storage_var
+func Account_session_spent(session_id: felt, token: felt) -> (res: Uint256):
+end
+
 #
 # Structs
 #
@@ -50,6 +125,18 @@ struct AccountCallArray:
     member data_len: felt
 end
 
+# A (contract, function) pair a session key is allowed to call
+struct SessionScope:
+    member to: felt
+    member selector: felt
+end
+
+# The most a session key can spend of an ERC20 token, in the token's own units
+struct SessionSpendingCap:
+    member token: felt
+    member cap: Uint256
+end
+
 namespace Account:
 
     #
@@ -66,6 +153,16 @@ namespace Account:
         return()
     end
 
+    func secp256k1_initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(public_key_x: Uint256, public_key_y: Uint256):
+        _set_secp256k1_public_key(public_key_x, public_key_y)
+        ERC165.register_interface(IACCOUNT_ID)
+        return()
+    end
+
     #
     # Guards
     #
@@ -92,6 +189,18 @@ namespace Account:
         return (res=res)
     end
 
+    func get_secp256k1_public_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (x: Uint256, y: Uint256):
+        alloc_locals
+        let (point) = Account_secp256k1_public_key.read()
+        let (local x) = bigint_to_uint256(point.x)
+        let (y) = bigint_to_uint256(point.y)
+        return (x=x, y=y)
+    end
+
     func get_nonce{
             syscall_ptr : felt*,
             pedersen_ptr : HashBuiltin*,
@@ -101,6 +210,95 @@ namespace Account:
         return (res=res)
     end
 
+    # Returns the next nonce of `channel`, with the channel encoded in its
+    # high 128 bits. Channel 0 is the sequential nonce of `get_nonce`.
+    func get_channel_nonce{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(channel: felt) -> (res: felt):
+        with_attr error_message("Account: channel is out of range"):
+            assert_lt_felt(channel, ACCOUNT_MAX_NONCE_CHANNEL)
+        end
+        let (sequence) = _read_channel_nonce(channel)
+        return (res=channel * ACCOUNT_NONCE_CHANNEL_SHIFT + sequence)
+    end
+
+    func get_discard_responses{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (res: felt):
+        let (res) = Account_discard_responses.read()
+        return (res=res)
+    end
+
+    func get_frame_responses{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (res: felt):
+        let (res) = Account_frame_responses.read()
+        return (res=res)
+    end
+
+    func get_session_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_key: felt) -> (expires_at: felt):
+        let (expires_at) = Account_session_expires_at.read(session_key)
+        return (expires_at=expires_at)
+    end
+
+    func get_session_spending{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_key: felt, token: felt) -> (spending_cap: Uint256, spent: Uint256):
+        alloc_locals
+        let (session_id) = Account_session_ids.read(session_key)
+        let (local spending_cap) = Account_session_spending_caps.read(session_id, token)
+        let (spent) = Account_session_spent.read(session_id, token)
+        return (spending_cap=spending_cap, spent=spent)
+    end
+
+    # Returns the hash signed to have calls relayed by another contract. It
+    # commits to this account, the calls, the nonce and the chain.
+    func get_relayed_hash{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt
+        ) -> (hash: felt):
+        alloc_locals
+        let (self) = get_contract_address()
+        let (tx_info) = get_tx_info()
+
+        let hash_ptr = pedersen_ptr
+        with hash_ptr:
+            let (call_array_hash) = hash_felts(
+                cast(call_array, felt*), call_array_len * AccountCallArray.SIZE
+            )
+            let (calldata_hash) = hash_felts(calldata, calldata_len)
+            let (hash_state_ptr) = hash_init()
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, ACCOUNT_RELAYED_HASH_PREFIX)
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, self)
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, call_array_hash)
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, calldata_hash)
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, nonce)
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, tx_info.chain_id)
+            let (hash) = hash_finalize(hash_state_ptr)
+        end
+        let pedersen_ptr = hash_ptr
+        return (hash=hash)
+    end
+
     #
     # Setters
     #
@@ -115,6 +313,89 @@ namespace Account:
         return ()
     end
 
+    func set_secp256k1_public_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(new_x: Uint256, new_y: Uint256):
+        assert_only_self()
+        _set_secp256k1_public_key(new_x, new_y)
+        return ()
+    end
+
+    # When enabled, `__execute__` skips copying the responses of the calls
+    # and returns an empty response.
+    func set_discard_responses{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(discard: felt):
+        assert_only_self()
+        with_attr error_message("Account: discard is not a Cairo boolean"):
+            assert discard * (1 - discard) = 0
+        end
+        Account_discard_responses.write(discard)
+        return ()
+    end
+
+    # When enabled, `__execute__` prefixes the response of each call with
+    # its length, so that the response of any call can be located.
+    func set_frame_responses{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(frame: felt):
+        assert_only_self()
+        with_attr error_message("Account: frame is not a Cairo boolean"):
+            assert frame * (1 - frame) = 0
+        end
+        Account_frame_responses.write(frame)
+        return ()
+    end
+
+    # Lets `session_key` sign transactions made of calls to `scopes` until
+    # `expires_at`. Each nonzero cap of `spending_caps` bounds the total amount
+    # of the transfers and approvals of its token signed with the key, other
+    # tokens are uncapped. Registering a key again replaces its previous
+    # scopes and spending.
+    func add_session_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            session_key: felt,
+            expires_at: felt,
+            scopes_len: felt,
+            scopes: SessionScope*,
+            spending_caps_len: felt,
+            spending_caps: SessionSpendingCap*
+        ):
+        alloc_locals
+        assert_only_self()
+        with_attr error_message("Account: session key cannot be zero"):
+            assert_not_zero(session_key)
+        end
+
+        let (count) = Account_session_count.read()
+        local session_id = count + 1
+        Account_session_count.write(session_id)
+        Account_session_ids.write(session_key, session_id)
+        Account_session_expires_at.write(session_key, expires_at)
+        _write_session_scopes(session_id, scopes_len, scopes)
+        _write_session_spending_caps(session_id, spending_caps_len, spending_caps)
+        return ()
+    end
+
+    func revoke_session_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_key: felt):
+        assert_only_self()
+        Account_session_expires_at.write(session_key, 0)
+        return ()
+    end
+
     #
     # Business logic
     #
@@ -184,6 +465,31 @@ namespace Account:
         return (is_valid=TRUE)
     end
 
+    # Verifies the signature against the stored public key, which spares the
+    # public key recovery and keccak hashing of `is_valid_eth_signature`.
+    func is_valid_secp256k1_signature{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            hash: felt,
+            signature_len: felt,
+            signature: felt*
+        ) -> (is_valid: felt):
+        alloc_locals
+        let (local public_key_point) = Account_secp256k1_public_key.read()
+
+        # Same (sig_v, sig_r, sig_s) signatures as `is_valid_eth_signature`,
+        # sig_v is only needed for recovery and is ignored.
+        let (high, low) = split_felt(hash)
+        let (msg_hash) = uint256_to_bigint(Uint256(low=low, high=high))
+        let (local sig_r) = uint256_to_bigint(Uint256(low=signature[1], high=signature[2]))
+        let (sig_s) = uint256_to_bigint(Uint256(low=signature[3], high=signature[4]))
+
+        _verify_secp256k1_signature(msg_hash, sig_r, sig_s, public_key_point)
+        return (is_valid=TRUE)
+    end
+
     func execute{
             syscall_ptr : felt*,
             pedersen_ptr : HashBuiltin*,
@@ -202,6 +508,11 @@ namespace Account:
         let (__fp__, _) = get_fp_and_pc()
         let (tx_info) = get_tx_info()
 
+        if tx_info.signature_len == ACCOUNT_SESSION_SIGNATURE_LEN:
+            _assert_valid_session(tx_info.transaction_hash, tx_info.signature, call_array_len, call_array, calldata)
+            return _unsafe_execute(call_array_len, call_array, calldata_len, calldata, nonce)
+        end
+
         # validate transaction
         with_attr error_message("Account: invalid signature"):
             let (is_valid) = is_valid_signature(tx_info.transaction_hash, tx_info.signature_len, tx_info.signature)
@@ -238,6 +549,89 @@ namespace Account:
         return _unsafe_execute(call_array_len, call_array, calldata_len, calldata, nonce)
     end
 
+    func secp256k1_execute{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*,
+            bitwise_ptr: BitwiseBuiltin*
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt
+        ) -> (response_len: felt, response: felt*):
+        alloc_locals
+        let (tx_info) = get_tx_info()
+
+        # validate transaction
+        with_attr error_message("Account: invalid secp256k1 signature"):
+            let (is_valid) = is_valid_secp256k1_signature(tx_info.transaction_hash, tx_info.signature_len, tx_info.signature)
+            assert is_valid = TRUE
+        end
+
+        return _unsafe_execute(call_array_len, call_array, calldata_len, calldata, nonce)
+    end
+
+    # Executes calls signed by this account's key on behalf of any caller,
+    # such as a relayer packing calls from many accounts in one transaction.
+    func execute_relayed{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*,
+            bitwise_ptr: BitwiseBuiltin*
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt,
+            signature_len: felt,
+            signature: felt*
+        ) -> (response_len: felt, response: felt*):
+        alloc_locals
+
+        let (hash) = get_relayed_hash(call_array_len, call_array, calldata_len, calldata, nonce)
+
+        # validate signature
+        with_attr error_message("Account: invalid signature"):
+            let (is_valid) = is_valid_signature(hash, signature_len, signature)
+            assert is_valid = TRUE
+        end
+
+        return _execute_calls(call_array_len, call_array, calldata_len, calldata, nonce)
+    end
+
+    func eth_execute_relayed{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*,
+            bitwise_ptr: BitwiseBuiltin*
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt,
+            signature_len: felt,
+            signature: felt*
+        ) -> (response_len: felt, response: felt*):
+        alloc_locals
+
+        let (hash) = get_relayed_hash(call_array_len, call_array, calldata_len, calldata, nonce)
+
+        # validate signature
+        with_attr error_message("Account: invalid secp256k1 signature"):
+            let (is_valid) = is_valid_eth_signature(hash, signature_len, signature)
+            assert is_valid = TRUE
+        end
+
+        return _execute_calls(call_array_len, call_array, calldata_len, calldata, nonce)
+    end
+
     func _unsafe_execute{
             syscall_ptr : felt*,
             pedersen_ptr : HashBuiltin*,
@@ -258,29 +652,104 @@ namespace Account:
             assert caller = 0
         end
 
-        # validate nonce
+        return _execute_calls(call_array_len, call_array, calldata_len, calldata, nonce)
+    end
+
+    func _execute_calls{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*,
+            bitwise_ptr: BitwiseBuiltin*
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt
+        ) -> (response_len: felt, response: felt*):
+        alloc_locals
 
-        let (_current_nonce) = Account_current_nonce.read()
+        # validate nonce, each channel is ordered independently
+        let (channel, sequence) = split_felt(nonce)
+        let (_current_nonce) = _read_channel_nonce(channel)
 
         with_attr error_message("Account: nonce is invalid"):
-            assert _current_nonce = nonce
+            assert _current_nonce = sequence
         end
 
         # bump nonce
-        Account_current_nonce.write(_current_nonce + 1)
+        _write_channel_nonce(channel, _current_nonce + 1)
 
-        # TMP: Convert `AccountCallArray` to 'Call'.
-        let (calls : Call*) = alloc()
-        _from_call_array_to_call(call_array_len, call_array, calldata, calls)
-        let calls_len = call_array_len
-
-        # execute call
+        # execute calls straight from `call_array`, without building `Call`s
+        let (discard_responses) = Account_discard_responses.read()
+        let (frame_responses) = Account_frame_responses.read()
         let (response : felt*) = alloc()
-        let (response_len) = _execute_list(calls_len, calls, response)
+        let (response_len) = _execute_call_array(
+            call_array_len, call_array, calldata, response, discard_responses, frame_responses
+        )
 
         return (response_len=response_len, response=response)
     end
 
+    func _execute_call_array{syscall_ptr: felt*}(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata: felt*,
+            response: felt*,
+            discard_responses: felt,
+            frame_responses: felt
+        ) -> (response_len: felt):
+        alloc_locals
+
+        # if no more calls
+        if call_array_len == 0:
+           return (0)
+        end
+
+        # do the current call, reading its calldata in place
+        let res = call_contract(
+            contract_address=[call_array].to,
+            function_selector=[call_array].selector,
+            calldata_size=[call_array].data_len,
+            calldata=calldata + [call_array].data_offset
+        )
+
+        if discard_responses == TRUE:
+            return _execute_call_array(
+                call_array_len - 1, call_array + AccountCallArray.SIZE, calldata, response, TRUE, FALSE
+            )
+        end
+
+        if frame_responses == TRUE:
+            # prefix the result with its length
+            assert [response] = res.retdata_size
+            memcpy(response + 1, res.retdata, res.retdata_size)
+            let (response_len) = _execute_call_array(
+                call_array_len - 1,
+                call_array + AccountCallArray.SIZE,
+                calldata,
+                response + 1 + res.retdata_size,
+                FALSE,
+                TRUE
+            )
+            return (response_len + 1 + res.retdata_size)
+        end
+
+        # copy the result in response
+        memcpy(response, res.retdata, res.retdata_size)
+        # do the next calls recursively
+        let (response_len) = _execute_call_array(
+            call_array_len - 1,
+            call_array + AccountCallArray.SIZE,
+            calldata,
+            response + res.retdata_size,
+            FALSE,
+            FALSE
+        )
+        return (response_len + res.retdata_size)
+    end
+
     func _execute_list{syscall_ptr: felt*}(
             calls_len: felt,
             calls: Call*,
@@ -331,4 +800,242 @@ namespace Account:
         return ()
     end
 
+    func _set_secp256k1_public_key{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(x: Uint256, y: Uint256):
+        alloc_locals
+        with_attr error_message("Account: invalid secp256k1 public key"):
+            uint256_check(x)
+            uint256_check(y)
+            let (local x_bigint) = uint256_to_bigint(x)
+            let (local y_bigint) = uint256_to_bigint(y)
+
+            # y^2 = x^3 + 7, which also rules out the point at infinity
+            let (x_square) = unreduced_sqr(x_bigint)
+            let (x_square_reduced) = reduce(x_square)
+            let (x_cube) = unreduced_mul(x_bigint, x_square_reduced)
+            let (y_square) = unreduced_sqr(y_bigint)
+            verify_zero(
+                UnreducedBigInt3(
+                    d0=x_cube.d0 + BETA - y_square.d0,
+                    d1=x_cube.d1 - y_square.d1,
+                    d2=x_cube.d2 - y_square.d2
+                )
+            )
+        end
+        Account_secp256k1_public_key.write(EcPoint(x=x_bigint, y=y_bigint))
+        return ()
+    end
+
+    # ECDSA verification: (hash / s) * G + (r / s) * public_key has r as x coordinate
+    func _verify_secp256k1_signature{range_check_ptr}(
+            msg_hash: BigInt3,
+            r: BigInt3,
+            s: BigInt3,
+            public_key_point: EcPoint
+        ):
+        alloc_locals
+        with_attr error_message("Account: secp256k1 signature out of range"):
+            validate_signature_entry(r)
+            validate_signature_entry(s)
+        end
+
+        let (generator_point) = get_generator_point()
+        let (u1) = div_mod_n(msg_hash, s)
+        let (local u2) = div_mod_n(r, s)
+        let (local point1) = ec_mul(generator_point, u1)
+        let (point2) = ec_mul(public_key_point, u2)
+        let (res) = ec_add(point1, point2)
+
+        with_attr error_message("Account: invalid secp256k1 signature"):
+            assert res.x = r
+        end
+        return ()
+    end
+
+    func _assert_valid_session{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*
+        }(
+            hash: felt,
+            signature: felt*,
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata: felt*
+        ):
+        alloc_locals
+        let session_key = signature[0]
+        let (local session_id) = Account_session_ids.read(session_key)
+        let (expires_at) = Account_session_expires_at.read(session_key)
+        let (block_timestamp) = get_block_timestamp()
+
+        # unknown keys have no expiry either
+        with_attr error_message("Account: session key is expired or revoked"):
+            assert_lt(block_timestamp, expires_at)
+        end
+
+        with_attr error_message("Account: invalid session signature"):
+            verify_ecdsa_signature(
+                message=hash,
+                public_key=session_key,
+                signature_r=signature[1],
+                signature_s=signature[2])
+        end
+
+        let (self) = get_contract_address()
+        _check_session_calls(session_id, self, call_array_len, call_array, calldata)
+        return ()
+    end
+
+    # Checks every call is in the scopes of the session and records the
+    # amount each one spends of the token it calls.
+    func _check_session_calls{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            session_id: felt,
+            self: felt,
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata: felt*
+        ):
+        alloc_locals
+        if call_array_len == 0:
+            return ()
+        end
+
+        # the account key is the only one managing the account
+        with_attr error_message("Account: call not allowed by session key"):
+            assert_not_equal([call_array].to, self)
+            let (allowed) = Account_session_scopes.read(session_id, [call_array].to, [call_array].selector)
+            assert allowed = TRUE
+        end
+
+        let (amount) = _get_spending_amount(
+            [call_array].selector, [call_array].data_offset, [call_array].data_len, calldata
+        )
+        _spend_session_amount(session_id, [call_array].to, amount)
+        return _check_session_calls(
+            session_id, self, call_array_len - 1, call_array + AccountCallArray.SIZE, calldata
+        )
+    end
+
+    # Adds `amount` to what the session spent of `token`, within its cap.
+    func _spend_session_amount{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_id: felt, token: felt, amount: Uint256):
+        alloc_locals
+        let (is_not_spending) = uint256_eq(amount, Uint256(0, 0))
+        if is_not_spending == TRUE:
+            return ()
+        end
+
+        let (local spending_cap) = Account_session_spending_caps.read(session_id, token)
+        let (is_uncapped) = uint256_eq(spending_cap, Uint256(0, 0))
+        if is_uncapped == TRUE:
+            return ()
+        end
+
+        let (spent) = Account_session_spent.read(session_id, token)
+        with_attr error_message("Account: session spending cap exceeded"):
+            let (new_spent, carry) = uint256_add(spent, amount)
+            assert carry = 0
+            let (within_cap) = uint256_le(new_spent, spending_cap)
+            assert within_cap = TRUE
+        end
+        Account_session_spent.write(session_id, token, new_spent)
+        return ()
+    end
+
+    func _get_spending_amount{range_check_ptr}(
+            selector: felt,
+            data_offset: felt,
+            data_len: felt,
+            calldata: felt*
+        ) -> (amount: Uint256):
+        # zero if and only if the selector is one of the spending ones
+        tempvar not_spending = (
+            (selector - ACCOUNT_TRANSFER_SELECTOR) *
+            (selector - ACCOUNT_APPROVE_SELECTOR) *
+            (selector - ACCOUNT_INCREASE_ALLOWANCE_SELECTOR)
+        )
+        if not_spending != 0:
+            return (amount=Uint256(0, 0))
+        end
+
+        # (recipient or spender, amount)
+        with_attr error_message("Account: session spending call is malformed"):
+            assert data_len = 3
+            let amount = Uint256(low=calldata[data_offset + 1], high=calldata[data_offset + 2])
+            uint256_check(amount)
+        end
+        return (amount=amount)
+    end
+
+    func _write_session_scopes{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_id: felt, scopes_len: felt, scopes: SessionScope*):
+        if scopes_len == 0:
+            return ()
+        end
+
+        Account_session_scopes.write(session_id, [scopes].to, [scopes].selector, TRUE)
+        return _write_session_scopes(session_id, scopes_len - 1, scopes + SessionScope.SIZE)
+    end
+
+    func _write_session_spending_caps{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(session_id: felt, spending_caps_len: felt, spending_caps: SessionSpendingCap*):
+        if spending_caps_len == 0:
+            return ()
+        end
+
+        with_attr error_message("Account: spending cap is not a valid Uint256"):
+            uint256_check([spending_caps].cap)
+        end
+        Account_session_spending_caps.write(session_id, [spending_caps].token, [spending_caps].cap)
+        return _write_session_spending_caps(
+            session_id, spending_caps_len - 1, spending_caps + SessionSpendingCap.SIZE
+        )
+    end
+
+    func _read_channel_nonce{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(channel: felt) -> (res: felt):
+        if channel == 0:
+            let (res) = Account_current_nonce.read()
+            return (res=res)
+        end
+
+        let (res) = Account_channel_nonces.read(channel)
+        return (res=res)
+    end
+
+    func _write_channel_nonce{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(channel: felt, value: felt):
+        if channel == 0:
+            Account_current_nonce.write(value)
+            return ()
+        end
+
+        Account_channel_nonces.write(channel, value)
+        return ()
+    end
+
 end
@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (account/multisig/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import assert_in_range, assert_le, unsigned_div_rem
+from starkware.cairo.common.signature import verify_ecdsa_signature
+from starkware.starknet.common.syscalls import get_tx_info
+
+from openzeppelin.account.library import Account, AccountCallArray
+from openzeppelin.introspection.erc165.library import ERC165
+from openzeppelin.utils.constants.library import IACCOUNT_ID
+
+#
+# Storage
+#
+
+@storage_var
+func MultisigAccount_signers_len() -> (res: felt):
+end
+
+@storage_var
+func MultisigAccount_signers(index: felt) -> (public_key: felt):
+end
+
+@storage_var
+func MultisigAccount_threshold() -> (res: felt):
+end
+
+#
+# Structs
+#
+
+# Signatures are flat arrays of (signer_index, sig_r, sig_s) tuples
+struct SignerSignature:
+    member signer_index: felt
+    member sig_r: felt
+    member sig_s: felt
+end
+
+namespace MultisigAccount:
+
+    #
+    # Initializer
+    #
+
+    func initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(signers_len: felt, signers: felt*, threshold: felt):
+        MultisigAccount_signers_len.write(signers_len)
+        _write_signers(0, signers_len, signers)
+        _set_threshold(threshold)
+        ERC165.register_interface(IACCOUNT_ID)
+        return ()
+    end
+
+    #
+    # Getters
+    #
+
+    func get_signers{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (signers_len: felt, signers: felt*):
+        alloc_locals
+        let (signers_len) = MultisigAccount_signers_len.read()
+        let (local signers) = alloc()
+        _read_signers(0, signers_len, signers)
+        return (signers_len=signers_len, signers=signers)
+    end
+
+    func get_threshold{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (res: felt):
+        let (res) = MultisigAccount_threshold.read()
+        return (res=res)
+    end
+
+    #
+    # Setters
+    #
+
+    func set_signer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(signer_index: felt, public_key: felt):
+        Account.assert_only_self()
+        let (signers_len) = MultisigAccount_signers_len.read()
+        with_attr error_message("MultisigAccount: signer index out of range"):
+            assert_in_range(signer_index, 0, signers_len)
+        end
+        MultisigAccount_signers.write(signer_index, public_key)
+        return ()
+    end
+
+    func set_threshold{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(threshold: felt):
+        Account.assert_only_self()
+        _set_threshold(threshold)
+        return ()
+    end
+
+    #
+    # Business logic
+    #
+
+    func is_valid_signature{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*
+        }(
+            hash: felt,
+            signature_len: felt,
+            signature: felt*
+        ) -> (is_valid: felt):
+        alloc_locals
+        let (signers_len) = MultisigAccount_signers_len.read()
+        let (threshold) = MultisigAccount_threshold.read()
+
+        # This implementation expects at least `threshold`
+        # (signer_index, sig_r, sig_s) tuples, sorted by signer index.
+        with_attr error_message("MultisigAccount: not enough signatures"):
+            let (signatures_len, rem) = unsigned_div_rem(signature_len, SignerSignature.SIZE)
+            assert rem = 0
+            assert_le(threshold, signatures_len)
+        end
+
+        _verify_signatures(hash, signers_len, 0, signatures_len, cast(signature, SignerSignature*))
+        return (is_valid=TRUE)
+    end
+
+    func execute{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr,
+            ecdsa_ptr: SignatureBuiltin*,
+            bitwise_ptr: BitwiseBuiltin*
+        }(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt
+        ) -> (response_len: felt, response: felt*):
+        alloc_locals
+        let (tx_info) = get_tx_info()
+
+        # validate transaction
+        with_attr error_message("MultisigAccount: invalid signature"):
+            let (is_valid) = is_valid_signature(tx_info.transaction_hash, tx_info.signature_len, tx_info.signature)
+            assert is_valid = TRUE
+        end
+
+        return Account._unsafe_execute(call_array_len, call_array, calldata_len, calldata, nonce)
+    end
+
+    #
+    # Internals
+    #
+
+    func _set_threshold{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(threshold: felt):
+        let (signers_len) = MultisigAccount_signers_len.read()
+        with_attr error_message("MultisigAccount: invalid threshold"):
+            assert_in_range(threshold, 1, signers_len + 1)
+        end
+        MultisigAccount_threshold.write(threshold)
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+func _verify_signatures{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr,
+        ecdsa_ptr: SignatureBuiltin*
+    }(
+        hash: felt,
+        signers_len: felt,
+        min_signer_index: felt,
+        signatures_len: felt,
+        signatures: SignerSignature*
+    ):
+    if signatures_len == 0:
+        return ()
+    end
+
+    # indexes must be strictly increasing, so that no signer counts twice
+    with_attr error_message("MultisigAccount: invalid or duplicate signer index"):
+        assert_in_range([signatures].signer_index, min_signer_index, signers_len)
+    end
+
+    let (public_key) = MultisigAccount_signers.read([signatures].signer_index)
+    verify_ecdsa_signature(
+        message=hash,
+        public_key=public_key,
+        signature_r=[signatures].sig_r,
+        signature_s=[signatures].sig_s)
+
+    return _verify_signatures(
+        hash,
+        signers_len,
+        [signatures].signer_index + 1,
+        signatures_len - 1,
+        signatures + SignerSignature.SIZE
+    )
+end
+
+func _write_signers{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(index: felt, signers_len: felt, signers: felt*):
+    if index == signers_len:
+        return ()
+    end
+
+    MultisigAccount_signers.write(index, signers[index])
+    return _write_signers(index + 1, signers_len, signers)
+end
+
+func _read_signers{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(index: felt, signers_len: felt, signers: felt*):
+    if index == signers_len:
+        return ()
+    end
+
+    let (public_key) = MultisigAccount_signers.read(index)
+    assert signers[index] = public_key
+    return _read_signers(index + 1, signers_len, signers)
+end
@@ -4,8 +4,11 @@
 %lang starknet
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
 
-from openzeppelin.account.library import Account, AccountCallArray
+from openzeppelin.account.library import (
+    Account, AccountCallArray, SessionScope, SessionSpendingCap
+)
 
 from openzeppelin.introspection.erc165.library import ERC165
 
@@ -47,6 +50,78 @@ func get_nonce{
     return (res=res)
 end
 
+@view
+func get_channel_nonce{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(channel: felt) -> (res: felt):
+    let (res) = Account.get_channel_nonce(channel)
+    return (res=res)
+end
+
+@view
+func get_discard_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (res: felt):
+    let (res) = Account.get_discard_responses()
+    return (res=res)
+end
+
+@view
+func get_frame_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (res: felt):
+    let (res) = Account.get_frame_responses()
+    return (res=res)
+end
+
+@view
+func get_session_key{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(session_key: felt) -> (expires_at: felt):
+    let (expires_at) = Account.get_session_key(session_key)
+    return (expires_at=expires_at)
+end
+
+@view
+func get_session_spending{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(session_key: felt, token: felt) -> (spending_cap: Uint256, spent: Uint256):
+    let (spending_cap, spent) = Account.get_session_spending(session_key, token)
+    return (spending_cap=spending_cap, spent=spent)
+end
+
+@view
+func get_relayed_hash{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        call_array_len: felt,
+        call_array: AccountCallArray*,
+        calldata_len: felt,
+        calldata: felt*,
+        nonce: felt
+    ) -> (hash: felt):
+    let (hash) = Account.get_relayed_hash(
+        call_array_len,
+        call_array,
+        calldata_len,
+        calldata,
+        nonce
+    )
+    return (hash=hash)
+end
+
 @view
 func supportsInterface{
         syscall_ptr: felt*,
@@ -71,6 +146,55 @@ func set_public_key{
     return ()
 end
 
+@external
+func set_discard_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(discard: felt):
+    Account.set_discard_responses(discard)
+    return ()
+end
+
+@external
+func set_frame_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(frame: felt):
+    Account.set_frame_responses(frame)
+    return ()
+end
+
+@external
+func add_session_key{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        session_key: felt,
+        expires_at: felt,
+        scopes_len: felt,
+        scopes: SessionScope*,
+        spending_caps_len: felt,
+        spending_caps: SessionSpendingCap*
+    ):
+    Account.add_session_key(
+        session_key, expires_at, scopes_len, scopes, spending_caps_len, spending_caps
+    )
+    return ()
+end
+
+@external
+func revoke_session_key{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(session_key: felt):
+    Account.revoke_session_key(session_key)
+    return ()
+end
+
 #
 # Business logic
 #
@@ -113,3 +237,31 @@ func __execute__{
     )
     return (response_len=response_len, response=response)
 end
+
+@external
+func execute_relayed{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr,
+        ecdsa_ptr: SignatureBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*
+    }(
+        call_array_len: felt,
+        call_array: AccountCallArray*,
+        calldata_len: felt,
+        calldata: felt*,
+        nonce: felt,
+        signature_len: felt,
+        signature: felt*
+    ) -> (response_len: felt, response: felt*):
+    let (response_len, response) = Account.execute_relayed(
+        call_array_len,
+        call_array,
+        calldata_len,
+        calldata,
+        nonce,
+        signature_len,
+        signature
+    )
+    return (response_len=response_len, response=response)
+end
@@ -3,6 +3,7 @@
 
 %lang starknet
 
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin
 from starkware.starknet.common.syscalls import get_caller_address
 
@@ -10,6 +11,12 @@ from starkware.starknet.common.syscalls import get_caller_address
 func L1_address(L2_address: felt) -> (res: felt):
 end
 
+# Reverse index of `L1_address`, pointing to the latest L2 address that registered
+# each L1 address. Registrations are not authenticated by the L1 address owner.
+@storage_var
+func L2_address(L1_address: felt) -> (res: felt):
+end
+
 @external
 func get_L1_address{
         syscall_ptr : felt*,
@@ -20,13 +27,99 @@ func get_L1_address{
     return (res=res)
 end
 
+@view
+func get_L2_address{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(L1_address: felt) -> (res: felt):
+    let (res) = L2_address.read(L1_address)
+    return (res=res)
+end
+
+@view
+func get_L1_addresses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(L2_addresses_len: felt, L2_addresses: felt*) -> (L1_addresses_len: felt, L1_addresses: felt*):
+    alloc_locals
+    let (local L1_addresses) = alloc()
+    _read_L1_addresses(L2_addresses_len, L2_addresses, L1_addresses)
+    return (L1_addresses_len=L2_addresses_len, L1_addresses=L1_addresses)
+end
+
+@view
+func get_L2_addresses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(L1_addresses_len: felt, L1_addresses: felt*) -> (L2_addresses_len: felt, L2_addresses: felt*):
+    alloc_locals
+    let (local L2_addresses) = alloc()
+    _read_L2_addresses(L1_addresses_len, L1_addresses, L2_addresses)
+    return (L2_addresses_len=L1_addresses_len, L2_addresses=L2_addresses)
+end
+
 @external
 func set_L1_address{
         syscall_ptr : felt*,
         pedersen_ptr : HashBuiltin*,
         range_check_ptr
     }(new_L1_address: felt):
+    alloc_locals
     let (caller) = get_caller_address()
+    let (old_L1_address) = L1_address.read(caller)
     L1_address.write(caller, new_L1_address)
+
+    # only clear the previous reverse entry if a later registration did not take it over
+    let (holder) = L2_address.read(old_L1_address)
+    if holder == caller:
+        L2_address.write(old_L1_address, 0)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
+
+    if new_L1_address != 0:
+        L2_address.write(new_L1_address, caller)
+        return ()
+    end
     return ()
 end
+
+#
+# Private
+#
+
+func _read_L1_addresses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(L2_addresses_len: felt, L2_addresses: felt*, L1_addresses: felt*):
+    if L2_addresses_len == 0:
+        return ()
+    end
+
+    let (res) = L1_address.read([L2_addresses])
+    assert [L1_addresses] = res
+    return _read_L1_addresses(L2_addresses_len - 1, L2_addresses + 1, L1_addresses + 1)
+end
+
+func _read_L2_addresses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(L1_addresses_len: felt, L1_addresses: felt*, L2_addresses: felt*):
+    if L1_addresses_len == 0:
+        return ()
+    end
+
+    let (res) = L2_address.read([L1_addresses])
+    assert [L2_addresses] = res
+    return _read_L2_addresses(L1_addresses_len - 1, L1_addresses + 1, L2_addresses + 1)
+end
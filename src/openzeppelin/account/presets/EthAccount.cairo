@@ -45,6 +45,58 @@ func get_nonce{
     return (res=res)
 end
 
+@view
+func get_channel_nonce{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(channel: felt) -> (res: felt):
+    let (res) = Account.get_channel_nonce(channel)
+    return (res=res)
+end
+
+@view
+func get_discard_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (res: felt):
+    let (res) = Account.get_discard_responses()
+    return (res=res)
+end
+
+@view
+func get_frame_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (res: felt):
+    let (res) = Account.get_frame_responses()
+    return (res=res)
+end
+
+@view
+func get_relayed_hash{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        call_array_len: felt,
+        call_array: AccountCallArray*,
+        calldata_len: felt,
+        calldata: felt*,
+        nonce: felt
+    ) -> (hash: felt):
+    let (hash) = Account.get_relayed_hash(
+        call_array_len,
+        call_array,
+        calldata_len,
+        calldata,
+        nonce
+    )
+    return (hash=hash)
+end
+
 @view
 func supportsInterface{
         syscall_ptr: felt*,
@@ -69,6 +121,26 @@ func set_eth_address{
     return ()
 end
 
+@external
+func set_discard_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(discard: felt):
+    Account.set_discard_responses(discard)
+    return ()
+end
+
+@external
+func set_frame_responses{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(frame: felt):
+    Account.set_frame_responses(frame)
+    return ()
+end
+
 #
 # Business logic
 #
@@ -112,3 +184,31 @@ func __execute__{
     )
     return (response_len=response_len, response=response)
 end
+
+@external
+func execute_relayed{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr,
+        ecdsa_ptr: SignatureBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*
+    }(
+        call_array_len: felt,
+        call_array: AccountCallArray*,
+        calldata_len: felt,
+        calldata: felt*,
+        nonce: felt,
+        signature_len: felt,
+        signature: felt*
+    ) -> (response_len: felt, response: felt*):
+    let (response_len, response) = Account.eth_execute_relayed(
+        call_array_len,
+        call_array,
+        calldata_len,
+        calldata,
+        nonce,
+        signature_len,
+        signature
+    )
+    return (response_len=response_len, response=response)
+end
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (account/relayer/IRelayableAccount.cairo)
+
+%lang starknet
+
+from openzeppelin.account.library import AccountCallArray
+
+@contract_interface
+namespace IRelayableAccount:
+    func get_relayed_hash(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt
+        ) -> (hash: felt):
+    end
+
+    func execute_relayed(
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            nonce: felt,
+            signature_len: felt,
+            signature: felt*
+        ) -> (response_len: felt, response: felt*):
+    end
+end
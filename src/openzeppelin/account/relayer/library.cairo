@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (account/relayer/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.math import assert_le, assert_nn
+
+from openzeppelin.account.library import AccountCallArray
+from openzeppelin.account.relayer.IRelayableAccount import IRelayableAccount
+
+#
+# Structs
+#
+
+# The calls signed by one account, as slices of the arrays shared by the batch
+struct RelayedBundle:
+    member account: felt
+    member call_array_offset: felt
+    member call_array_len: felt
+    member calldata_offset: felt
+    member calldata_len: felt
+    member nonce: felt
+    member signature_offset: felt
+    member signature_len: felt
+end
+
+namespace Relayer:
+
+    #
+    # Business logic
+    #
+
+    # Forwards every bundle to its account, which checks the signature and
+    # nonce before executing the calls. A failing bundle reverts the batch.
+    func relay{
+            syscall_ptr : felt*,
+            range_check_ptr
+        }(
+            bundles_len: felt,
+            bundles: RelayedBundle*,
+            call_array_len: felt,
+            call_array: AccountCallArray*,
+            calldata_len: felt,
+            calldata: felt*,
+            signatures_len: felt,
+            signatures: felt*
+        ):
+        if bundles_len == 0:
+            return ()
+        end
+
+        with_attr error_message("Relayer: bundle out of bounds"):
+            assert_nn([bundles].call_array_offset)
+            assert_nn([bundles].calldata_offset)
+            assert_nn([bundles].signature_offset)
+            assert_le([bundles].call_array_offset + [bundles].call_array_len, call_array_len)
+            assert_le([bundles].calldata_offset + [bundles].calldata_len, calldata_len)
+            assert_le([bundles].signature_offset + [bundles].signature_len, signatures_len)
+        end
+
+        IRelayableAccount.execute_relayed(
+            contract_address=[bundles].account,
+            call_array_len=[bundles].call_array_len,
+            call_array=call_array + [bundles].call_array_offset * AccountCallArray.SIZE,
+            calldata_len=[bundles].calldata_len,
+            calldata=calldata + [bundles].calldata_offset,
+            nonce=[bundles].nonce,
+            signature_len=[bundles].signature_len,
+            signature=signatures + [bundles].signature_offset
+        )
+
+        relay(
+            bundles_len - 1,
+            bundles + RelayedBundle.SIZE,
+            call_array_len,
+            call_array,
+            calldata_len,
+            calldata,
+            signatures_len,
+            signatures
+        )
+        return ()
+    end
+
+end
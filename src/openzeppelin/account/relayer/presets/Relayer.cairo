@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (account/relayer/presets/Relayer.cairo)
+
+%lang starknet
+
+from openzeppelin.account.library import AccountCallArray
+from openzeppelin.account.relayer.library import Relayer, RelayedBundle
+
+#
+# Externals
+#
+
+@external
+func relay{
+        syscall_ptr : felt*,
+        range_check_ptr
+    }(
+        bundles_len: felt,
+        bundles: RelayedBundle*,
+        call_array_len: felt,
+        call_array: AccountCallArray*,
+        calldata_len: felt,
+        calldata: felt*,
+        signatures_len: felt,
+        signatures: felt*
+    ):
+    Relayer.relay(
+        bundles_len,
+        bundles,
+        call_array_len,
+        call_array,
+        calldata_len,
+        calldata,
+        signatures_len,
+        signatures
+    )
+    return ()
+end
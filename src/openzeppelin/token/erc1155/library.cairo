@@ -0,0 +1,568 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc1155/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.math import assert_not_zero, assert_not_equal
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.uint256 import Uint256, uint256_check
+
+from openzeppelin.introspection.erc165.library import ERC165
+from openzeppelin.introspection.erc165.IERC165 import IERC165
+from openzeppelin.security.safemath.library import SafeUint256
+from openzeppelin.token.erc1155.IERC1155Receiver import IERC1155Receiver
+from openzeppelin.utils.constants.library import (
+    IERC1155_ID,
+    IERC1155_METADATA_URI_ID,
+    IERC1155_RECEIVER_ID,
+    IACCOUNT_ID,
+    ON_ERC1155_RECEIVED_SELECTOR,
+    ON_ERC1155_BATCH_RECEIVED_SELECTOR
+)
+
+#
+# Events
+#
+
+@event
+func TransferSingle(
+        operator: felt,
+        from_: felt,
+        to: felt,
+        id: Uint256,
+        value: Uint256
+    ):
+end
+
+@event
+func TransferBatch(
+        operator: felt,
+        from_: felt,
+        to: felt,
+        ids_len: felt,
+        ids: Uint256*,
+        values_len: felt,
+        values: Uint256*
+    ):
+end
+
+@event
+func ApprovalForAll(account: felt, operator: felt, approved: felt):
+end
+
+#
+# Storage
+#
+
+@storage_var
+func ERC1155_balances(id: Uint256, account: felt) -> (balance: Uint256):
+end
+
+@storage_var
+func ERC1155_operator_approvals(account: felt, operator: felt) -> (approved: felt):
+end
+
+# Shared by every token id, clients replace `{id}` with the token id
+@storage_var
+func ERC1155_uri() -> (uri: felt):
+end
+
+namespace ERC1155:
+
+    #
+    # Initializer
+    #
+
+    func initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(uri: felt):
+        _set_uri(uri)
+        ERC165.register_interface(IERC1155_ID)
+        ERC165.register_interface(IERC1155_METADATA_URI_ID)
+        return ()
+    end
+
+    #
+    # Getters
+    #
+
+    func uri{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(id: Uint256) -> (uri: felt):
+        let (uri) = ERC1155_uri.read()
+        return (uri)
+    end
+
+    func balance_of{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(account: felt, id: Uint256) -> (balance: Uint256):
+        with_attr error_message("ERC1155: id is not a valid Uint256"):
+            uint256_check(id)
+        end
+        with_attr error_message("ERC1155: balance query for the zero address"):
+            assert_not_zero(account)
+        end
+        let (balance: Uint256) = ERC1155_balances.read(id, account)
+        return (balance)
+    end
+
+    # Returns the balance of `accounts[i]` in token `ids[i]`, for each `i`.
+    func balance_of_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            accounts_len: felt,
+            accounts: felt*,
+            ids_len: felt,
+            ids: Uint256*
+        ) -> (balances_len: felt, balances: Uint256*):
+        alloc_locals
+        with_attr error_message("ERC1155: accounts and ids length mismatch"):
+            assert accounts_len = ids_len
+        end
+
+        let (local balances: Uint256*) = alloc()
+        _read_balances(accounts_len, accounts, ids, balances)
+        return (accounts_len, balances)
+    end
+
+    func is_approved_for_all{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(account: felt, operator: felt) -> (is_approved: felt):
+        let (is_approved) = ERC1155_operator_approvals.read(account, operator)
+        return (is_approved)
+    end
+
+    #
+    # Externals
+    #
+
+    func set_approval_for_all{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(operator: felt, approved: felt):
+        let (caller) = get_caller_address()
+        with_attr error_message("ERC1155: either the caller or operator is the zero address"):
+            assert_not_zero(caller * operator)
+        end
+        _set_approval_for_all(caller, operator, approved)
+        return ()
+    end
+
+    func safe_transfer_from{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            id: Uint256,
+            amount: Uint256,
+            data_len: felt,
+            data: felt*
+        ):
+        assert_owner_or_approved(from_)
+        _safe_transfer_from(from_, to, id, amount, data_len, data)
+        return ()
+    end
+
+    # Approval is checked once for the whole batch, and the recipient
+    # is notified once with `onERC1155BatchReceived`.
+    func safe_batch_transfer_from{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            ids_len: felt,
+            ids: Uint256*,
+            amounts_len: felt,
+            amounts: Uint256*,
+            data_len: felt,
+            data: felt*
+        ):
+        assert_owner_or_approved(from_)
+        _safe_batch_transfer_from(from_, to, ids_len, ids, amounts_len, amounts, data_len, data)
+        return ()
+    end
+
+    #
+    # Internals
+    #
+
+    func assert_owner_or_approved{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(owner: felt):
+        let (caller) = get_caller_address()
+        with_attr error_message("ERC1155: caller is the zero address"):
+            assert_not_zero(caller)
+        end
+        if caller == owner:
+            return ()
+        end
+
+        let (is_approved) = ERC1155_operator_approvals.read(owner, caller)
+        with_attr error_message("ERC1155: caller is not owner nor approved"):
+            assert is_approved = TRUE
+        end
+        return ()
+    end
+
+    func _safe_transfer_from{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            id: Uint256,
+            amount: Uint256,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        with_attr error_message("ERC1155: cannot transfer from the zero address"):
+            assert_not_zero(from_)
+        end
+        with_attr error_message("ERC1155: cannot transfer to the zero address"):
+            assert_not_zero(to)
+        end
+
+        _move(from_, to, id, amount)
+
+        let (operator) = get_caller_address()
+        TransferSingle.emit(operator, from_, to, id, amount)
+        _do_safe_transfer_acceptance_check(operator, from_, to, id, amount, data_len, data)
+        return ()
+    end
+
+    func _safe_batch_transfer_from{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            ids_len: felt,
+            ids: Uint256*,
+            amounts_len: felt,
+            amounts: Uint256*,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        with_attr error_message("ERC1155: ids and amounts length mismatch"):
+            assert ids_len = amounts_len
+        end
+        with_attr error_message("ERC1155: cannot transfer from the zero address"):
+            assert_not_zero(from_)
+        end
+        with_attr error_message("ERC1155: cannot transfer to the zero address"):
+            assert_not_zero(to)
+        end
+
+        _move_batch(from_, to, ids_len, ids, amounts)
+
+        let (operator) = get_caller_address()
+        TransferBatch.emit(operator, from_, to, ids_len, ids, amounts_len, amounts)
+        _do_safe_batch_transfer_acceptance_check(
+            operator, from_, to, ids_len, ids, amounts_len, amounts, data_len, data
+        )
+        return ()
+    end
+
+    func _mint{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            to: felt,
+            id: Uint256,
+            amount: Uint256,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        with_attr error_message("ERC1155: cannot mint to the zero address"):
+            assert_not_zero(to)
+        end
+
+        _move(0, to, id, amount)
+
+        let (operator) = get_caller_address()
+        TransferSingle.emit(operator, 0, to, id, amount)
+        _do_safe_transfer_acceptance_check(operator, 0, to, id, amount, data_len, data)
+        return ()
+    end
+
+    func _mint_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            to: felt,
+            ids_len: felt,
+            ids: Uint256*,
+            amounts_len: felt,
+            amounts: Uint256*,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        with_attr error_message("ERC1155: ids and amounts length mismatch"):
+            assert ids_len = amounts_len
+        end
+        with_attr error_message("ERC1155: cannot mint to the zero address"):
+            assert_not_zero(to)
+        end
+
+        _move_batch(0, to, ids_len, ids, amounts)
+
+        let (operator) = get_caller_address()
+        TransferBatch.emit(operator, 0, to, ids_len, ids, amounts_len, amounts)
+        _do_safe_batch_transfer_acceptance_check(
+            operator, 0, to, ids_len, ids, amounts_len, amounts, data_len, data
+        )
+        return ()
+    end
+
+    func _burn{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(from_: felt, id: Uint256, amount: Uint256):
+        alloc_locals
+        with_attr error_message("ERC1155: cannot burn from the zero address"):
+            assert_not_zero(from_)
+        end
+
+        _move(from_, 0, id, amount)
+
+        let (operator) = get_caller_address()
+        TransferSingle.emit(operator, from_, 0, id, amount)
+        return ()
+    end
+
+    func _burn_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            from_: felt,
+            ids_len: felt,
+            ids: Uint256*,
+            amounts_len: felt,
+            amounts: Uint256*
+        ):
+        alloc_locals
+        with_attr error_message("ERC1155: ids and amounts length mismatch"):
+            assert ids_len = amounts_len
+        end
+        with_attr error_message("ERC1155: cannot burn from the zero address"):
+            assert_not_zero(from_)
+        end
+
+        _move_batch(from_, 0, ids_len, ids, amounts)
+
+        let (operator) = get_caller_address()
+        TransferBatch.emit(operator, from_, 0, ids_len, ids, amounts_len, amounts)
+        return ()
+    end
+
+    func _set_approval_for_all{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(owner: felt, operator: felt, approved: felt):
+        with_attr error_message("ERC1155: setting approval status for self"):
+            assert_not_equal(owner, operator)
+        end
+
+        # Make sure `approved` is a boolean (0 or 1)
+        with_attr error_message("ERC1155: approved is not a Cairo boolean"):
+            assert approved * (1 - approved) = 0
+        end
+
+        ERC1155_operator_approvals.write(owner, operator, approved)
+        ApprovalForAll.emit(owner, operator, approved)
+        return ()
+    end
+
+    func _set_uri{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(uri: felt):
+        ERC1155_uri.write(uri)
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+# Moves `amount` of token `id` from `from_` to `to`. The zero address
+# stands for minting when used as `from_` and burning when used as `to`.
+func _move{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(from_: felt, to: felt, id: Uint256, amount: Uint256):
+    alloc_locals
+    with_attr error_message("ERC1155: id is not a valid Uint256"):
+        uint256_check(id)
+    end
+    with_attr error_message("ERC1155: amount is not a valid Uint256"):
+        uint256_check(amount)
+    end
+
+    if from_ != 0:
+        let (from_balance: Uint256) = ERC1155_balances.read(id, from_)
+        with_attr error_message("ERC1155: insufficient balance"):
+            let (new_balance: Uint256) = SafeUint256.sub_le(from_balance, amount)
+        end
+        ERC1155_balances.write(id, from_, new_balance)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
+
+    if to != 0:
+        let (to_balance: Uint256) = ERC1155_balances.read(id, to)
+        with_attr error_message("ERC1155: balance overflow"):
+            let (new_balance: Uint256) = SafeUint256.add(to_balance, amount)
+        end
+        ERC1155_balances.write(id, to, new_balance)
+        return ()
+    end
+    return ()
+end
+
+func _move_batch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(from_: felt, to: felt, ids_len: felt, ids: Uint256*, amounts: Uint256*):
+    if ids_len == 0:
+        return ()
+    end
+
+    _move(from_, to, [ids], [amounts])
+    return _move_batch(from_, to, ids_len - 1, ids + Uint256.SIZE, amounts + Uint256.SIZE)
+end
+
+func _read_balances{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*, ids: Uint256*, balances: Uint256*):
+    if accounts_len == 0:
+        return ()
+    end
+
+    let (balance: Uint256) = ERC1155.balance_of([accounts], [ids])
+    assert [balances] = balance
+    return _read_balances(accounts_len - 1, accounts + 1, ids + Uint256.SIZE, balances + Uint256.SIZE)
+end
+
+# Returns whether `to` implements IERC1155Receiver or, failing that, is an
+# account. Accounts are only probed when `to` is not a receiver.
+func _probe_receiver{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(to: felt) -> (is_receiver: felt, is_account: felt):
+    let (is_receiver) = IERC165.supportsInterface(to, IERC1155_RECEIVER_ID)
+    if is_receiver == TRUE:
+        return (TRUE, FALSE)
+    end
+
+    let (is_account) = IERC165.supportsInterface(to, IACCOUNT_ID)
+    return (FALSE, is_account)
+end
+
+func _do_safe_transfer_acceptance_check{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        operator: felt,
+        from_: felt,
+        to: felt,
+        id: Uint256,
+        amount: Uint256,
+        data_len: felt,
+        data: felt*
+    ):
+    alloc_locals
+    let (is_receiver, is_account) = _probe_receiver(to)
+    if is_receiver == TRUE:
+        let (selector) = IERC1155Receiver.onERC1155Received(
+            to, operator, from_, id, amount, data_len, data
+        )
+        with_attr error_message("ERC1155: ERC1155Receiver rejected tokens"):
+            assert selector = ON_ERC1155_RECEIVED_SELECTOR
+        end
+        return ()
+    end
+
+    with_attr error_message("ERC1155: transfer to non ERC1155Receiver implementer"):
+        assert is_account = TRUE
+    end
+    return ()
+end
+
+func _do_safe_batch_transfer_acceptance_check{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        operator: felt,
+        from_: felt,
+        to: felt,
+        ids_len: felt,
+        ids: Uint256*,
+        amounts_len: felt,
+        amounts: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    alloc_locals
+    let (is_receiver, is_account) = _probe_receiver(to)
+    if is_receiver == TRUE:
+        let (selector) = IERC1155Receiver.onERC1155BatchReceived(
+            to, operator, from_, ids_len, ids, amounts_len, amounts, data_len, data
+        )
+        with_attr error_message("ERC1155: ERC1155Receiver rejected tokens"):
+            assert selector = ON_ERC1155_BATCH_RECEIVED_SELECTOR
+        end
+        return ()
+    end
+
+    with_attr error_message("ERC1155: transfer to non ERC1155Receiver implementer"):
+        assert is_account = TRUE
+    end
+    return ()
+end
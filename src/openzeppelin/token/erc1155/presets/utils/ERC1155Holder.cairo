@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc1155/presets/utils/ERC1155Holder.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.utils.constants.library import (
+    IERC1155_RECEIVER_ID,
+    ON_ERC1155_RECEIVED_SELECTOR,
+    ON_ERC1155_BATCH_RECEIVED_SELECTOR
+)
+
+from openzeppelin.introspection.erc165.library import ERC165
+
+@view
+func onERC1155Received(
+        operator: felt,
+        from_: felt,
+        id: Uint256,
+        value: Uint256,
+        data_len: felt,
+        data: felt*
+    ) -> (selector: felt):
+    return (ON_ERC1155_RECEIVED_SELECTOR)
+end
+
+@view
+func onERC1155BatchReceived(
+        operator: felt,
+        from_: felt,
+        ids_len: felt,
+        ids: Uint256*,
+        values_len: felt,
+        values: Uint256*,
+        data_len: felt,
+        data: felt*
+    ) -> (selector: felt):
+    return (ON_ERC1155_BATCH_RECEIVED_SELECTOR)
+end
+
+@view
+func supportsInterface{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(interfaceId: felt) -> (success: felt):
+    let (success) = ERC165.supports_interface(interfaceId)
+    return (success)
+end
+
+@constructor
+func constructor{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }():
+    ERC165.register_interface(IERC1155_RECEIVER_ID)
+    return ()
+end
@@ -250,6 +250,29 @@ namespace ERC20:
         return ()
     end
 
+    func _mint_batch{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            recipients_len: felt,
+            recipients: felt*,
+            amounts_len: felt,
+            amounts: Uint256*
+        ):
+        alloc_locals
+        with_attr error_message("ERC20: recipients and amounts length mismatch"):
+            assert recipients_len = amounts_len
+        end
+
+        # the supply is read and written once for the whole batch, the
+        # per-recipient overflow check is carried by the running sum
+        let (supply: Uint256) = ERC20_total_supply.read()
+        let (new_supply: Uint256) = _mint_batch_loop(recipients_len, recipients, amounts, supply)
+        ERC20_total_supply.write(new_supply)
+        return ()
+    end
+
     func _burn{
             syscall_ptr : felt*,
             pedersen_ptr : HashBuiltin*,
@@ -358,3 +381,46 @@ namespace ERC20:
     end
 
 end
+
+#
+# Private
+#
+
+func _mint_batch_loop{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        amounts: Uint256*,
+        supply: Uint256
+    ) -> (new_supply: Uint256):
+    alloc_locals
+    if recipients_len == 0:
+        return (supply)
+    end
+
+    let recipient = [recipients]
+    let amount: Uint256 = [amounts]
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        uint256_check(amount)
+    end
+
+    with_attr error_message("ERC20: cannot mint to the zero address"):
+        assert_not_zero(recipient)
+    end
+
+    with_attr error_message("ERC20: mint overflow"):
+        let (new_supply: Uint256) = SafeUint256.add(supply, amount)
+    end
+
+    let (balance: Uint256) = ERC20_balances.read(account=recipient)
+    # overflow is not possible because sum is guaranteed to be less than total supply
+    # which we check for overflow above
+    let (new_balance: Uint256) = SafeUint256.add(balance, amount)
+    ERC20_balances.write(recipient, new_balance)
+
+    Transfer.emit(0, recipient, amount)
+    return _mint_batch_loop(recipients_len - 1, recipients + 1, amounts + Uint256.SIZE, new_supply)
+end
@@ -172,6 +172,22 @@ func mint{
     return ()
 end
 
+@external
+func mintBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        amounts_len: felt,
+        amounts: Uint256*
+    ):
+    Ownable.assert_only_owner()
+    ERC20._mint_batch(recipients_len, recipients, amounts_len, amounts)
+    return ()
+end
+
 @external
 func transferOwnership{
         syscall_ptr: felt*,
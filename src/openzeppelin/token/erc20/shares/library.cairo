@@ -0,0 +1,314 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc20/shares/library.cairo)
+
+%lang starknet
+
+from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math import assert_not_zero
+from starkware.cairo.common.uint256 import Uint256, uint256_check, uint256_eq
+from starkware.cairo.common.bool import TRUE, FALSE
+
+from openzeppelin.security.safemath.library import SafeUint256
+from openzeppelin.token.erc20.library import (
+    ERC20, ERC20_balances, ERC20_total_supply, Transfer
+)
+
+#
+# Constants
+#
+
+# The index is a fixed point number with 18 decimals,
+# an index of INDEX_ONE means one share is worth one token
+const INDEX_ONE = 1000000000000000000
+
+#
+# Events
+#
+
+@event
+func IndexUpdated(previousIndex: Uint256, newIndex: Uint256):
+end
+
+#
+# Storage
+#
+
+@storage_var
+func ERC20Shares_index() -> (index: Uint256):
+end
+
+# Note that `ERC20_balances` and `ERC20_total_supply` hold shares in this
+# extension, token amounts are derived from them using the index.
+namespace ERC20Shares:
+
+    #
+    # Initializer
+    #
+
+    func initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            name: felt,
+            symbol: felt,
+            decimals: felt
+        ):
+        ERC20.initializer(name, symbol, decimals)
+        ERC20Shares_index.write(Uint256(INDEX_ONE, 0))
+        return ()
+    end
+
+    #
+    # Getters
+    #
+
+    func index{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (index: Uint256):
+        let (index: Uint256) = ERC20Shares_index.read()
+        return (index)
+    end
+
+    func total_shares{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (total_shares: Uint256):
+        let (total_shares: Uint256) = ERC20_total_supply.read()
+        return (total_shares)
+    end
+
+    func shares_of{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(account: felt) -> (shares: Uint256):
+        let (shares: Uint256) = ERC20_balances.read(account)
+        return (shares)
+    end
+
+    func total_supply{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }() -> (total_supply: Uint256):
+        alloc_locals
+        let (total_shares: Uint256) = ERC20_total_supply.read()
+        let (total_supply: Uint256) = shares_to_amount(total_shares)
+        return (total_supply)
+    end
+
+    func balance_of{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(account: felt) -> (balance: Uint256):
+        alloc_locals
+        let (shares: Uint256) = ERC20_balances.read(account)
+        let (balance: Uint256) = shares_to_amount(shares)
+        return (balance)
+    end
+
+    # Rounds down, so that converting back and forth never creates tokens.
+    func shares_to_amount{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(shares: Uint256) -> (amount: Uint256):
+        alloc_locals
+        let (index: Uint256) = ERC20Shares_index.read()
+        let (product: Uint256) = SafeUint256.mul(shares, index)
+        let (amount: Uint256, _) = SafeUint256.div_rem(product, Uint256(INDEX_ONE, 0))
+        return (amount)
+    end
+
+    # Rounds down, so that converting back and forth never creates tokens.
+    func amount_to_shares{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(amount: Uint256) -> (shares: Uint256):
+        alloc_locals
+        let (index: Uint256) = ERC20Shares_index.read()
+        let (product: Uint256) = SafeUint256.mul(amount, Uint256(INDEX_ONE, 0))
+        let (shares: Uint256, _) = SafeUint256.div_rem(product, index)
+        return (shares)
+    end
+
+    # Rounds up, so that debiting an amount never takes fewer shares than it is worth.
+    func amount_to_shares_up{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(amount: Uint256) -> (shares: Uint256):
+        alloc_locals
+        let (index: Uint256) = ERC20Shares_index.read()
+        let (product: Uint256) = SafeUint256.mul(amount, Uint256(INDEX_ONE, 0))
+        let (shares: Uint256, rem: Uint256) = SafeUint256.div_rem(product, index)
+        let (is_exact) = uint256_eq(rem, Uint256(0, 0))
+        if is_exact == TRUE:
+            return (shares)
+        end
+
+        let (shares_up: Uint256) = SafeUint256.add(shares, Uint256(1, 0))
+        return (shares_up)
+    end
+
+    #
+    # Externals
+    #
+
+    func transfer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(recipient: felt, amount: Uint256):
+        let (sender) = get_caller_address()
+        _transfer(sender, recipient, amount)
+        return ()
+    end
+
+    func transfer_from{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(
+            sender: felt,
+            recipient: felt,
+            amount: Uint256
+        ) -> ():
+        let (caller) = get_caller_address()
+        # allowances are kept in token amounts
+        ERC20._spend_allowance(sender, caller, amount)
+        _transfer(sender, recipient, amount)
+        return ()
+    end
+
+    #
+    # Internal
+    #
+
+    # Updates the value of every share with a single storage write.
+    func _set_index{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(new_index: Uint256):
+        alloc_locals
+        with_attr error_message("ERC20Shares: index is not a valid Uint256"):
+            uint256_check(new_index)
+        end
+
+        let (is_zero) = uint256_eq(new_index, Uint256(0, 0))
+        with_attr error_message("ERC20Shares: index cannot be zero"):
+            assert is_zero = FALSE
+        end
+
+        let (previous_index: Uint256) = ERC20Shares_index.read()
+        ERC20Shares_index.write(new_index)
+        IndexUpdated.emit(previous_index, new_index)
+        return ()
+    end
+
+    func _mint{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(recipient: felt, amount: Uint256):
+        alloc_locals
+        with_attr error_message("ERC20: amount is not a valid Uint256"):
+            uint256_check(amount)
+        end
+
+        with_attr error_message("ERC20: cannot mint to the zero address"):
+            assert_not_zero(recipient)
+        end
+
+        let (shares: Uint256) = amount_to_shares(amount)
+
+        let (total_shares: Uint256) = ERC20_total_supply.read()
+        with_attr error_message("ERC20: mint overflow"):
+            let (new_total_shares: Uint256) = SafeUint256.add(total_shares, shares)
+        end
+        ERC20_total_supply.write(new_total_shares)
+
+        let (balance: Uint256) = ERC20_balances.read(account=recipient)
+        # overflow is not possible because sum is guaranteed to be less than total shares
+        # which we check for overflow above
+        let (new_balance: Uint256) = SafeUint256.add(balance, shares)
+        ERC20_balances.write(recipient, new_balance)
+
+        Transfer.emit(0, recipient, amount)
+        return ()
+    end
+
+    func _burn{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(account: felt, amount: Uint256):
+        alloc_locals
+        with_attr error_message("ERC20: amount is not a valid Uint256"):
+            uint256_check(amount)
+        end
+
+        with_attr error_message("ERC20: cannot burn from the zero address"):
+            assert_not_zero(account)
+        end
+
+        let (shares: Uint256) = amount_to_shares_up(amount)
+
+        let (balance: Uint256) = ERC20_balances.read(account)
+        with_attr error_message("ERC20: burn amount exceeds balance"):
+            let (new_balance: Uint256) = SafeUint256.sub_le(balance, shares)
+        end
+        ERC20_balances.write(account, new_balance)
+
+        let (total_shares: Uint256) = ERC20_total_supply.read()
+        let (new_total_shares: Uint256) = SafeUint256.sub_le(total_shares, shares)
+        ERC20_total_supply.write(new_total_shares)
+
+        Transfer.emit(account, 0, amount)
+        return ()
+    end
+
+    func _transfer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }(sender: felt, recipient: felt, amount: Uint256):
+        alloc_locals
+        with_attr error_message("ERC20: amount is not a valid Uint256"):
+            uint256_check(amount)
+        end
+
+        with_attr error_message("ERC20: cannot transfer from the zero address"):
+            assert_not_zero(sender)
+        end
+
+        with_attr error_message("ERC20: cannot transfer to the zero address"):
+            assert_not_zero(recipient)
+        end
+
+        let (shares: Uint256) = amount_to_shares_up(amount)
+
+        let (sender_balance: Uint256) = ERC20_balances.read(account=sender)
+        with_attr error_message("ERC20: transfer amount exceeds balance"):
+            let (new_sender_balance: Uint256) = SafeUint256.sub_le(sender_balance, shares)
+        end
+        ERC20_balances.write(sender, new_sender_balance)
+
+        # add to recipient
+        let (recipient_balance: Uint256) = ERC20_balances.read(account=recipient)
+        # overflow is not possible because sum is guaranteed by mint to be less than total shares
+        let (new_recipient_balance: Uint256) = SafeUint256.add(recipient_balance, shares)
+        ERC20_balances.write(recipient, new_recipient_balance)
+        Transfer.emit(sender, recipient, amount)
+        return ()
+    end
+
+end
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc721/base_uri/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.uint256 import (
+    Uint256, uint256_check, uint256_unsigned_div_rem
+)
+
+from openzeppelin.token.erc721.library import ERC721, ERC721_token_uri
+
+#
+# Constants
+#
+
+# ASCII code of the '0' character
+const ASCII_ZERO = 48
+# Number of characters that fit in a single felt
+const SHORT_STRING_MAX_LEN = 31
+
+#
+# Storage
+#
+
+@storage_var
+func ERC721BaseURI_base_uri_len() -> (base_uri_len: felt):
+end
+
+@storage_var
+func ERC721BaseURI_base_uri(index: felt) -> (value: felt):
+end
+
+# URIs are returned as arrays of short strings (up to 31 characters each),
+# which read as a single string once decoded and concatenated.
+namespace ERC721BaseURI:
+
+    #
+    # Getters
+    #
+
+    func base_uri{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }() -> (base_uri_len: felt, base_uri: felt*):
+        alloc_locals
+        let (local base_uri: felt*) = alloc()
+        let (base_uri_len) = ERC721BaseURI_base_uri_len.read()
+        _read_base_uri(0, base_uri_len, base_uri)
+        return (base_uri_len, base_uri)
+    end
+
+    # Returns the per-token URI if one was set, otherwise the base URI followed
+    # by the decimal token id. Returns an empty array when no base URI is set.
+    func token_uri{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256) -> (token_uri_len: felt, token_uri: felt*):
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+
+        let (exists) = ERC721._exists(token_id)
+        with_attr error_message("ERC721_Metadata: URI query for nonexistent token"):
+            assert exists = TRUE
+        end
+
+        let (token_uri_override) = ERC721_token_uri.read(token_id)
+        if token_uri_override != 0:
+            let (token_uri: felt*) = alloc()
+            assert [token_uri] = token_uri_override
+            return (1, token_uri)
+        end
+
+        let (uri_len, uri: felt*) = base_uri()
+        if uri_len == 0:
+            return (0, uri)
+        end
+
+        # the id is written right after the base URI in the same array
+        let (token_id_len) = _uint256_to_short_strings(token_id, uri + uri_len)
+        return (uri_len + token_id_len, uri)
+    end
+
+    #
+    # Internals
+    #
+
+    func _set_base_uri{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(base_uri_len: felt, base_uri: felt*):
+        ERC721BaseURI_base_uri_len.write(base_uri_len)
+        _write_base_uri(0, base_uri_len, base_uri)
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+func _read_base_uri{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: felt, base_uri_len: felt, base_uri: felt*):
+    if index == base_uri_len:
+        return ()
+    end
+
+    let (value) = ERC721BaseURI_base_uri.read(index)
+    assert [base_uri] = value
+    return _read_base_uri(index + 1, base_uri_len, base_uri + 1)
+end
+
+func _write_base_uri{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: felt, base_uri_len: felt, base_uri: felt*):
+    if index == base_uri_len:
+        return ()
+    end
+
+    ERC721BaseURI_base_uri.write(index, [base_uri])
+    return _write_base_uri(index + 1, base_uri_len, base_uri + 1)
+end
+
+# Writes the decimal representation of `value` to `res` as short strings,
+# most significant digits first. Returns the number of felts written.
+func _uint256_to_short_strings{range_check_ptr}(
+        value: Uint256,
+        res: felt*
+    ) -> (res_len: felt):
+    alloc_locals
+    let (local digits: felt*) = alloc()
+    let (digits_len) = _uint256_to_digits(value, digits)
+
+    # only the leading short string may hold less than 31 digits
+    let (_, leading_len) = unsigned_div_rem(digits_len, SHORT_STRING_MAX_LEN)
+    if leading_len == 0:
+        let (res_len) = _pack_digits(digits_len, digits, SHORT_STRING_MAX_LEN, 0, res)
+        return (res_len)
+    end
+
+    let (res_len) = _pack_digits(digits_len, digits, leading_len, 0, res)
+    return (res_len)
+end
+
+# Writes the ASCII digits of `value`, least significant first.
+func _uint256_to_digits{range_check_ptr}(
+        value: Uint256,
+        digits: felt*
+    ) -> (digits_len: felt):
+    if value.high == 0:
+        let (digits_len) = _felt_to_digits(value.low, digits)
+        return (digits_len)
+    end
+
+    let (quotient: Uint256, remainder: Uint256) = uint256_unsigned_div_rem(value, Uint256(10, 0))
+    assert [digits] = ASCII_ZERO + remainder.low
+    let (digits_len) = _uint256_to_digits(quotient, digits + 1)
+    return (digits_len + 1)
+end
+
+func _felt_to_digits{range_check_ptr}(
+        value: felt,
+        digits: felt*
+    ) -> (digits_len: felt):
+    let (quotient, remainder) = unsigned_div_rem(value, 10)
+    assert [digits] = ASCII_ZERO + remainder
+    if quotient == 0:
+        return (1)
+    end
+
+    let (digits_len) = _felt_to_digits(quotient, digits + 1)
+    return (digits_len + 1)
+end
+
+# Packs the digits into short strings, starting from the most significant one
+# at the end of `digits`.
+func _pack_digits(
+        digits_len: felt,
+        digits: felt*,
+        chunk_len: felt,
+        acc: felt,
+        res: felt*
+    ) -> (res_len: felt):
+    if digits_len == 0:
+        return (0)
+    end
+
+    let new_acc = acc * 256 + digits[digits_len - 1]
+    if chunk_len == 1:
+        assert [res] = new_acc
+        let (res_len) = _pack_digits(digits_len - 1, digits, SHORT_STRING_MAX_LEN, 0, res + 1)
+        return (res_len + 1)
+    end
+
+    let (res_len) = _pack_digits(digits_len - 1, digits, chunk_len - 1, new_acc, res)
+    return (res_len)
+end
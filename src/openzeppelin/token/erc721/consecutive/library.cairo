@@ -0,0 +1,437 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc721/consecutive/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.math import assert_not_zero, assert_not_equal, assert_in_range
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.uint256 import Uint256, uint256_check, uint256_lt, uint256_sub
+
+from openzeppelin.security.safemath.library import SafeUint256
+from openzeppelin.token.erc721.library import (
+    ERC721,
+    ERC721_owners,
+    ERC721_balances,
+    ERC721_token_approvals,
+    ERC721_token_uri,
+    ERC721_consecutive_transfer_event,
+    Transfer,
+    Approval,
+    ConsecutiveTransfer,
+    _check_onERC721Received
+)
+
+#
+# Constants
+#
+
+# Bounds the number of slots `owner_of` may have to scan
+const ERC721_CONSECUTIVE_MAX_BATCH_SIZE = 1000
+
+#
+# Storage
+#
+
+@storage_var
+func ERC721Consecutive_next_token_id() -> (token_id: Uint256):
+end
+
+@storage_var
+func ERC721Consecutive_burned(token_id: Uint256) -> (burned: felt):
+end
+
+# Tokens are minted in runs of consecutive ids starting at zero. Only the
+# first token of a run has its owner written to `ERC721_owners`, the owner
+# of any other token is the owner of the closest explicitly set slot below it.
+# Transfers and burns write the owner of the next token when needed, so that
+# the remaining tokens of a run are not affected.
+namespace ERC721Consecutive:
+
+    #
+    # Getters
+    #
+
+    func next_token_id{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }() -> (token_id: Uint256):
+        let (token_id: Uint256) = ERC721Consecutive_next_token_id.read()
+        return (token_id)
+    end
+
+    func owner_of{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256) -> (owner: felt):
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        let (exists) = _exists(token_id)
+        with_attr error_message("ERC721: owner query for nonexistent token"):
+            assert exists = TRUE
+        end
+        let (owner) = _find_owner(token_id)
+        return (owner)
+    end
+
+    func get_approved{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256) -> (approved: felt):
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        let (exists) = _exists(token_id)
+        with_attr error_message("ERC721: approved query for nonexistent token"):
+            assert exists = TRUE
+        end
+
+        let (approved) = ERC721_token_approvals.read(token_id)
+        return (approved)
+    end
+
+    func token_uri{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256) -> (token_uri: felt):
+        let (exists) = _exists(token_id)
+        with_attr error_message("ERC721_Metadata: URI query for nonexistent token"):
+            assert exists = TRUE
+        end
+
+        # if tokenURI is not set, it will return 0
+        let (token_uri) = ERC721_token_uri.read(token_id)
+        return (token_uri)
+    end
+
+    #
+    # Externals
+    #
+
+    func approve{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt, token_id: Uint256):
+        alloc_locals
+        # Checks caller is not zero address
+        let (caller) = get_caller_address()
+        with_attr error_message("ERC721: cannot approve from the zero address"):
+            assert_not_zero(caller)
+        end
+
+        # Ensures 'owner' does not equal 'to'
+        let (owner) = owner_of(token_id)
+        with_attr error_message("ERC721: approval to current owner"):
+            assert_not_equal(owner, to)
+        end
+
+        # Checks that either caller equals owner or
+        # caller isApprovedForAll on behalf of owner
+        if caller == owner:
+            _approve(owner, to, token_id)
+            return ()
+        else:
+            let (is_approved) = ERC721.is_approved_for_all(owner, caller)
+            with_attr error_message("ERC721: approve caller is not owner nor approved for all"):
+                assert_not_zero(is_approved)
+            end
+            _approve(owner, to, token_id)
+            return ()
+        end
+    end
+
+    func transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(from_: felt, to: felt, token_id: Uint256):
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        let (caller) = get_caller_address()
+        let (is_approved) = _is_approved_or_owner(caller, token_id)
+        with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
+            assert_not_zero(caller * is_approved)
+        end
+
+        _transfer(from_, to, token_id)
+        return ()
+    end
+
+    func safe_transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            token_id: Uint256,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        let (caller) = get_caller_address()
+        let (is_approved) = _is_approved_or_owner(caller, token_id)
+        with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
+            assert_not_zero(caller * is_approved)
+        end
+
+        _transfer(from_, to, token_id)
+
+        let (success) = _check_onERC721Received(from_, to, token_id, data_len, data)
+        with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+            assert_not_zero(success)
+        end
+        return ()
+    end
+
+    #
+    # Internals
+    #
+
+    func assert_only_token_owner{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(token_id: Uint256):
+        alloc_locals
+        let (caller) = get_caller_address()
+        let (owner) = owner_of(token_id)
+        # Note `owner_of` checks that the owner is not the zero address
+        with_attr error_message("ERC721: caller is not the token owner"):
+            assert caller = owner
+        end
+        return ()
+    end
+
+    func _exists{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256) -> (res: felt):
+        alloc_locals
+        let (next_token_id: Uint256) = ERC721Consecutive_next_token_id.read()
+        let (is_minted) = uint256_lt(token_id, next_token_id)
+        if is_minted == FALSE:
+            return (FALSE)
+        end
+
+        let (burned) = ERC721Consecutive_burned.read(token_id)
+        return (1 - burned)
+    end
+
+    func _is_approved_or_owner{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(spender: felt, token_id: Uint256) -> (res: felt):
+        alloc_locals
+        let (owner) = owner_of(token_id)
+        if owner == spender:
+            return (TRUE)
+        end
+
+        let (approved_addr) = ERC721_token_approvals.read(token_id)
+        if approved_addr == spender:
+            return (TRUE)
+        end
+
+        let (is_operator) = ERC721.is_approved_for_all(owner, spender)
+        if is_operator == TRUE:
+            return (TRUE)
+        end
+
+        return (FALSE)
+    end
+
+    # Takes the already resolved `owner` so that the run is not scanned again
+    func _approve{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(owner: felt, to: felt, token_id: Uint256):
+        ERC721_token_approvals.write(token_id, to)
+        Approval.emit(owner, to, token_id)
+        return ()
+    end
+
+    # Mints `quantity` tokens with consecutive ids to `to`, starting
+    # at `next_token_id`. Only the first owner slot of the run is written.
+    func _mint_consecutive{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt, quantity: felt):
+        alloc_locals
+        with_attr error_message("ERC721: cannot mint to the zero address"):
+            assert_not_zero(to)
+        end
+        with_attr error_message("ERC721Consecutive: quantity must be between 1 and 1000"):
+            assert_in_range(quantity, 1, ERC721_CONSECUTIVE_MAX_BATCH_SIZE + 1)
+        end
+
+        let (first_token_id: Uint256) = ERC721Consecutive_next_token_id.read()
+        let (next_token_id: Uint256) = SafeUint256.add(first_token_id, Uint256(quantity, 0))
+        ERC721Consecutive_next_token_id.write(next_token_id)
+
+        let (balance: Uint256) = ERC721_balances.read(to)
+        let (new_balance: Uint256) = SafeUint256.add(balance, Uint256(quantity, 0))
+        ERC721_balances.write(to, new_balance)
+
+        ERC721_owners.write(first_token_id, to)
+
+        let (consecutive) = ERC721_consecutive_transfer_event.read()
+        if consecutive == TRUE:
+            let (last_token_id: Uint256) = uint256_sub(next_token_id, Uint256(1, 0))
+            ConsecutiveTransfer.emit(first_token_id, last_token_id, 0, to)
+            return ()
+        end
+
+        _emit_mint_transfers(to, first_token_id, quantity)
+        return ()
+    end
+
+    func _transfer{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(from_: felt, to: felt, token_id: Uint256):
+        alloc_locals
+        # owner_of ensures 'from_' is not the zero address
+        let (owner) = owner_of(token_id)
+        with_attr error_message("ERC721: transfer from incorrect owner"):
+            assert owner = from_
+        end
+
+        with_attr error_message("ERC721: cannot transfer to the zero address"):
+            assert_not_zero(to)
+        end
+
+        # Clear approvals
+        _approve(owner, 0, token_id)
+
+        # Decrease owner balance
+        let (owner_bal) = ERC721_balances.read(from_)
+        let (new_balance: Uint256) = SafeUint256.sub_le(owner_bal, Uint256(1, 0))
+        ERC721_balances.write(from_, new_balance)
+
+        # Increase receiver balance
+        let (receiver_bal) = ERC721_balances.read(to)
+        let (new_balance: Uint256) = SafeUint256.add(receiver_bal, Uint256(1, 0))
+        ERC721_balances.write(to, new_balance)
+
+        # Keep the rest of the run owned by `from_` before updating token_id owner
+        _split_run(from_, token_id)
+        ERC721_owners.write(token_id, to)
+        Transfer.emit(from_, to, token_id)
+        return ()
+    end
+
+    func _burn{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(token_id: Uint256):
+        alloc_locals
+        let (owner) = owner_of(token_id)
+
+        # Clear approvals
+        _approve(owner, 0, token_id)
+
+        # Decrease owner balance
+        let (balance: Uint256) = ERC721_balances.read(owner)
+        let (new_balance: Uint256) = SafeUint256.sub_le(balance, Uint256(1, 0))
+        ERC721_balances.write(owner, new_balance)
+
+        # Keep the rest of the run owned by `owner` before deleting token_id owner
+        _split_run(owner, token_id)
+        ERC721_owners.write(token_id, 0)
+        ERC721Consecutive_burned.write(token_id, TRUE)
+        Transfer.emit(owner, 0, token_id)
+        return ()
+    end
+
+    func _set_token_uri{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_id: Uint256, token_uri: felt):
+        uint256_check(token_id)
+        let (exists) = _exists(token_id)
+        with_attr error_message("ERC721_Metadata: set token URI for nonexistent token"):
+            assert exists = TRUE
+        end
+
+        ERC721_token_uri.write(token_id, token_uri)
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+# Scans back from `token_id` to the closest explicitly set owner slot.
+# The caller must ensure that the token exists.
+func _find_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    let (owner) = ERC721_owners.read(token_id)
+    if owner != 0:
+        return (owner)
+    end
+
+    let (previous_token_id: Uint256) = uint256_sub(token_id, Uint256(1, 0))
+    return _find_owner(previous_token_id)
+end
+
+# Writes `owner` to the slot following `token_id` when that token belongs
+# to the same run, i.e. it is minted, not burned and has no explicit owner.
+func _split_run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, token_id: Uint256):
+    alloc_locals
+    let (next_id: Uint256) = SafeUint256.add(token_id, Uint256(1, 0))
+    let (exists) = ERC721Consecutive._exists(next_id)
+    if exists == FALSE:
+        return ()
+    end
+
+    let (next_owner) = ERC721_owners.read(next_id)
+    if next_owner == 0:
+        ERC721_owners.write(next_id, owner)
+        return ()
+    end
+    return ()
+end
+
+func _emit_mint_transfers{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256, quantity: felt):
+    if quantity == 0:
+        return ()
+    end
+
+    Transfer.emit(0, to, token_id)
+    let (next_id: Uint256) = SafeUint256.add(token_id, Uint256(1, 0))
+    return _emit_mint_transfers(to, next_id, quantity - 1)
+end
@@ -0,0 +1,372 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc721/enumerable/compact/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.math import assert_lt, assert_nn, assert_not_zero
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.uint256 import Uint256, uint256_check
+
+from openzeppelin.introspection.erc165.library import ERC165
+from openzeppelin.token.erc721.library import (
+    ERC721, ERC721_balances, _check_onERC721Received
+)
+from openzeppelin.utils.constants.library import IERC721_ENUMERABLE_ID
+
+#
+# Storage
+#
+
+@storage_var
+func ERC721EnumerableCompact_all_tokens_len() -> (len: felt):
+end
+
+@storage_var
+func ERC721EnumerableCompact_all_tokens(index: felt) -> (token_id: Uint256):
+end
+
+@storage_var
+func ERC721EnumerableCompact_all_tokens_index(token_id: Uint256) -> (index: felt):
+end
+
+@storage_var
+func ERC721EnumerableCompact_owned_tokens(owner: felt, index: felt) -> (token_id: Uint256):
+end
+
+@storage_var
+func ERC721EnumerableCompact_owned_tokens_index(token_id: Uint256) -> (index: felt):
+end
+
+# Same behavior as `ERC721Enumerable`, but indexes and lengths are stored as
+# single felts. An index can never reach 2**128, since there is one index per
+# minted token, so every comparison is done with felt range checks.
+namespace ERC721EnumerableCompact:
+
+    #
+    # Constructor
+    #
+
+    func initializer{
+            syscall_ptr : felt*,
+            pedersen_ptr : HashBuiltin*,
+            range_check_ptr
+        }():
+        ERC165.register_interface(IERC721_ENUMERABLE_ID)
+        return ()
+    end
+
+    #
+    # Getters
+    #
+
+    func total_supply{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }() -> (total_supply: Uint256):
+        let (len) = ERC721EnumerableCompact_all_tokens_len.read()
+        return (Uint256(len, 0))
+    end
+
+    func token_by_index{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(index: Uint256) -> (token_id: Uint256):
+        alloc_locals
+        uint256_check(index)
+        # Ensures index argument is less than total_supply
+        let (len) = ERC721EnumerableCompact_all_tokens_len.read()
+        with_attr error_message("ERC721Enumerable: global index out of bounds"):
+            assert index.high = 0
+            assert_lt(index.low, len)
+        end
+
+        let (token_id: Uint256) = ERC721EnumerableCompact_all_tokens.read(index.low)
+        return (token_id)
+    end
+
+    func token_of_owner_by_index{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(owner: felt, index: Uint256) -> (token_id: Uint256):
+        alloc_locals
+        uint256_check(index)
+        # Ensures index argument is less than owner's balance
+        let (balance: Uint256) = ERC721.balance_of(owner)
+        with_attr error_message("ERC721Enumerable: owner index out of bounds"):
+            assert index.high = 0
+            assert_lt(index.low, balance.low)
+        end
+
+        let (token_id: Uint256) = ERC721EnumerableCompact_owned_tokens.read(owner, index.low)
+        return (token_id)
+    end
+
+    # Returns up to `limit` tokens starting at global index `offset`.
+    # The page is truncated at the end of the enumeration.
+    func tokens{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        uint256_check(offset)
+        let (len) = ERC721EnumerableCompact_all_tokens_len.read()
+        let (token_ids_len) = _page_len(len, offset, limit)
+
+        let (local token_ids: Uint256*) = alloc()
+        _read_all_tokens(offset.low, token_ids_len, token_ids)
+        return (token_ids_len, token_ids)
+    end
+
+    # Returns up to `limit` tokens of `owner` starting at owner index `offset`.
+    # The page is truncated at the end of the owner's tokens.
+    func tokens_of_owner{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(owner: felt, offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        uint256_check(offset)
+        let (balance: Uint256) = ERC721.balance_of(owner)
+        let (token_ids_len) = _page_len(balance.low, offset, limit)
+
+        let (local token_ids: Uint256*) = alloc()
+        _read_owned_tokens(owner, offset.low, token_ids_len, token_ids)
+        return (token_ids_len, token_ids)
+    end
+
+    #
+    # Externals
+    #
+
+    func transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(from_: felt, to: felt, token_id: Uint256):
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        ERC721._authorize_transfer(from_, to, token_id)
+
+        # The balances are read once, for both the enumeration and the transfer
+        let (from_balance: Uint256) = ERC721_balances.read(from_)
+        let (to_balance: Uint256) = ERC721_balances.read(to)
+        _remove_owned_token(from_, token_id, from_balance)
+        _add_owned_token(to, token_id, to_balance)
+        ERC721._move_token(from_, to, token_id, from_balance, to_balance)
+        return ()
+    end
+
+    func safe_transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            token_id: Uint256,
+            data_len: felt,
+            data: felt*
+        ):
+        alloc_locals
+        transfer_from(from_, to, token_id)
+
+        let (success) = _check_onERC721Received(from_, to, token_id, data_len, data)
+        with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+            assert_not_zero(success)
+        end
+        return ()
+    end
+
+    #
+    # Internals
+    #
+
+    func _mint{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt, token_id: Uint256):
+        _add_token_to_all_tokens_enumeration(token_id)
+        _add_token_to_owner_enumeration(to, token_id)
+        ERC721._mint(to, token_id)
+        return ()
+    end
+
+    func _burn{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(token_id: Uint256):
+        let (from_) = ERC721.owner_of(token_id)
+        _remove_token_from_owner_enumeration(from_, token_id)
+        _remove_token_from_all_tokens_enumeration(token_id)
+        ERC721._burn(token_id)
+        return ()
+    end
+
+end
+
+#
+# Private
+#
+
+func _add_token_to_all_tokens_enumeration{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256):
+    let (supply) = ERC721EnumerableCompact_all_tokens_len.read()
+    ERC721EnumerableCompact_all_tokens.write(supply, token_id)
+    ERC721EnumerableCompact_all_tokens_index.write(token_id, supply)
+    ERC721EnumerableCompact_all_tokens_len.write(supply + 1)
+    return ()
+end
+
+func _remove_token_from_all_tokens_enumeration{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256):
+    alloc_locals
+    let (supply) = ERC721EnumerableCompact_all_tokens_len.read()
+    # the token exists, so the supply is at least one
+    let last_token_index = supply - 1
+    let (token_index) = ERC721EnumerableCompact_all_tokens_index.read(token_id)
+
+    ERC721EnumerableCompact_all_tokens_index.write(token_id, 0)
+    ERC721EnumerableCompact_all_tokens_len.write(last_token_index)
+
+    if token_index == last_token_index:
+        ERC721EnumerableCompact_all_tokens.write(last_token_index, Uint256(0, 0))
+        return ()
+    end
+
+    # Reposition the last token to the removed token's index
+    let (last_token_id: Uint256) = ERC721EnumerableCompact_all_tokens.read(last_token_index)
+    ERC721EnumerableCompact_all_tokens.write(last_token_index, Uint256(0, 0))
+    ERC721EnumerableCompact_all_tokens_index.write(last_token_id, token_index)
+    ERC721EnumerableCompact_all_tokens.write(token_index, last_token_id)
+    return ()
+end
+
+func _add_token_to_owner_enumeration{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256):
+    let (length: Uint256) = ERC721.balance_of(to)
+    _add_owned_token(to, token_id, length)
+    return ()
+end
+
+func _remove_token_from_owner_enumeration{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(from_: felt, token_id: Uint256):
+    let (balance: Uint256) = ERC721.balance_of(from_)
+    _remove_owned_token(from_, token_id, balance)
+    return ()
+end
+
+# Same as `_add_token_to_owner_enumeration`, given the balance of `to`.
+func _add_owned_token{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256, length: Uint256):
+    ERC721EnumerableCompact_owned_tokens.write(to, length.low, token_id)
+    ERC721EnumerableCompact_owned_tokens_index.write(token_id, length.low)
+    return ()
+end
+
+# Same as `_remove_token_from_owner_enumeration`, given the balance of `from_`.
+func _remove_owned_token{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(from_: felt, token_id: Uint256, balance: Uint256):
+    alloc_locals
+    # the index starts at zero therefore the user's last token index is their balance minus one
+    let last_token_index = balance.low - 1
+    let (token_index) = ERC721EnumerableCompact_owned_tokens_index.read(token_id)
+
+    # If index is last, we can just set the return values to zero
+    if token_index == last_token_index:
+        ERC721EnumerableCompact_owned_tokens_index.write(token_id, 0)
+        ERC721EnumerableCompact_owned_tokens.write(from_, last_token_index, Uint256(0, 0))
+        return ()
+    end
+
+    # If index is not last, reposition owner's last token to the removed token's index
+    let (last_token_id: Uint256) = ERC721EnumerableCompact_owned_tokens.read(from_, last_token_index)
+    ERC721EnumerableCompact_owned_tokens.write(from_, token_index, last_token_id)
+    ERC721EnumerableCompact_owned_tokens_index.write(last_token_id, token_index)
+    return ()
+end
+
+# Returns the number of items in a page of at most `limit` items
+# starting at `offset`, out of `len` items.
+func _page_len{range_check_ptr}(
+        len: felt,
+        offset: Uint256,
+        limit: felt
+    ) -> (page_len: felt):
+    alloc_locals
+    with_attr error_message("ERC721Enumerable: limit cannot be negative"):
+        assert_nn(limit)
+    end
+
+    if offset.high != 0:
+        return (0)
+    end
+
+    let (is_past_end) = is_le(len, offset.low)
+    if is_past_end == TRUE:
+        return (0)
+    end
+
+    let remaining = len - offset.low
+    let (is_limit_le) = is_le(limit, remaining)
+    if is_limit_le == TRUE:
+        return (limit)
+    end
+    return (remaining)
+end
+
+func _read_all_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721EnumerableCompact_all_tokens.read(index)
+    assert [token_ids] = token_id
+    return _read_all_tokens(index + 1, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _read_owned_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, index: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721EnumerableCompact_owned_tokens.read(owner, index)
+    assert [token_ids] = token_id
+    return _read_owned_tokens(owner, index + 1, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
@@ -3,15 +3,20 @@
 
 %lang starknet
 
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin
 from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.math import assert_nn, assert_not_zero
+from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.uint256 import (
-    Uint256, uint256_lt, uint256_eq, uint256_check
+    Uint256, uint256_lt, uint256_eq, uint256_check, uint256_add, uint256_sub
 )
 
 from openzeppelin.introspection.erc165.library import ERC165
 from openzeppelin.security.safemath.library import SafeUint256
-from openzeppelin.token.erc721.library import ERC721
+from openzeppelin.token.erc721.library import (
+    ERC721, ERC721_balances, _check_onERC721Received
+)
 from openzeppelin.utils.constants.library import IERC721_ENUMERABLE_ID
 
 #
@@ -104,6 +109,40 @@ namespace ERC721Enumerable:
         return (token_id)
     end
 
+    # Returns up to `limit` tokens starting at global index `offset`.
+    # The page is truncated at the end of the enumeration.
+    func tokens{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        uint256_check(offset)
+        let (len: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        let (token_ids_len) = _page_len(len, offset, limit)
+
+        let (local token_ids: Uint256*) = alloc()
+        _read_all_tokens(offset, token_ids_len, token_ids)
+        return (token_ids_len, token_ids)
+    end
+
+    # Returns up to `limit` tokens of `owner` starting at owner index `offset`.
+    # The page is truncated at the end of the owner's tokens.
+    func tokens_of_owner{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(owner: felt, offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        uint256_check(offset)
+        let (len: Uint256) = ERC721.balance_of(owner)
+        let (token_ids_len) = _page_len(len, offset, limit)
+
+        let (local token_ids: Uint256*) = alloc()
+        _read_owned_tokens(owner, offset, token_ids_len, token_ids)
+        return (token_ids_len, token_ids)
+    end
+
     #
     # Externals
     #
@@ -112,9 +151,18 @@ namespace ERC721Enumerable:
             syscall_ptr: felt*,
             range_check_ptr
         }(from_: felt, to: felt, token_id: Uint256):
-        _remove_token_from_owner_enumeration(from_, token_id)
-        _add_token_to_owner_enumeration(to, token_id)
-        ERC721.transfer_from(from_, to, token_id)
+        alloc_locals
+        with_attr error_message("ERC721: token_id is not a valid Uint256"):
+            uint256_check(token_id)
+        end
+        ERC721._authorize_transfer(from_, to, token_id)
+
+        # The balances are read once, for both the enumeration and the transfer
+        let (from_balance: Uint256) = ERC721_balances.read(from_)
+        let (to_balance: Uint256) = ERC721_balances.read(to)
+        _remove_owned_token(from_, token_id, from_balance)
+        _add_owned_token(to, token_id, to_balance)
+        ERC721._move_token(from_, to, token_id, from_balance, to_balance)
         return ()
     end
 
@@ -129,9 +177,13 @@ namespace ERC721Enumerable:
             data_len: felt,
             data: felt*
         ):
-        _remove_token_from_owner_enumeration(from_, token_id)
-        _add_token_to_owner_enumeration(to, token_id)
-        ERC721.safe_transfer_from(from_, to, token_id, data_len, data)
+        alloc_locals
+        transfer_from(from_, to, token_id)
+
+        let (success) = _check_onERC721Received(from_, to, token_id, data_len, data)
+        with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+            assert_not_zero(success)
+        end
         return ()
     end
 
@@ -162,6 +214,46 @@ namespace ERC721Enumerable:
         return ()
     end
 
+    # Mints `token_ids` to `to`. The total supply and the balance of `to`
+    # are written once.
+    func _mint_batch{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        let (supply: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        let (new_supply: Uint256) = SafeUint256.add(supply, Uint256(token_ids_len, 0))
+        # `ERC721._mint_batch` below rejects the zero address
+        let (length: Uint256) = ERC721_balances.read(to)
+        _add_tokens_to_enumerations(to, supply, length, token_ids_len, token_ids)
+        ERC721Enumerable_all_tokens_len.write(new_supply)
+
+        ERC721._mint_batch(to, token_ids_len, token_ids)
+        return ()
+    end
+
+    # Burns `token_ids`, which must all be owned by `owner`. The total supply
+    # and the balance of `owner` are written once.
+    func _burn_batch{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        let (supply: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        let (balance: Uint256) = ERC721_balances.read(owner)
+
+        # Checks ownership before touching the enumerations
+        ERC721._burn_batch(owner, token_ids_len, token_ids)
+
+        let (new_supply: Uint256) = _remove_tokens_from_enumerations(
+            owner, supply, balance, token_ids_len, token_ids
+        )
+        ERC721Enumerable_all_tokens_len.write(new_supply)
+        return ()
+    end
+
 end
 
 #
@@ -173,9 +265,9 @@ func _add_token_to_all_tokens_enumeration{
         syscall_ptr: felt*,
         range_check_ptr
     }(token_id: Uint256):
+    alloc_locals
     let (supply: Uint256) = ERC721Enumerable_all_tokens_len.read()
-    ERC721Enumerable_all_tokens.write(supply, token_id)
-    ERC721Enumerable_all_tokens_index.write(token_id, supply)
+    _add_to_all_tokens(token_id, supply)
 
     let (new_supply: Uint256) = SafeUint256.add(supply, Uint256(1, 0))
     ERC721Enumerable_all_tokens_len.write(new_supply)
@@ -187,23 +279,48 @@ func _remove_token_from_all_tokens_enumeration{
         syscall_ptr: felt*,
         range_check_ptr
     }(token_id: Uint256):
-    alloc_locals
     let (supply: Uint256) = ERC721Enumerable_all_tokens_len.read()
+    let (new_supply: Uint256) = _remove_from_all_tokens(token_id, supply)
+    ERC721Enumerable_all_tokens_len.write(new_supply)
+    return ()
+end
+
+
+# Same as `_add_token_to_all_tokens_enumeration`, given the total supply.
+# Does not update the total supply.
+func _add_to_all_tokens{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256, supply: Uint256):
+    ERC721Enumerable_all_tokens.write(supply, token_id)
+    ERC721Enumerable_all_tokens_index.write(token_id, supply)
+    return ()
+end
+
+
+# Same as `_remove_token_from_all_tokens_enumeration`, given the total supply.
+# Returns the new total supply without writing it.
+func _remove_from_all_tokens{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256, supply: Uint256) -> (new_supply: Uint256):
+    alloc_locals
     let (last_token_index: Uint256) = SafeUint256.sub_le(supply, Uint256(1, 0))
     let (token_index: Uint256) = ERC721Enumerable_all_tokens_index.read(token_id)
     let (last_token_id: Uint256) = ERC721Enumerable_all_tokens.read(last_token_index)
 
     ERC721Enumerable_all_tokens.write(last_token_index, Uint256(0, 0))
     ERC721Enumerable_all_tokens_index.write(token_id, Uint256(0, 0))
-    ERC721Enumerable_all_tokens_len.write(last_token_index)
 
     let (is_equal) = uint256_eq(last_token_index, token_index)
     if is_equal == FALSE:
         ERC721Enumerable_all_tokens_index.write(last_token_id, token_index)
         ERC721Enumerable_all_tokens.write(token_index, last_token_id)
-        return ()
+        return (last_token_index)
     end
-    return ()
+    return (last_token_index)
 end
 
 
@@ -213,8 +330,7 @@ func _add_token_to_owner_enumeration{
         range_check_ptr
     }(to: felt, token_id: Uint256):
     let (length: Uint256) = ERC721.balance_of(to)
-    ERC721Enumerable_owned_tokens.write(to, length, token_id)
-    ERC721Enumerable_owned_tokens_index.write(token_id, length)
+    _add_owned_token(to, token_id, length)
     return ()
 end
 
@@ -224,10 +340,33 @@ func _remove_token_from_owner_enumeration{
         syscall_ptr: felt*,
         range_check_ptr
     }(from_: felt, token_id: Uint256):
+    let (balance: Uint256) = ERC721.balance_of(from_)
+    _remove_owned_token(from_, token_id, balance)
+    return ()
+end
+
+
+# Same as `_add_token_to_owner_enumeration`, given the balance of `to`.
+func _add_owned_token{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256, length: Uint256):
+    ERC721Enumerable_owned_tokens.write(to, length, token_id)
+    ERC721Enumerable_owned_tokens_index.write(token_id, length)
+    return ()
+end
+
+
+# Same as `_remove_token_from_owner_enumeration`, given the balance of `from_`.
+func _remove_owned_token{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(from_: felt, token_id: Uint256, balance: Uint256):
     alloc_locals
-    let (last_token_index: Uint256) = ERC721.balance_of(from_)
     # the index starts at zero therefore the user's last token index is their balance minus one
-    let (last_token_index) = SafeUint256.sub_le(last_token_index, Uint256(1, 0))
+    let (last_token_index) = SafeUint256.sub_le(balance, Uint256(1, 0))
     let (token_index: Uint256) = ERC721Enumerable_owned_tokens_index.read(token_id)
 
     # If index is last, we can just set the return values to zero
@@ -244,3 +383,124 @@ func _remove_token_from_owner_enumeration{
     ERC721Enumerable_owned_tokens_index.write(last_token_id, token_index)
     return ()
 end
+
+
+# Returns the number of items in a page of at most `limit` items
+# starting at `offset`, out of `len` items.
+func _page_len{range_check_ptr}(
+        len: Uint256,
+        offset: Uint256,
+        limit: felt
+    ) -> (page_len: felt):
+    alloc_locals
+    with_attr error_message("ERC721Enumerable: limit cannot be negative"):
+        assert_nn(limit)
+    end
+
+    let (is_lt) = uint256_lt(offset, len)
+    if is_lt == FALSE:
+        return (0)
+    end
+
+    let (remaining: Uint256) = uint256_sub(len, offset)
+    if remaining.high != 0:
+        return (limit)
+    end
+
+    let (is_limit_le) = is_le(limit, remaining.low)
+    if is_limit_le == TRUE:
+        return (limit)
+    end
+    return (remaining.low)
+end
+
+func _read_all_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: Uint256, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721Enumerable_all_tokens.read(index)
+    assert [token_ids] = token_id
+    # cannot overflow, since the index is lower than the total supply
+    let (next_index: Uint256, _) = uint256_add(index, Uint256(1, 0))
+    return _read_all_tokens(next_index, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _read_owned_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, index: Uint256, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721Enumerable_owned_tokens.read(owner, index)
+    assert [token_ids] = token_id
+    # cannot overflow, since the index is lower than the owner's balance
+    let (next_index: Uint256, _) = uint256_add(index, Uint256(1, 0))
+    return _read_owned_tokens(owner, next_index, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+# Appends `token_ids` to both enumerations, given the total supply
+# and the balance of `to` before the batch.
+func _add_tokens_to_enumerations{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        to: felt,
+        supply: Uint256,
+        length: Uint256,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    alloc_locals
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id: Uint256 = [token_ids]
+    _add_to_all_tokens(token_id, supply)
+    _add_owned_token(to, token_id, length)
+
+    # cannot overflow, the final supply and balance are checked by the caller
+    let (next_supply: Uint256, _) = uint256_add(supply, Uint256(1, 0))
+    let (next_length: Uint256, _) = uint256_add(length, Uint256(1, 0))
+    return _add_tokens_to_enumerations(
+        to, next_supply, next_length, token_ids_len - 1, token_ids + Uint256.SIZE
+    )
+end
+
+# Removes `token_ids` from both enumerations, given the total supply
+# and the balance of `from_` before the batch. Returns the new total supply.
+func _remove_tokens_from_enumerations{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        supply: Uint256,
+        balance: Uint256,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ) -> (new_supply: Uint256):
+    alloc_locals
+    if token_ids_len == 0:
+        return (supply)
+    end
+
+    let token_id: Uint256 = [token_ids]
+    _remove_owned_token(from_, token_id, balance)
+    let (next_supply: Uint256) = _remove_from_all_tokens(token_id, supply)
+
+    let (next_balance: Uint256) = SafeUint256.sub_le(balance, Uint256(1, 0))
+    let (new_supply: Uint256) = _remove_tokens_from_enumerations(
+        from_, next_supply, next_balance, token_ids_len - 1, token_ids + Uint256.SIZE
+    )
+    return (new_supply)
+end
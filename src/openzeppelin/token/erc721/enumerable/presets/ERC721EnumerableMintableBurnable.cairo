@@ -4,6 +4,7 @@
 %lang starknet
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
 from starkware.cairo.common.uint256 import Uint256
 
 from openzeppelin.access.ownable.library import Ownable
@@ -65,6 +66,26 @@ func tokenOfOwnerByIndex{
     return (tokenId)
 end
 
+@view
+func tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(offset: Uint256, limit: felt) -> (tokenIds_len: felt, tokenIds: Uint256*):
+    let (tokenIds_len, tokenIds) = ERC721Enumerable.tokens(offset, limit)
+    return (tokenIds_len, tokenIds)
+end
+
+@view
+func tokensOfOwner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, offset: Uint256, limit: felt) -> (tokenIds_len: felt, tokenIds: Uint256*):
+    let (tokenIds_len, tokenIds) = ERC721Enumerable.tokens_of_owner(owner, offset, limit)
+    return (tokenIds_len, tokenIds)
+end
+
 @view
 func supportsInterface{
         syscall_ptr : felt*,
@@ -115,6 +136,28 @@ func ownerOf{
     return (owner)
 end
 
+@view
+func ownersOf{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        accounts_len: felt,
+        accounts: felt*
+    ) -> (
+        owners_len: felt,
+        owners: felt*,
+        balances_len: felt,
+        balances: Uint256*
+    ):
+    let (owners_len, owners, balances_len, balances) = ERC721.owners_of(
+        tokenIds_len, tokenIds, accounts_len, accounts
+    )
+    return (owners_len, owners, balances_len, balances)
+end
+
 @view
 func getApproved{
         syscall_ptr : felt*,
@@ -125,6 +168,16 @@ func getApproved{
     return (approved)
 end
 
+@view
+func getApprovedBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (approved_len: felt, approved: felt*):
+    let (approved_len, approved) = ERC721.get_approved_batch(tokenIds_len, tokenIds)
+    return (approved_len, approved)
+end
+
 @view
 func isApprovedForAll{
         syscall_ptr : felt*,
@@ -179,6 +232,21 @@ func setApprovalForAll{
     return ()
 end
 
+@external
+func setApprovalsForAll{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        operators_len: felt,
+        operators: felt*,
+        approved_len: felt,
+        approved: felt*
+    ):
+    ERC721.set_approvals_for_all(operators_len, operators, approved_len, approved)
+    return ()
+end
+
 @external
 func transferFrom{
         pedersen_ptr: HashBuiltin*,
@@ -231,6 +299,32 @@ func burn{
     return ()
 end
 
+@external
+func mintBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        to: felt,
+        tokenIds_len: felt,
+        tokenIds: Uint256*
+    ):
+    Ownable.assert_only_owner()
+    ERC721Enumerable._mint_batch(to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func burnBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*):
+    let (caller) = get_caller_address()
+    ERC721Enumerable._burn_batch(caller, tokenIds_len, tokenIds)
+    return ()
+end
+
 @external
 func setTokenURI{
         pedersen_ptr: HashBuiltin*,
@@ -242,6 +336,17 @@ func setTokenURI{
     return ()
 end
 
+@external
+func setConsecutiveTransferEvent{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(enabled: felt):
+    Ownable.assert_only_owner()
+    ERC721._set_consecutive_transfer_event(enabled)
+    return ()
+end
+
 @external
 func transferOwnership{
         syscall_ptr: felt*,
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.2.1 (token/erc721/enumerable/sequential/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.uint256 import Uint256, uint256_lt, uint256_check, uint256_add
+
+from openzeppelin.security.safemath.library import SafeUint256
+from openzeppelin.token.erc721.library import ERC721
+from openzeppelin.token.erc721.enumerable.library import (
+    ERC721Enumerable, ERC721Enumerable_all_tokens_len, _add_token_to_owner_enumeration, _page_len
+)
+
+# Enumeration for collections that mint ids 0, 1, 2... in order and never burn.
+# The token at global index `i` is always token `i`, so only the token count
+# and the owner enumeration are stored.
+namespace ERC721EnumerableSequential:
+
+    #
+    # Getters
+    #
+
+    func token_by_index{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(index: Uint256) -> (token_id: Uint256):
+        alloc_locals
+        uint256_check(index)
+        # Ensures index argument is less than total_supply
+        let (len: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        let (is_lt) = uint256_lt(index, len)
+        with_attr error_message("ERC721Enumerable: global index out of bounds"):
+            assert is_lt = TRUE
+        end
+
+        return (index)
+    end
+
+    # Returns up to `limit` tokens starting at global index `offset`.
+    # The page is truncated at the end of the enumeration.
+    func tokens{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        uint256_check(offset)
+        let (len: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        let (token_ids_len) = _page_len(len, offset, limit)
+
+        let (local token_ids: Uint256*) = alloc()
+        _fill_token_ids(offset, token_ids_len, token_ids)
+        return (token_ids_len, token_ids)
+    end
+
+    #
+    # Internals
+    #
+
+    # Mints the next token id to `to` and returns it.
+    func _mint{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt) -> (token_id: Uint256):
+        alloc_locals
+        let (token_id: Uint256) = ERC721Enumerable_all_tokens_len.read()
+        _add_token_to_owner_enumeration(to, token_id)
+        ERC721._mint(to, token_id)
+
+        let (new_supply: Uint256) = SafeUint256.add(token_id, Uint256(1, 0))
+        ERC721Enumerable_all_tokens_len.write(new_supply)
+        return (token_id)
+    end
+
+end
+
+#
+# Private
+#
+
+func _fill_token_ids{range_check_ptr}(
+        token_id: Uint256,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    assert [token_ids] = token_id
+    # cannot overflow, since the token id is lower than the total supply
+    let (next_token_id: Uint256, _) = uint256_add(token_id, Uint256(1, 0))
+    return _fill_token_ids(next_token_id, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
@@ -3,11 +3,12 @@
 
 %lang starknet
 
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin
 from starkware.starknet.common.syscalls import get_caller_address
 from starkware.cairo.common.math import assert_not_zero, assert_not_equal
 from starkware.cairo.common.bool import TRUE, FALSE
-from starkware.cairo.common.uint256 import Uint256, uint256_check
+from starkware.cairo.common.uint256 import Uint256, uint256_check, uint256_add, uint256_eq
 
 from openzeppelin.introspection.erc165.library import ERC165
 from openzeppelin.introspection.erc165.IERC165 import IERC165
@@ -33,6 +34,17 @@ end
 func ApprovalForAll(owner: felt, operator: felt, approved: felt):
 end
 
+# EIP-2309, emitted instead of `Transfer` for each token id
+# from `fromTokenId` to `toTokenId` (inclusive)
+@event
+func ConsecutiveTransfer(
+        fromTokenId: Uint256,
+        toTokenId: Uint256,
+        fromAddress: felt,
+        toAddress: felt
+    ):
+end
+
 #
 # Storage
 #
@@ -65,6 +77,10 @@ end
 func ERC721_token_uri(token_id: Uint256) -> (token_uri: felt):
 end
 
+@storage_var
+func ERC721_consecutive_transfer_event() -> (enabled: felt):
+end
+
 namespace ERC721:
 
     #
@@ -135,6 +151,32 @@ namespace ERC721:
         return (owner)
     end
 
+    # Returns the owner of each token, or zero if it does not exist, and
+    # the balance of each account in `accounts`, which can be empty.
+    func owners_of{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(
+            token_ids_len: felt,
+            token_ids: Uint256*,
+            accounts_len: felt,
+            accounts: felt*
+        ) -> (
+            owners_len: felt,
+            owners: felt*,
+            balances_len: felt,
+            balances: Uint256*
+        ):
+        alloc_locals
+        let (local owners: felt*) = alloc()
+        _read_owners(token_ids_len, token_ids, owners)
+
+        let (local balances: Uint256*) = alloc()
+        _read_balances(accounts_len, accounts, balances)
+        return (token_ids_len, owners, accounts_len, balances)
+    end
+
     func get_approved{
             syscall_ptr: felt*,
             pedersen_ptr: HashBuiltin*,
@@ -152,6 +194,19 @@ namespace ERC721:
         return (approved)
     end
 
+    # Returns the approved address of each token, failing like
+    # `get_approved` if any of them does not exist.
+    func get_approved_batch{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(token_ids_len: felt, token_ids: Uint256*) -> (approved_len: felt, approved: felt*):
+        alloc_locals
+        let (local approved: felt*) = alloc()
+        _read_approvals(token_ids_len, token_ids, approved)
+        return (token_ids_len, approved)
+    end
+
     func is_approved_for_all{
             syscall_ptr: felt*,
             pedersen_ptr: HashBuiltin*,
@@ -232,17 +287,32 @@ namespace ERC721:
         #   This is because these addresses are field elements,
         #   meaning that a*0==0 for all a in the field,
         #   and a*b==0 implies that at least one of a,b are zero in the field
-        with_attr error_message("ERC721: approve to caller"):
-            assert_not_equal(caller, operator)
+        _set_approval_for_all(caller, operator, approved)
+        return ()
+    end
+
+    # Sets the approval of `operators[i]` to `approved[i]` for each `i`,
+    # reading the caller once for the whole batch.
+    func set_approvals_for_all{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(
+            operators_len: felt,
+            operators: felt*,
+            approved_len: felt,
+            approved: felt*
+        ):
+        with_attr error_message("ERC721: operators and approved length mismatch"):
+            assert operators_len = approved_len
         end
 
-        # Make sure `approved` is a boolean (0 or 1)
-        with_attr error_message("ERC721: approved is not a Cairo boolean"):
-            assert approved * (1 - approved) = 0
+        let (caller) = get_caller_address()
+        with_attr error_message("ERC721: either the caller or operator is the zero address"):
+            assert_not_zero(caller)
         end
 
-        ERC721_operator_approvals.write(owner=caller, operator=operator, value=approved)
-        ApprovalForAll.emit(caller, operator, approved)
+        _set_approvals_for_all(caller, operators_len, operators, approved)
         return ()
     end
 
@@ -255,18 +325,11 @@ namespace ERC721:
         with_attr error_message("ERC721: token_id is not a valid Uint256"):
             uint256_check(token_id)
         end
-        let (caller) = get_caller_address()
-        let (is_approved) = _is_approved_or_owner(caller, token_id)
-        with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
-            assert_not_zero(caller * is_approved)
-        end
-        # Note that if either `is_approved` or `caller` equals `0`,
-        # then this method should fail.
-        # The `caller` address and `is_approved` boolean are both field elements
-        # meaning that a*0==0 for all a in the field,
-        # therefore a*b==0 implies that at least one of a,b is zero in the field
+        _authorize_transfer(from_, to, token_id)
 
-        _transfer(from_, to, token_id)
+        let (from_balance: Uint256) = ERC721_balances.read(from_)
+        let (to_balance: Uint256) = ERC721_balances.read(to)
+        _move_token(from_, to, token_id, from_balance, to_balance)
         return ()
     end
 
@@ -282,11 +345,91 @@ namespace ERC721:
             data: felt*
         ):
         alloc_locals
-        with_attr error_message("ERC721: token_id is not a valid Uint256"):
-            uint256_check(token_id)
+        transfer_from(from_, to, token_id)
+
+        let (success) = _check_onERC721Received(from_, to, token_id, data_len, data)
+        with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+            assert_not_zero(success)
         end
+        return ()
+    end
+
+    # Transfers `token_ids` from `from_` to `to`. Operator approval is checked
+    # once for the whole batch and the balances are updated once at the end.
+    func batch_transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            token_ids_len: felt,
+            token_ids: Uint256*
+        ):
+        alloc_locals
         let (caller) = get_caller_address()
-        let (is_approved) = _is_approved_or_owner(caller, token_id)
+        with_attr error_message("ERC721: either the caller or from_ is the zero address"):
+            assert_not_zero(caller * from_)
+        end
+
+        with_attr error_message("ERC721: cannot transfer to the zero address"):
+            assert_not_zero(to)
+        end
+
+        # If the caller is neither the owner nor an operator, each token
+        # must be individually approved to the caller
+        let (is_authorized) = _is_owner_or_operator(from_, caller)
+        _batch_transfer(from_, to, caller, is_authorized, token_ids_len, token_ids)
+        _emit_batch_transfers(from_, to, token_ids_len, token_ids)
+
+        # Apply the balance deltas once
+        let (owner_bal) = ERC721_balances.read(from_)
+        let (new_balance: Uint256) = SafeUint256.sub_le(owner_bal, Uint256(token_ids_len, 0))
+        ERC721_balances.write(from_, new_balance)
+
+        let (receiver_bal) = ERC721_balances.read(to)
+        let (new_balance: Uint256) = SafeUint256.add(receiver_bal, Uint256(token_ids_len, 0))
+        ERC721_balances.write(to, new_balance)
+        return ()
+    end
+
+    func safe_batch_transfer_from{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            token_ids_len: felt,
+            token_ids: Uint256*,
+            data_len: felt,
+            data: felt*
+        ):
+        batch_transfer_from(from_, to, token_ids_len, token_ids)
+        _check_batch_onERC721Received(from_, to, token_ids_len, token_ids, data_len, data)
+        return ()
+    end
+
+    #
+    # Internals
+    #
+
+    # Checks that the caller can transfer `token_id` from `from_` to `to` and
+    # clears its approval. The owner and the approval are only read once.
+    func _authorize_transfer{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(from_: felt, to: felt, token_id: Uint256):
+        alloc_locals
+        let (caller) = get_caller_address()
+        let (owner) = ERC721_owners.read(token_id)
+        with_attr error_message("ERC721: token id does not exist"):
+            assert_not_zero(owner)
+        end
+
+        let (approved_addr) = ERC721_token_approvals.read(token_id)
+        let (is_approved) = _is_authorized(owner, approved_addr, caller)
         with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
             assert_not_zero(caller * is_approved)
         end
@@ -296,13 +439,39 @@ namespace ERC721:
         # meaning that a*0==0 for all a in the field,
         # therefore a*b==0 implies that at least one of a,b is zero in the field
 
-        _safe_transfer(from_, to, token_id, data_len, data)
+        with_attr error_message("ERC721: transfer from incorrect owner"):
+            assert owner = from_
+        end
+
+        with_attr error_message("ERC721: cannot transfer to the zero address"):
+            assert_not_zero(to)
+        end
+
+        # Clear approvals
+        _clear_approval(owner, approved_addr, token_id)
         return ()
     end
 
-    #
-    # Internals
-    #
+    # Moves `token_id` from `from_` to `to`, given their current balances.
+    # Does not check ownership nor approvals.
+    func _move_token{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            from_: felt,
+            to: felt,
+            token_id: Uint256,
+            from_balance: Uint256,
+            to_balance: Uint256
+        ):
+        _update_balances(from_, to, from_balance, to_balance)
+
+        # Update token_id owner
+        ERC721_owners.write(token_id, to)
+        Transfer.emit(from_, to, token_id)
+        return ()
+    end
 
     func assert_only_token_owner{
             pedersen_ptr: HashBuiltin*,
@@ -390,21 +559,12 @@ namespace ERC721:
         end
 
         # Clear approvals
-        _approve(0, token_id)
+        ERC721_token_approvals.write(token_id, 0)
+        Approval.emit(owner, 0, token_id)
 
-        # Decrease owner balance
-        let (owner_bal) = ERC721_balances.read(from_)
-        let (new_balance: Uint256) = SafeUint256.sub_le(owner_bal, Uint256(1, 0))
-        ERC721_balances.write(from_, new_balance)
-
-        # Increase receiver balance
-        let (receiver_bal) = ERC721_balances.read(to)
-        let (new_balance: Uint256) = SafeUint256.add(receiver_bal, Uint256(1, 0))
-        ERC721_balances.write(to, new_balance)
-
-        # Update token_id owner
-        ERC721_owners.write(token_id, to)
-        Transfer.emit(from_, to, token_id)
+        let (from_balance: Uint256) = ERC721_balances.read(from_)
+        let (to_balance: Uint256) = ERC721_balances.read(to)
+        _move_token(from_, to, token_id, from_balance, to_balance)
         return ()
     end
 
@@ -507,6 +667,63 @@ namespace ERC721:
         return ()
     end
 
+    # Mints `token_ids` to `to`. The balance of `to` is written once.
+    func _mint_batch{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        with_attr error_message("ERC721: cannot mint to the zero address"):
+            assert_not_zero(to)
+        end
+
+        _mint_tokens(to, token_ids_len, token_ids)
+        _emit_batch_transfers(0, to, token_ids_len, token_ids)
+
+        let (balance: Uint256) = ERC721_balances.read(to)
+        let (new_balance: Uint256) = SafeUint256.add(balance, Uint256(token_ids_len, 0))
+        ERC721_balances.write(to, new_balance)
+        return ()
+    end
+
+    # Burns `token_ids`, which must all be owned by `owner`.
+    # The balance of `owner` is written once.
+    func _burn_batch{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+        alloc_locals
+        with_attr error_message("ERC721: cannot burn from the zero address"):
+            assert_not_zero(owner)
+        end
+
+        _burn_tokens(owner, token_ids_len, token_ids)
+        _emit_batch_transfers(owner, 0, token_ids_len, token_ids)
+
+        let (balance: Uint256) = ERC721_balances.read(owner)
+        let (new_balance: Uint256) = SafeUint256.sub_le(balance, Uint256(token_ids_len, 0))
+        ERC721_balances.write(owner, new_balance)
+        return ()
+    end
+
+    func _safe_mint_batch{
+            pedersen_ptr: HashBuiltin*,
+            syscall_ptr: felt*,
+            range_check_ptr
+        }(
+            to: felt,
+            token_ids_len: felt,
+            token_ids: Uint256*,
+            data_len: felt,
+            data: felt*
+        ):
+        _mint_batch(to, token_ids_len, token_ids)
+        _check_batch_onERC721Received(0, to, token_ids_len, token_ids, data_len, data)
+        return ()
+    end
+
     func _set_token_uri{
             syscall_ptr: felt*,
             pedersen_ptr: HashBuiltin*,
@@ -522,12 +739,104 @@ namespace ERC721:
         return ()
     end
 
+    # When enabled, batch mints, transfers and burns emit a `ConsecutiveTransfer`
+    # event per run of consecutive token ids instead of a `Transfer` per token.
+    func _set_consecutive_transfer_event{
+            syscall_ptr: felt*,
+            pedersen_ptr: HashBuiltin*,
+            range_check_ptr
+        }(enabled: felt):
+        with_attr error_message("ERC721: enabled is not a Cairo boolean"):
+            assert enabled * (1 - enabled) = 0
+        end
+        ERC721_consecutive_transfer_event.write(enabled)
+        return ()
+    end
+
 end
 
 #
 # Private
 #
 
+func _set_approval_for_all{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, operator: felt, approved: felt):
+    with_attr error_message("ERC721: approve to caller"):
+        assert_not_equal(owner, operator)
+    end
+
+    # Make sure `approved` is a boolean (0 or 1)
+    with_attr error_message("ERC721: approved is not a Cairo boolean"):
+        assert approved * (1 - approved) = 0
+    end
+
+    ERC721_operator_approvals.write(owner=owner, operator=operator, value=approved)
+    ApprovalForAll.emit(owner, operator, approved)
+    return ()
+end
+
+func _set_approvals_for_all{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, operators_len: felt, operators: felt*, approved: felt*):
+    if operators_len == 0:
+        return ()
+    end
+
+    with_attr error_message("ERC721: either the caller or operator is the zero address"):
+        assert_not_zero([operators])
+    end
+    _set_approval_for_all(owner, [operators], [approved])
+    return _set_approvals_for_all(owner, operators_len - 1, operators + 1, approved + 1)
+end
+
+func _read_owners{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, owners: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    # Nonexistent and invalid token ids are never written, so they read as zero
+    let (owner) = ERC721_owners.read([token_ids])
+    assert [owners] = owner
+    return _read_owners(token_ids_len - 1, token_ids + Uint256.SIZE, owners + 1)
+end
+
+func _read_balances{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*, balances: Uint256*):
+    if accounts_len == 0:
+        return ()
+    end
+
+    let (balance: Uint256) = ERC721_balances.read([accounts])
+    assert [balances] = balance
+    return _read_balances(accounts_len - 1, accounts + 1, balances + Uint256.SIZE)
+end
+
+func _read_approvals{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, approved: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (approved_addr) = ERC721.get_approved([token_ids])
+    assert [approved] = approved_addr
+    return _read_approvals(token_ids_len - 1, token_ids + Uint256.SIZE, approved + 1)
+end
+
 func _check_onERC721Received{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
@@ -539,24 +848,343 @@ func _check_onERC721Received{
         data_len: felt,
         data: felt*
     ) -> (success: felt):
+    let (is_receiver, is_account) = _probe_receiver(to)
+    if is_receiver == TRUE:
+        _call_onERC721Received(from_, to, token_id, data_len, data)
+        return (TRUE)
+    end
+    return (is_account)
+end
+
+# Returns whether `to` implements IERC721Receiver or, failing that, is an
+# account. Accounts are only probed when `to` is not a receiver.
+func _probe_receiver{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(to: felt) -> (is_receiver: felt, is_account: felt):
+    let (is_receiver) = IERC165.supportsInterface(to, IERC721_RECEIVER_ID)
+    if is_receiver == TRUE:
+        return (TRUE, FALSE)
+    end
+
+    let (is_account) = IERC165.supportsInterface(to, IACCOUNT_ID)
+    return (FALSE, is_account)
+end
+
+func _call_onERC721Received{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_id: Uint256,
+        data_len: felt,
+        data: felt*
+    ):
     let (caller) = get_caller_address()
-    let (is_supported) = IERC165.supportsInterface(to, IERC721_RECEIVER_ID)
-    if is_supported == TRUE:
-        let (selector) = IERC721Receiver.onERC721Received(
-            to,
-            caller,
-            from_,
-            token_id,
-            data_len,
-            data
-        )
+    let (selector) = IERC721Receiver.onERC721Received(
+        to,
+        caller,
+        from_,
+        token_id,
+        data_len,
+        data
+    )
+
+    with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+        assert selector = IERC721_RECEIVER_ID
+    end
+    return ()
+end
 
-        with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
-            assert selector = IERC721_RECEIVER_ID
+func _is_owner_or_operator{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, spender: felt) -> (res: felt):
+    if owner == spender:
+        return (TRUE)
+    end
+
+    let (is_operator) = ERC721.is_approved_for_all(owner, spender)
+    return (is_operator)
+end
+
+func _batch_transfer{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        caller: felt,
+        is_authorized: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    alloc_locals
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id: Uint256 = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+
+    # Also rejects nonexistent tokens, since `from_` is not the zero address
+    let (owner) = ERC721_owners.read(token_id)
+    with_attr error_message("ERC721: transfer from incorrect owner"):
+        assert owner = from_
+    end
+
+    let (approved_addr) = ERC721_token_approvals.read(token_id)
+    if is_authorized == FALSE:
+        with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
+            assert approved_addr = caller
         end
+    end
+
+    # Clear approvals
+    ERC721_token_approvals.write(token_id, 0)
+    Approval.emit(from_, 0, token_id)
+
+    # Update token_id owner
+    ERC721_owners.write(token_id, to)
+    return _batch_transfer(from_, to, caller, is_authorized, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+# Same as `_check_onERC721Received` for every token of a batch, `to` is only
+# probed once. Receivers are still called for every token.
+func _check_batch_onERC721Received{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (is_receiver, is_account) = _probe_receiver(to)
+    if is_receiver == TRUE:
+        _call_batch_onERC721Received(from_, to, token_ids_len, token_ids, data_len, data)
+        return ()
+    end
+
+    with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+        assert is_account = TRUE
+    end
+    return ()
+end
+
+func _call_batch_onERC721Received{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    _call_onERC721Received(from_, to, [token_ids], data_len, data)
+    return _call_batch_onERC721Received(
+        from_, to, token_ids_len - 1, token_ids + Uint256.SIZE, data_len, data
+    )
+end
+
+func _is_authorized{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, approved_addr: felt, spender: felt) -> (res: felt):
+    if approved_addr == spender:
         return (TRUE)
     end
 
-    let (is_account) = IERC165.supportsInterface(to, IACCOUNT_ID)
-    return (is_account)
+    let (res) = _is_owner_or_operator(owner, spender)
+    return (res)
+end
+
+func _clear_approval{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, approved_addr: felt, token_id: Uint256):
+    # Skip the write when there is no approval to clear
+    if approved_addr != 0:
+        ERC721_token_approvals.write(token_id, 0)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
+
+    Approval.emit(owner, 0, token_id)
+    return ()
+end
+
+func _update_balances{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(from_: felt, to: felt, from_balance: Uint256, to_balance: Uint256):
+    # Transferring to oneself leaves the balance unchanged
+    if from_ == to:
+        return ()
+    end
+
+    # Decrease owner balance
+    let (new_balance: Uint256) = SafeUint256.sub_le(from_balance, Uint256(1, 0))
+    ERC721_balances.write(from_, new_balance)
+
+    # Increase receiver balance
+    let (new_balance: Uint256) = SafeUint256.add(to_balance, Uint256(1, 0))
+    ERC721_balances.write(to, new_balance)
+    return ()
+end
+
+func _mint_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id: Uint256 = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+
+    # Ensures token_id is unique, also within the batch
+    let (exists) = ERC721._exists(token_id)
+    with_attr error_message("ERC721: token already minted"):
+        assert exists = FALSE
+    end
+
+    ERC721_owners.write(token_id, to)
+    return _mint_tokens(to, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _burn_tokens{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id: Uint256 = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+
+    # Also rejects nonexistent tokens, since `owner` is not the zero address
+    let (token_owner) = ERC721_owners.read(token_id)
+    with_attr error_message("ERC721: burn from incorrect owner"):
+        assert token_owner = owner
+    end
+
+    # Clear approvals
+    let (approved_addr) = ERC721_token_approvals.read(token_id)
+    _clear_approval(owner, approved_addr, token_id)
+
+    # Delete owner
+    ERC721_owners.write(token_id, 0)
+    return _burn_tokens(owner, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+# Emits the transfer events of a batch, either one `Transfer` per token or
+# one `ConsecutiveTransfer` per run of consecutive token ids.
+func _emit_batch_transfers{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(from_: felt, to: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (consecutive) = ERC721_consecutive_transfer_event.read()
+    if consecutive == TRUE:
+        _emit_consecutive_transfers(
+            from_, to, [token_ids], [token_ids], token_ids_len - 1, token_ids + Uint256.SIZE
+        )
+        return ()
+    end
+
+    _emit_transfers(from_, to, token_ids_len, token_ids)
+    return ()
+end
+
+func _emit_transfers{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(from_: felt, to: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    Transfer.emit(from_, to, [token_ids])
+    return _emit_transfers(from_, to, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+# Extends the run from `first_id` to `last_id` while the next token id
+# follows `last_id`, and emits it once the run is over.
+func _emit_consecutive_transfers{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        first_id: Uint256,
+        last_id: Uint256,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    alloc_locals
+    if token_ids_len == 0:
+        ConsecutiveTransfer.emit(first_id, last_id, from_, to)
+        return ()
+    end
+
+    let token_id: Uint256 = [token_ids]
+    # `carry` is set when `last_id` is the maximum Uint256, which ends the run
+    let (next_id: Uint256, carry) = uint256_add(last_id, Uint256(1, 0))
+    let (is_next) = uint256_eq(token_id, next_id)
+    if is_next * (1 - carry) == TRUE:
+        return _emit_consecutive_transfers(
+            from_, to, first_id, token_id, token_ids_len - 1, token_ids + Uint256.SIZE
+        )
+    end
+
+    ConsecutiveTransfer.emit(first_id, last_id, from_, to)
+    return _emit_consecutive_transfers(
+        from_, to, token_id, token_id, token_ids_len - 1, token_ids + Uint256.SIZE
+    )
 end
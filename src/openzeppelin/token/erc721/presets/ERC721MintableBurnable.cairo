@@ -4,6 +4,7 @@
 %lang starknet
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
 from starkware.cairo.common.uint256 import Uint256
 
 from openzeppelin.access.ownable.library import Ownable
@@ -83,6 +84,28 @@ func ownerOf{
     return (owner)
 end
 
+@view
+func ownersOf{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        accounts_len: felt,
+        accounts: felt*
+    ) -> (
+        owners_len: felt,
+        owners: felt*,
+        balances_len: felt,
+        balances: Uint256*
+    ):
+    let (owners_len, owners, balances_len, balances) = ERC721.owners_of(
+        tokenIds_len, tokenIds, accounts_len, accounts
+    )
+    return (owners_len, owners, balances_len, balances)
+end
+
 @view
 func getApproved{
         syscall_ptr : felt*,
@@ -93,6 +116,16 @@ func getApproved{
     return (approved)
 end
 
+@view
+func getApprovedBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (approved_len: felt, approved: felt*):
+    let (approved_len, approved) = ERC721.get_approved_batch(tokenIds_len, tokenIds)
+    return (approved_len, approved)
+end
+
 @view
 func isApprovedForAll{
         syscall_ptr : felt*,
@@ -147,6 +180,21 @@ func setApprovalForAll{
     return ()
 end
 
+@external
+func setApprovalsForAll{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        operators_len: felt,
+        operators: felt*,
+        approved_len: felt,
+        approved: felt*
+    ):
+    ERC721.set_approvals_for_all(operators_len, operators, approved_len, approved)
+    return ()
+end
+
 @external
 func transferFrom{
         pedersen_ptr: HashBuiltin*,
@@ -177,6 +225,38 @@ func safeTransferFrom{
     return ()
 end
 
+@external
+func batchTransferFrom{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        tokenIds_len: felt,
+        tokenIds: Uint256*
+    ):
+    ERC721.batch_transfer_from(from_, to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func safeBatchTransferFrom{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    ERC721.safe_batch_transfer_from(from_, to, tokenIds_len, tokenIds, data_len, data)
+    return ()
+end
+
 @external
 func mint{
         pedersen_ptr: HashBuiltin*,
@@ -199,6 +279,32 @@ func burn{
     return ()
 end
 
+@external
+func mintBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        to: felt,
+        tokenIds_len: felt,
+        tokenIds: Uint256*
+    ):
+    Ownable.assert_only_owner()
+    ERC721._mint_batch(to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func burnBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*):
+    let (caller) = get_caller_address()
+    ERC721._burn_batch(caller, tokenIds_len, tokenIds)
+    return ()
+end
+
 @external
 func setTokenURI{
         pedersen_ptr: HashBuiltin*,
@@ -210,6 +316,17 @@ func setTokenURI{
     return ()
 end
 
+@external
+func setConsecutiveTransferEvent{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(enabled: felt):
+    Ownable.assert_only_owner()
+    ERC721._set_consecutive_transfer_event(enabled)
+    return ()
+end
+
 @external
 func transferOwnership{
         syscall_ptr: felt*,
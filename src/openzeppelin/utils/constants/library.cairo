@@ -26,8 +26,16 @@ const IERC721_RECEIVER_ID = 0x150b7a02
 const IERC721_METADATA_ID = 0x5b5e139f
 const IERC721_ENUMERABLE_ID = 0x780e9d63
 
+# ERC1155
+const IERC1155_ID = 0xd9b67a26
+const IERC1155_METADATA_URI_ID = 0x0e89341c
+const IERC1155_RECEIVER_ID = 0x4e2312e0
+const ON_ERC1155_RECEIVED_SELECTOR = 0xf23a6e61
+const ON_ERC1155_BATCH_RECEIVED_SELECTOR = 0xbc197c81
+
 # AccessControl
 const IACCESSCONTROL_ID = 0x7965db0b
+const IACCESSCONTROL_ENUMERABLE_ID = 0x5a05180f
 
 #
 # Roles
@@ -237,3 +237,163 @@ async def test_set_role_admin(accesscontrol_factory):
 
     expected = await accesscontrol.hasRole(DEFAULT_ADMIN_ROLE, account1.contract_address).invoke()
     assert expected.result.hasRole == FALSE
+
+
+@pytest.mark.asyncio
+async def test_grant_roles(accesscontrol_factory):
+    accesscontrol, account1, _ = accesscontrol_factory
+    users = [111, 222, 333]
+
+    tx_exec_info = await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'grantRoles',
+        [SOME_OTHER_ROLE, len(users), *users]
+    )
+
+    for user in users:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=accesscontrol.contract_address,
+            name='RoleGranted',
+            data=[SOME_OTHER_ROLE, user, account1.contract_address]
+        )
+        expected = await accesscontrol.hasRole(SOME_OTHER_ROLE, user).invoke()
+        assert expected.result.hasRole == TRUE
+
+    tx_exec_info = await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'revokeRoles',
+        [SOME_OTHER_ROLE, 2, *users[:2]]
+    )
+
+    for user in users[:2]:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=accesscontrol.contract_address,
+            name='RoleRevoked',
+            data=[SOME_OTHER_ROLE, user, account1.contract_address]
+        )
+        expected = await accesscontrol.hasRole(SOME_OTHER_ROLE, user).invoke()
+        assert expected.result.hasRole == FALSE
+
+    expected = await accesscontrol.hasRole(SOME_OTHER_ROLE, users[2]).invoke()
+    assert expected.result.hasRole == TRUE
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_unauthorized(accesscontrol_factory):
+    accesscontrol, _, account2 = accesscontrol_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account2,
+            accesscontrol.contract_address,
+            'grantRoles',
+            [SOME_OTHER_ROLE, 1, account2.contract_address]
+        ),
+        reverted_with="AccessControl: caller is missing role {}".format(
+            DEFAULT_ADMIN_ROLE
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_batch(accesscontrol_factory):
+    accesscontrol, account1, _ = accesscontrol_factory
+    roles = [SOME_OTHER_ROLE, SOME_OTHER_ROLE, SOME_OTHER_ROLE, DEFAULT_ADMIN_ROLE]
+    users = [111, 222, 333, 444]
+
+    tx_exec_info = await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'grantRolesBatch',
+        [len(roles), *roles, len(users), *users]
+    )
+
+    for role, user in zip(roles, users):
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=accesscontrol.contract_address,
+            name='RoleGranted',
+            data=[role, user, account1.contract_address]
+        )
+        expected = await accesscontrol.hasRole(role, user).invoke()
+        assert expected.result.hasRole == TRUE
+
+    await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'revokeRolesBatch',
+        [len(roles), *roles, len(users), *users]
+    )
+
+    for role, user in zip(roles, users):
+        expected = await accesscontrol.hasRole(role, user).invoke()
+        assert expected.result.hasRole == FALSE
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_batch_unauthorized(accesscontrol_factory):
+    accesscontrol, account1, account2 = accesscontrol_factory
+
+    # account2 administers SOME_OTHER_ROLE, but not DEFAULT_ADMIN_ROLE
+    await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'grantRole',
+        [SOME_OTHER_ROLE, account2.contract_address]
+    )
+    await signer.send_transaction(
+        account1,
+        accesscontrol.contract_address,
+        'setRoleAdmin',
+        [SOME_OTHER_ROLE, SOME_OTHER_ROLE]
+    )
+
+    await assert_revert(
+        signer.send_transaction(
+            account2,
+            accesscontrol.contract_address,
+            'grantRolesBatch',
+            [2, SOME_OTHER_ROLE, DEFAULT_ADMIN_ROLE, 2, 111, 222]
+        ),
+        reverted_with="AccessControl: caller is missing role {}".format(
+            DEFAULT_ADMIN_ROLE
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_batch_length_mismatch(accesscontrol_factory):
+    accesscontrol, account1, _ = accesscontrol_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account1,
+            accesscontrol.contract_address,
+            'grantRolesBatch',
+            [2, SOME_OTHER_ROLE, SOME_OTHER_ROLE, 1, 111]
+        ),
+        reverted_with="AccessControl: roles and users length mismatch"
+    )
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_batch_not_grouped(accesscontrol_factory):
+    accesscontrol, account1, _ = accesscontrol_factory
+    roles = [SOME_OTHER_ROLE, DEFAULT_ADMIN_ROLE, SOME_OTHER_ROLE]
+    users = [111, 222, 333]
+
+    for selector in ['grantRolesBatch', 'revokeRolesBatch']:
+        await assert_revert(
+            signer.send_transaction(
+                account1,
+                accesscontrol.contract_address,
+                selector,
+                [len(roles), *roles, len(users), *users]
+            ),
+            reverted_with="AccessControl: roles are not grouped"
+        )
+
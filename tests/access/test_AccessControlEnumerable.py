@@ -0,0 +1,203 @@
+import pytest
+from pathlib import Path
+from signers import MockSigner
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    TRUE,
+    assert_revert,
+    get_contract_class, cached_contract
+)
+
+DEFAULT_ADMIN_ROLE = 0
+SOME_OTHER_ROLE = 42
+IACCESSCONTROL_ID = 0x7965db0b
+IACCESSCONTROL_ENUMERABLE_ID = 0x5a05180f
+ACCOUNTS = 4
+
+signer = MockSigner(123456789987654321)
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    return {
+        Path(key).stem: get_contract_class(key)
+        for key in [
+            'Account',
+            'AccessControlEnumerable',
+        ]
+    }
+
+
+@pytest.fixture(scope='module')
+async def accesscontrol_init(contract_classes):
+    starknet = await Starknet.empty()
+    accounts = []
+    for _ in range(ACCOUNTS):
+        account = await starknet.deploy(
+            contract_class=contract_classes['Account'],
+            constructor_calldata=[signer.public_key]
+        )
+        accounts.append(account)
+    accesscontrol = await starknet.deploy(
+        contract_class=contract_classes['AccessControlEnumerable'],
+        constructor_calldata=[accounts[0].contract_address]
+    )
+    return starknet.state, accesscontrol, accounts
+
+
+@pytest.fixture
+def accesscontrol_factory(contract_classes, accesscontrol_init):
+    state, accesscontrol, accounts = accesscontrol_init
+    _state = state.copy()
+    accesscontrol = cached_contract(
+        _state, contract_classes['AccessControlEnumerable'], accesscontrol)
+    accounts = [
+        cached_contract(_state, contract_classes['Account'], account)
+        for account in accounts
+    ]
+    return accesscontrol, accounts
+
+
+async def grant_all(accesscontrol, admin, role, accounts):
+    for account in accounts:
+        await signer.send_transaction(
+            admin,
+            accesscontrol.contract_address,
+            'grantRole',
+            [role, account.contract_address]
+        )
+
+
+async def get_members(accesscontrol, role):
+    execution_info = await accesscontrol.getRoleMembers(role, 0, ACCOUNTS).invoke()
+    return execution_info.result.accounts
+
+
+@pytest.mark.asyncio
+async def test_initializer(accesscontrol_factory):
+    accesscontrol, accounts = accesscontrol_factory
+
+    for interface_id in [IACCESSCONTROL_ID, IACCESSCONTROL_ENUMERABLE_ID]:
+        execution_info = await accesscontrol.supportsInterface(interface_id).invoke()
+        assert execution_info.result == (TRUE,)
+
+    execution_info = await accesscontrol.getRoleMemberCount(DEFAULT_ADMIN_ROLE).invoke()
+    assert execution_info.result.count == 1
+    execution_info = await accesscontrol.getRoleMember(DEFAULT_ADMIN_ROLE, 0).invoke()
+    assert execution_info.result.account == accounts[0].contract_address
+
+
+@pytest.mark.asyncio
+async def test_grant_role(accesscontrol_factory):
+    accesscontrol, accounts = accesscontrol_factory
+    admin, *members = accounts
+
+    await grant_all(accesscontrol, admin, SOME_OTHER_ROLE, members)
+    # granting a role twice does not duplicate the member
+    await grant_all(accesscontrol, admin, SOME_OTHER_ROLE, members[:1])
+
+    execution_info = await accesscontrol.getRoleMemberCount(SOME_OTHER_ROLE).invoke()
+    assert execution_info.result.count == len(members)
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == [
+        member.contract_address for member in members
+    ]
+
+
+@pytest.mark.asyncio
+async def test_revoke_role(accesscontrol_factory):
+    accesscontrol, accounts = accesscontrol_factory
+    admin, first, second, third = accounts
+
+    await grant_all(accesscontrol, admin, SOME_OTHER_ROLE, [first, second, third])
+
+    # the last member takes the index of the removed member
+    await signer.send_transaction(
+        admin,
+        accesscontrol.contract_address,
+        'revokeRole',
+        [SOME_OTHER_ROLE, first.contract_address]
+    )
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == [
+        third.contract_address, second.contract_address
+    ]
+
+    # removing the last member only shortens the list
+    await signer.send_transaction(
+        second,
+        accesscontrol.contract_address,
+        'renounceRole',
+        [SOME_OTHER_ROLE, second.contract_address]
+    )
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == [third.contract_address]
+
+    # revoking a missing role is a no-op
+    await signer.send_transaction(
+        admin,
+        accesscontrol.contract_address,
+        'revokeRole',
+        [SOME_OTHER_ROLE, first.contract_address]
+    )
+    execution_info = await accesscontrol.getRoleMemberCount(SOME_OTHER_ROLE).invoke()
+    assert execution_info.result.count == 1
+
+    # a revoked member can be granted again
+    await grant_all(accesscontrol, admin, SOME_OTHER_ROLE, [first])
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == [
+        third.contract_address, first.contract_address
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_role_members_pages(accesscontrol_factory):
+    accesscontrol, accounts = accesscontrol_factory
+    admin, *members = accounts
+    addresses = [member.contract_address for member in members]
+
+    await grant_all(accesscontrol, admin, SOME_OTHER_ROLE, members)
+
+    execution_info = await accesscontrol.getRoleMembers(SOME_OTHER_ROLE, 0, 2).invoke()
+    assert execution_info.result.accounts == addresses[:2]
+
+    # the last page is truncated
+    execution_info = await accesscontrol.getRoleMembers(SOME_OTHER_ROLE, 2, 2).invoke()
+    assert execution_info.result.accounts == addresses[2:]
+
+    execution_info = await accesscontrol.getRoleMembers(SOME_OTHER_ROLE, len(members), 2).invoke()
+    assert execution_info.result.accounts == []
+
+
+@pytest.mark.asyncio
+async def test_get_role_member_out_of_bounds(accesscontrol_factory):
+    accesscontrol, _ = accesscontrol_factory
+
+    await assert_revert(
+        accesscontrol.getRoleMember(DEFAULT_ADMIN_ROLE, 1).invoke(),
+        reverted_with="AccessControlEnumerable: index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_grant_roles_batch(accesscontrol_factory):
+    accesscontrol, accounts = accesscontrol_factory
+    admin, first, second, third = accounts
+    roles = [SOME_OTHER_ROLE, SOME_OTHER_ROLE, DEFAULT_ADMIN_ROLE]
+    users = [first.contract_address, second.contract_address, third.contract_address]
+
+    await signer.send_transaction(
+        admin,
+        accesscontrol.contract_address,
+        'grantRolesBatch',
+        [len(roles), *roles, len(users), *users]
+    )
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == users[:2]
+    assert await get_members(accesscontrol, DEFAULT_ADMIN_ROLE) == [
+        admin.contract_address, third.contract_address
+    ]
+
+    await signer.send_transaction(
+        admin,
+        accesscontrol.contract_address,
+        'revokeRoles',
+        [SOME_OTHER_ROLE, 1, first.contract_address]
+    )
+    assert await get_members(accesscontrol, SOME_OTHER_ROLE) == [second.contract_address]
@@ -1,13 +1,21 @@
 import pytest
+from starkware.starknet.business_logic.state.state import BlockInfo
+from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.testing.starknet import Starknet
-from signers import MockSigner
-from utils import assert_revert, get_contract_class, cached_contract, TRUE
+from signers import MockSigner, MockSessionSigner, decode_framed_response
+from utils import (
+    assert_revert, get_contract_class, cached_contract, to_uint, str_to_felt, TRUE
+)
 
 
 signer = MockSigner(123456789987654321)
 other = MockSigner(987654321123456789)
+session = MockSessionSigner(555555555555555555)
 
 IACCOUNT_ID = 0xf10dbd44
+# nonces carry their channel in the high 128 bits
+CHANNEL_SHIFT = 2**128
+EXPIRES_AT = 1000
 
 
 @pytest.fixture(scope='module')
@@ -15,13 +23,14 @@ def contract_classes():
     account_cls = get_contract_class('Account')
     init_cls = get_contract_class("Initializable")
     attacker_cls = get_contract_class("AccountReentrancy")
+    erc20_cls = get_contract_class("ERC20")
 
-    return account_cls, init_cls, attacker_cls
+    return account_cls, init_cls, attacker_cls, erc20_cls
 
 
 @pytest.fixture(scope='module')
 async def account_init(contract_classes):
-    account_cls, init_cls, attacker_cls = contract_classes
+    account_cls, init_cls, attacker_cls, erc20_cls = contract_classes
     starknet = await Starknet.empty()
 
     account1 = await starknet.deploy(
@@ -44,22 +53,50 @@ async def account_init(contract_classes):
         contract_class=attacker_cls,
         constructor_calldata=[],
     )
+    erc20 = await starknet.deploy(
+        contract_class=erc20_cls,
+        constructor_calldata=[
+            str_to_felt("Token"),
+            str_to_felt("TKN"),
+            18,
+            *to_uint(1000),
+            account1.contract_address
+        ]
+    )
+    other_erc20 = await starknet.deploy(
+        contract_class=erc20_cls,
+        constructor_calldata=[
+            str_to_felt("Other Token"),
+            str_to_felt("OTKN"),
+            6,
+            *to_uint(1000),
+            account1.contract_address
+        ]
+    )
 
-    return starknet.state, account1, account2, initializable1, initializable2, attacker
+    return (
+        starknet.state, account1, account2, initializable1, initializable2, attacker, erc20,
+        other_erc20
+    )
 
 
 @pytest.fixture
 def account_factory(contract_classes, account_init):
-    account_cls, init_cls, attacker_cls = contract_classes
-    state, account1, account2, initializable1, initializable2, attacker = account_init
+    account_cls, init_cls, attacker_cls, erc20_cls = contract_classes
+    (
+        state, account1, account2, initializable1, initializable2, attacker, erc20,
+        other_erc20
+    ) = account_init
     _state = state.copy()
     account1 = cached_contract(_state, account_cls, account1)
     account2 = cached_contract(_state, account_cls, account2)
     initializable1 = cached_contract(_state, init_cls, initializable1)
     initializable2 = cached_contract(_state, init_cls, initializable2)
     attacker = cached_contract(_state, attacker_cls, attacker)
+    erc20 = cached_contract(_state, erc20_cls, erc20)
+    other_erc20 = cached_contract(_state, erc20_cls, other_erc20)
 
-    return account1, account2, initializable1, initializable2, attacker
+    return account1, account2, initializable1, initializable2, attacker, erc20, other_erc20
 
 
 @pytest.mark.asyncio
@@ -88,7 +125,7 @@ async def test_execute(account_factory):
 
 @pytest.mark.asyncio
 async def test_multicall(account_factory):
-    account, _, initializable_1, initializable_2, _ = account_factory
+    account, _, initializable_1, initializable_2, *_ = account_factory
 
     execution_info = await initializable_1.initialized().call()
     assert execution_info.result == (0,)
@@ -122,6 +159,62 @@ async def test_return_value(account_factory):
     assert read_info.result.response == [call_result]  # 1
 
 
+@pytest.mark.asyncio
+async def test_discard_responses(account_factory):
+    account, _, initializable, *_ = account_factory
+    calls = [(initializable.contract_address, 'initialized', [])] * 3
+
+    read_info = await signer.send_transactions(account, calls)
+    assert read_info.result.response == [0, 0, 0]
+
+    await signer.send_transactions(account, [(account.contract_address, 'set_discard_responses', [TRUE])])
+
+    execution_info = await account.get_discard_responses().call()
+    assert execution_info.result == (TRUE,)
+
+    # calls are still executed, but their responses are not returned
+    read_info = await signer.send_transactions(
+        account, calls + [(initializable.contract_address, 'initialize', [])]
+    )
+    assert read_info.result.response == []
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (1,)
+
+
+@pytest.mark.asyncio
+async def test_frame_responses(account_factory):
+    account, _, initializable, *_ = account_factory
+
+    await signer.send_transactions(account, [(account.contract_address, 'set_frame_responses', [TRUE])])
+
+    execution_info = await account.get_frame_responses().call()
+    assert execution_info.result == (TRUE,)
+
+    read_info = await signer.send_transactions(
+        account,
+        [
+            (initializable.contract_address, 'initialized', []),
+            (initializable.contract_address, 'initialize', []),
+            (initializable.contract_address, 'initialized', [])
+        ]
+    )
+
+    # each response is prefixed with its length
+    assert read_info.result.response == [1, 0, 0, 1, 1]
+    assert decode_framed_response(read_info.result.response) == [[0], [], [1]]
+
+
+@pytest.mark.asyncio
+async def test_discard_responses_different_account(account_factory):
+    account, bad_account, *_ = account_factory
+
+    await assert_revert(
+        signer.send_transactions(bad_account, [(account.contract_address, 'set_discard_responses', [TRUE])]),
+        reverted_with="Account: caller is not this account"
+    )
+
+
 @ pytest.mark.asyncio
 async def test_nonce(account_factory):
     account, _, initializable, *_ = account_factory
@@ -151,6 +244,60 @@ async def test_nonce(account_factory):
     assert execution_info.result == (1,)
 
 
+@pytest.mark.asyncio
+async def test_nonce_channels(account_factory):
+    account, _, initializable, *_ = account_factory
+    calls = [(initializable.contract_address, 'initialized', [])]
+
+    execution_info = await account.get_channel_nonce(1).call()
+    first_nonce = execution_info.result.res
+    assert first_nonce == CHANNEL_SHIFT
+
+    execution_info = await account.get_channel_nonce(2).call()
+    other_nonce = execution_info.result.res
+    assert other_nonce == 2 * CHANNEL_SHIFT
+
+    # channels are ordered independently
+    await signer.send_transactions(account, calls, first_nonce)
+    await signer.send_transactions(account, calls, other_nonce)
+    await signer.send_transactions(account, calls, first_nonce + 1)
+
+    # replayed nonce
+    await assert_revert(
+        signer.send_transactions(account, calls, first_nonce),
+        reverted_with="Account: nonce is invalid"
+    )
+
+    # skipped nonce
+    await assert_revert(
+        signer.send_transactions(account, calls, other_nonce + 2),
+        reverted_with="Account: nonce is invalid"
+    )
+
+    execution_info = await account.get_channel_nonce(1).call()
+    assert execution_info.result.res == first_nonce + 2
+
+    execution_info = await account.get_channel_nonce(2).call()
+    assert execution_info.result.res == other_nonce + 1
+
+    # the default channel is left untouched
+    execution_info = await account.get_nonce().call()
+    assert execution_info.result == (0,)
+
+    execution_info = await account.get_channel_nonce(0).call()
+    assert execution_info.result == (0,)
+
+
+@pytest.mark.asyncio
+async def test_nonce_channel_out_of_range(account_factory):
+    account, *_ = account_factory
+
+    await assert_revert(
+        account.get_channel_nonce(2**123).call(),
+        reverted_with="Account: channel is out of range"
+    )
+
+
 @pytest.mark.asyncio
 async def test_public_key_setter(account_factory):
     account, *_ = account_factory
@@ -181,7 +328,7 @@ async def test_public_key_setter_different_account(account_factory):
 
 @pytest.mark.asyncio
 async def test_account_takeover_with_reentrant_call(account_factory):
-    account, _, _, _, attacker = account_factory
+    account, _, _, _, attacker, *_ = account_factory
 
     await assert_revert(
         signer.send_transaction(account, attacker.contract_address, 'account_takeover', []),
@@ -190,3 +337,209 @@ async def test_account_takeover_with_reentrant_call(account_factory):
     
     execution_info = await account.get_public_key().call()
     assert execution_info.result == (signer.public_key,)
+
+
+def set_block_timestamp(contract, block_timestamp):
+    contract.state.state.block_info = BlockInfo.create_for_testing(
+        contract.state.state.block_info.block_number, block_timestamp
+    )
+
+
+async def add_session_key(account, scopes, spending_caps=[], session_key=session.public_key):
+    await signer.send_transaction(account, account.contract_address, 'add_session_key', [
+        session_key,
+        EXPIRES_AT,
+        len(scopes),
+        *[x for (to, selector_name) in scopes for x in (to, get_selector_from_name(selector_name))],
+        len(spending_caps),
+        *[x for (token, cap) in spending_caps for x in (token, *cap)]
+    ])
+
+
+@pytest.mark.asyncio
+async def test_session_key(account_factory):
+    account, _, initializable, *_ = account_factory
+
+    await add_session_key(account, [(initializable.contract_address, 'initialize')])
+
+    execution_info = await account.get_session_key(session.public_key).call()
+    assert execution_info.result == (EXPIRES_AT,)
+
+    await session.send_transaction(account, initializable.contract_address, 'initialize', [])
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (1,)
+
+    # session keys share the nonce of the account
+    execution_info = await account.get_nonce().call()
+    assert execution_info.result == (2,)
+
+
+@pytest.mark.asyncio
+async def test_session_key_out_of_scope(account_factory):
+    account, _, initializable_1, initializable_2, *_ = account_factory
+
+    await add_session_key(account, [
+        (initializable_1.contract_address, 'initialize'),
+        (account.contract_address, 'set_public_key')
+    ])
+
+    await assert_revert(
+        session.send_transaction(account, initializable_2.contract_address, 'initialize', []),
+        reverted_with="Account: call not allowed by session key"
+    )
+
+    await assert_revert(
+        session.send_transaction(account, initializable_1.contract_address, 'initialized', []),
+        reverted_with="Account: call not allowed by session key"
+    )
+
+    # session keys cannot manage the account, even if allowed to
+    await assert_revert(
+        session.send_transaction(account, account.contract_address, 'set_public_key', [session.public_key]),
+        reverted_with="Account: call not allowed by session key"
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_key_expired_or_revoked(account_factory):
+    account, _, initializable, *_ = account_factory
+    calls = [(initializable.contract_address, 'initialize', [])]
+
+    # unknown key
+    await assert_revert(
+        session.send_transactions(account, calls),
+        reverted_with="Account: session key is expired or revoked"
+    )
+
+    await add_session_key(account, [(initializable.contract_address, 'initialize')])
+
+    set_block_timestamp(account, EXPIRES_AT)
+    await assert_revert(
+        session.send_transactions(account, calls),
+        reverted_with="Account: session key is expired or revoked"
+    )
+
+    set_block_timestamp(account, EXPIRES_AT - 1)
+    await signer.send_transaction(account, account.contract_address, 'revoke_session_key', [session.public_key])
+
+    execution_info = await account.get_session_key(session.public_key).call()
+    assert execution_info.result.expires_at == 0
+
+    await assert_revert(
+        session.send_transactions(account, calls),
+        reverted_with="Account: session key is expired or revoked"
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_key_invalid_signature(account_factory):
+    account, _, initializable, *_ = account_factory
+
+    await add_session_key(account, [(initializable.contract_address, 'initialize')])
+
+    # registered key, signed by another one
+    await assert_revert(
+        account.__execute__(
+            [(initializable.contract_address, get_selector_from_name('initialize'), 0, 0)], [], 1
+        ).invoke(signature=[session.public_key, 1, 2]),
+        reverted_with="Account: invalid session signature"
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_key_spending_cap(account_factory):
+    account, recipient, *_, erc20, _ = account_factory
+
+    await add_session_key(account, [
+        (erc20.contract_address, 'transfer'),
+        (erc20.contract_address, 'approve')
+    ], spending_caps=[(erc20.contract_address, to_uint(100))])
+
+    await session.send_transactions(account, [
+        (erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(40)]),
+        (erc20.contract_address, 'approve', [recipient.contract_address, *to_uint(20)])
+    ])
+
+    execution_info = await account.get_session_spending(session.public_key, erc20.contract_address).call()
+    assert execution_info.result == (to_uint(100), to_uint(60))
+
+    await assert_revert(
+        session.send_transaction(
+            account, erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(41)]
+        ),
+        reverted_with="Account: session spending cap exceeded"
+    )
+
+    await session.send_transaction(
+        account, erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(40)]
+    )
+
+    execution_info = await erc20.balanceOf(recipient.contract_address).call()
+    assert execution_info.result.balance == to_uint(80)
+
+    # registering the key again resets its spending
+    await add_session_key(
+        account, [(erc20.contract_address, 'transfer')],
+        spending_caps=[(erc20.contract_address, to_uint(100))]
+    )
+
+    execution_info = await account.get_session_spending(session.public_key, erc20.contract_address).call()
+    assert execution_info.result.spent == to_uint(0)
+
+    # and its scopes
+    await assert_revert(
+        session.send_transaction(
+            account, erc20.contract_address, 'approve', [recipient.contract_address, *to_uint(1)]
+        ),
+        reverted_with="Account: call not allowed by session key"
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_key_spending_caps_per_token(account_factory):
+    account, recipient, *_, erc20, other_erc20 = account_factory
+
+    await add_session_key(account, [
+        (erc20.contract_address, 'transfer'),
+        (other_erc20.contract_address, 'transfer')
+    ], spending_caps=[
+        (erc20.contract_address, to_uint(100)),
+        (other_erc20.contract_address, to_uint(10))
+    ])
+
+    # each token is spent against its own cap
+    await session.send_transactions(account, [
+        (erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(90)]),
+        (other_erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(10)])
+    ])
+
+    execution_info = await account.get_session_spending(session.public_key, erc20.contract_address).call()
+    assert execution_info.result == (to_uint(100), to_uint(90))
+    execution_info = await account.get_session_spending(session.public_key, other_erc20.contract_address).call()
+    assert execution_info.result == (to_uint(10), to_uint(10))
+
+    await assert_revert(
+        session.send_transaction(
+            account, other_erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(1)]
+        ),
+        reverted_with="Account: session spending cap exceeded"
+    )
+
+    await session.send_transaction(
+        account, erc20.contract_address, 'transfer', [recipient.contract_address, *to_uint(10)]
+    )
+    execution_info = await erc20.balanceOf(recipient.contract_address).call()
+    assert execution_info.result.balance == to_uint(100)
+
+
+@pytest.mark.asyncio
+async def test_add_session_key_different_account(account_factory):
+    account, bad_account, initializable, *_ = account_factory
+
+    await assert_revert(
+        signer.send_transaction(bad_account, account.contract_address, 'add_session_key', [
+            session.public_key, EXPIRES_AT, 0, 0
+        ]),
+        reverted_with="Account: caller is not this account"
+    )
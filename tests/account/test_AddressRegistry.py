@@ -5,38 +5,54 @@ from utils import get_contract_class, cached_contract
 
 
 signer = MockSigner(123456789987654321)
+other = MockSigner(987654321123456789)
 L1_ADDRESS = 0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984
 ANOTHER_ADDRESS = 0xd9e1ce17f2641f24ae83637ab66a2cca9c378b9f
 
 
 @pytest.fixture(scope='module')
-async def registry_factory():
-    # contract classes
+def contract_classes():
     registry_cls = get_contract_class("AddressRegistry")
     account_cls = get_contract_class('Account')
 
-    # deployments
+    return registry_cls, account_cls
+
+
+@pytest.fixture(scope='module')
+async def registry_init(contract_classes):
+    registry_cls, account_cls = contract_classes
     starknet = await Starknet.empty()
     account = await starknet.deploy(
         contract_class=account_cls,
         constructor_calldata=[signer.public_key]
     )
+    other_account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[other.public_key]
+    )
     registry = await starknet.deploy(
         contract_class=registry_cls,
         constructor_calldata=[]
     )
 
-    # cache contracts
-    state = starknet.state.copy()
-    account = cached_contract(state, account_cls, account)
-    registry = cached_contract(state, registry_cls, registry)
+    return starknet.state, account, registry, other_account
+
 
-    return account, registry
+@pytest.fixture
+def registry_factory(contract_classes, registry_init):
+    registry_cls, account_cls = contract_classes
+    state, account, registry, other_account = registry_init
+    _state = state.copy()
+    account = cached_contract(_state, account_cls, account)
+    other_account = cached_contract(_state, account_cls, other_account)
+    registry = cached_contract(_state, registry_cls, registry)
+
+    return account, registry, other_account
 
 
 @pytest.mark.asyncio
 async def test_set_address(registry_factory):
-    account, registry = registry_factory
+    account, registry, _ = registry_factory
 
     await signer.send_transaction(
         account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
@@ -47,7 +63,7 @@ async def test_set_address(registry_factory):
 
 @pytest.mark.asyncio
 async def test_update_address(registry_factory):
-    account, registry = registry_factory
+    account, registry, _ = registry_factory
 
     await signer.send_transaction(
         account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
@@ -61,3 +77,92 @@ async def test_update_address(registry_factory):
     )
     execution_info = await registry.get_L1_address(account.contract_address).call()
     assert execution_info.result == (ANOTHER_ADDRESS,)
+
+
+@pytest.mark.asyncio
+async def test_reverse_address(registry_factory):
+    account, registry, _ = registry_factory
+
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
+    )
+    execution_info = await registry.get_L2_address(L1_ADDRESS).call()
+    assert execution_info.result == (account.contract_address,)
+
+    # updates release the previous L1 address
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [ANOTHER_ADDRESS]
+    )
+    execution_info = await registry.get_L2_address(L1_ADDRESS).call()
+    assert execution_info.result == (0,)
+    execution_info = await registry.get_L2_address(ANOTHER_ADDRESS).call()
+    assert execution_info.result == (account.contract_address,)
+
+    # and so does unsetting it
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [0]
+    )
+    execution_info = await registry.get_L2_address(ANOTHER_ADDRESS).call()
+    assert execution_info.result == (0,)
+    execution_info = await registry.get_L1_address(account.contract_address).call()
+    assert execution_info.result == (0,)
+
+
+@pytest.mark.asyncio
+async def test_set_shared_address(registry_factory):
+    account, registry, other_account = registry_factory
+
+    # two accounts can register the same L1 address
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
+    )
+    await other.send_transaction(
+        other_account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
+    )
+    execution_info = await registry.get_L1_addresses([
+        account.contract_address, other_account.contract_address
+    ]).call()
+    assert execution_info.result.L1_addresses == [L1_ADDRESS, L1_ADDRESS]
+
+    # the reverse index follows the latest registration
+    execution_info = await registry.get_L2_address(L1_ADDRESS).call()
+    assert execution_info.result == (other_account.contract_address,)
+
+    # and is kept when an earlier holder changes away
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [ANOTHER_ADDRESS]
+    )
+    execution_info = await registry.get_L2_address(L1_ADDRESS).call()
+    assert execution_info.result == (other_account.contract_address,)
+
+    # but cleared when the latest holder does
+    await other.send_transaction(
+        other_account, registry.contract_address, 'set_L1_address', [0]
+    )
+    execution_info = await registry.get_L2_address(L1_ADDRESS).call()
+    assert execution_info.result == (0,)
+
+
+@pytest.mark.asyncio
+async def test_bulk_addresses(registry_factory):
+    account, registry, other_account = registry_factory
+    unknown_address = 123
+
+    await signer.send_transaction(
+        account, registry.contract_address, 'set_L1_address', [L1_ADDRESS]
+    )
+    await other.send_transaction(
+        other_account, registry.contract_address, 'set_L1_address', [ANOTHER_ADDRESS]
+    )
+
+    execution_info = await registry.get_L1_addresses([
+        other_account.contract_address, unknown_address, account.contract_address
+    ]).call()
+    assert execution_info.result.L1_addresses == [ANOTHER_ADDRESS, 0, L1_ADDRESS]
+
+    execution_info = await registry.get_L2_addresses([
+        L1_ADDRESS, unknown_address, ANOTHER_ADDRESS
+    ]).call()
+    assert execution_info.result.L2_addresses == [
+        account.contract_address, 0, other_account.contract_address
+    ]
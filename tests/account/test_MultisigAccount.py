@@ -0,0 +1,191 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockMultisigSigner
+from utils import assert_revert, get_contract_class, cached_contract, TRUE
+
+
+signer = MockMultisigSigner([123456789987654321, 987654321123456789, 555555555555555555])
+# shares the first two keys of `signer`, then uses two unknown keys
+other = MockMultisigSigner([123456789987654321, 987654321123456789, 111111111111111111, 222222222222222222])
+
+THRESHOLD = 2
+IACCOUNT_ID = 0xf10dbd44
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('MultisigAccount')
+    init_cls = get_contract_class("Initializable")
+
+    return account_cls, init_cls
+
+
+@pytest.fixture(scope='module')
+async def account_init(contract_classes):
+    account_cls, init_cls = contract_classes
+    starknet = await Starknet.empty()
+
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[len(signer.public_keys), *signer.public_keys, THRESHOLD]
+    )
+    initializable = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[],
+    )
+
+    return starknet, account, initializable
+
+
+@pytest.fixture
+def account_factory(contract_classes, account_init):
+    account_cls, init_cls = contract_classes
+    starknet, account, initializable = account_init
+    _state = starknet.state.copy()
+    account = cached_contract(_state, account_cls, account)
+    initializable = cached_contract(_state, init_cls, initializable)
+
+    return account, initializable
+
+
+@pytest.mark.asyncio
+async def test_constructor(account_factory):
+    account, _ = account_factory
+
+    execution_info = await account.get_signers().call()
+    assert execution_info.result.signers == signer.public_keys
+
+    execution_info = await account.get_threshold().call()
+    assert execution_info.result == (THRESHOLD,)
+
+    execution_info = await account.supportsInterface(IACCOUNT_ID).call()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('threshold', [0, 4])
+async def test_constructor_invalid_threshold(contract_classes, account_init, threshold):
+    account_cls, _ = contract_classes
+    starknet, *_ = account_init
+
+    await assert_revert(
+        starknet.deploy(
+            contract_class=account_cls,
+            constructor_calldata=[len(signer.public_keys), *signer.public_keys, threshold]
+        ),
+        reverted_with="MultisigAccount: invalid threshold"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('signer_indexes', [[0, 1], [0, 2], [1, 2], [0, 1, 2]])
+async def test_execute(account_factory, signer_indexes):
+    account, initializable = account_factory
+
+    await signer.send_transaction(account, initializable.contract_address, 'initialize', [], signer_indexes)
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (1,)
+
+    execution_info = await account.get_nonce().call()
+    assert execution_info.result.res == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_not_enough_signatures(account_factory):
+    account, initializable = account_factory
+
+    await assert_revert(
+        signer.send_transaction(account, initializable.contract_address, 'initialize', [], [1]),
+        reverted_with="MultisigAccount: not enough signatures"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('signer_indexes', [[1, 1], [2, 0]])
+async def test_execute_duplicate_or_unsorted_signers(account_factory, signer_indexes):
+    account, initializable = account_factory
+
+    await assert_revert(
+        signer.send_transaction(account, initializable.contract_address, 'initialize', [], signer_indexes),
+        reverted_with="MultisigAccount: invalid or duplicate signer index"
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_signer_index_out_of_range(account_factory):
+    account, initializable = account_factory
+
+    await assert_revert(
+        other.send_transaction(account, initializable.contract_address, 'initialize', [], [0, 3]),
+        reverted_with="MultisigAccount: invalid or duplicate signer index"
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_invalid_signature(account_factory):
+    account, initializable = account_factory
+
+    # index 2 is signed with a key that is not a signer
+    await assert_revert(
+        other.send_transaction(account, initializable.contract_address, 'initialize', [], [0, 2]),
+        reverted_with="MultisigAccount: invalid signature"
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_threshold(account_factory):
+    account, _ = account_factory
+
+    await signer.send_transaction(account, account.contract_address, 'set_threshold', [3], [0, 1])
+
+    execution_info = await account.get_threshold().call()
+    assert execution_info.result == (3,)
+
+    await assert_revert(
+        signer.send_transaction(account, account.contract_address, 'set_threshold', [2], [0, 1]),
+        reverted_with="MultisigAccount: not enough signatures"
+    )
+
+    await assert_revert(
+        signer.send_transaction(account, account.contract_address, 'set_threshold', [4], [0, 1, 2]),
+        reverted_with="MultisigAccount: invalid threshold"
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_signer(account_factory):
+    account, initializable = account_factory
+
+    # rotate the third key to the one `other` holds at index 2
+    await signer.send_transaction(
+        account, account.contract_address, 'set_signer', [2, other.public_keys[2]], [0, 1]
+    )
+
+    execution_info = await account.get_signers().call()
+    assert execution_info.result.signers == other.public_keys[:3]
+
+    await other.send_transaction(account, initializable.contract_address, 'initialize', [], [0, 2])
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (1,)
+
+    await assert_revert(
+        signer.send_transaction(account, account.contract_address, 'set_signer', [3, 0], [0, 1]),
+        reverted_with="MultisigAccount: signer index out of range"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setters_only_self(account_factory):
+    account, _ = account_factory
+
+    await assert_revert(
+        account.set_threshold(1).invoke(),
+        reverted_with="Account: caller is not this account"
+    )
+
+    await assert_revert(
+        account.set_signer(0, 0).invoke(),
+        reverted_with="Account: caller is not this account"
+    )
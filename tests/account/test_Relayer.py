@@ -0,0 +1,191 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import (
+    MockSigner, MockEthSigner, get_relayed_hash, pack_relayed_bundles
+)
+from utils import assert_revert, get_contract_class, cached_contract, TRUE
+
+
+signer = MockSigner(123456789987654321)
+other = MockSigner(987654321123456789)
+eth_signer = MockEthSigner(b'\x01' * 32)
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    eth_account_cls = get_contract_class('EthAccount')
+    relayer_cls = get_contract_class('Relayer')
+    init_cls = get_contract_class("Initializable")
+
+    return account_cls, eth_account_cls, relayer_cls, init_cls
+
+
+@pytest.fixture(scope='module')
+async def relayer_init(contract_classes):
+    account_cls, eth_account_cls, relayer_cls, init_cls = contract_classes
+    starknet = await Starknet.empty()
+
+    operator = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[other.public_key]
+    )
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    eth_account = await starknet.deploy(
+        contract_class=eth_account_cls,
+        constructor_calldata=[eth_signer.eth_address]
+    )
+    relayer = await starknet.deploy(
+        contract_class=relayer_cls,
+        constructor_calldata=[]
+    )
+    initializable1 = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[],
+    )
+    initializable2 = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[],
+    )
+
+    return (
+        starknet.state, operator, account, eth_account, relayer,
+        initializable1, initializable2
+    )
+
+
+@pytest.fixture
+def relayer_factory(contract_classes, relayer_init):
+    account_cls, eth_account_cls, relayer_cls, init_cls = contract_classes
+    state, operator, account, eth_account, relayer, init1, init2 = relayer_init
+    _state = state.copy()
+    operator = cached_contract(_state, account_cls, operator)
+    account = cached_contract(_state, account_cls, account)
+    eth_account = cached_contract(_state, eth_account_cls, eth_account)
+    relayer = cached_contract(_state, relayer_cls, relayer)
+    init1 = cached_contract(_state, init_cls, init1)
+    init2 = cached_contract(_state, init_cls, init2)
+
+    return operator, account, eth_account, relayer, init1, init2
+
+
+async def relay(operator, relayer, bundles):
+    bundles, call_array, calldata, signatures = pack_relayed_bundles(bundles)
+    return await other.send_transaction(operator, relayer.contract_address, 'relay', [
+        len(bundles), *[x for bundle in bundles for x in bundle],
+        len(call_array), *[x for call in call_array for x in call],
+        len(calldata), *calldata,
+        len(signatures), *signatures
+    ])
+
+
+@pytest.mark.asyncio
+async def test_get_relayed_hash(relayer_factory):
+    _, account, _, _, initializable, _ = relayer_factory
+
+    (address, call_array, calldata, nonce, _) = await signer.sign_relayed_transactions(
+        account, [(initializable.contract_address, 'initialize', [])]
+    )
+
+    execution_info = await account.get_relayed_hash(call_array, calldata, nonce).call()
+    assert execution_info.result.hash == get_relayed_hash(address, call_array, calldata, nonce)
+
+
+@pytest.mark.asyncio
+async def test_relay(relayer_factory):
+    operator, account, eth_account, relayer, init1, init2 = relayer_factory
+
+    bundles = [
+        await signer.sign_relayed_transactions(
+            account, [(init1.contract_address, 'initialize', [])]
+        ),
+        await eth_signer.sign_relayed_transactions(
+            eth_account, [(init2.contract_address, 'initialize', [])]
+        )
+    ]
+    await relay(operator, relayer, bundles)
+
+    execution_info = await init1.initialized().call()
+    assert execution_info.result == (TRUE,)
+    execution_info = await init2.initialized().call()
+    assert execution_info.result == (TRUE,)
+
+    # the relayed calls consumed the nonces of the signers
+    execution_info = await account.get_nonce().call()
+    assert execution_info.result.res == 1
+    execution_info = await eth_account.get_nonce().call()
+    assert execution_info.result.res == 1
+    execution_info = await operator.get_nonce().call()
+    assert execution_info.result.res == 1
+
+
+@pytest.mark.asyncio
+async def test_relay_sequential_bundles(relayer_factory):
+    operator, account, _, relayer, init1, init2 = relayer_factory
+
+    bundles = [
+        await signer.sign_relayed_transactions(
+            account, [(init1.contract_address, 'initialize', [])], nonce=0
+        ),
+        await signer.sign_relayed_transactions(
+            account, [(init2.contract_address, 'initialize', [])], nonce=1
+        )
+    ]
+    await relay(operator, relayer, bundles)
+
+    execution_info = await account.get_nonce().call()
+    assert execution_info.result.res == 2
+
+
+@pytest.mark.asyncio
+async def test_relay_invalid_signature(relayer_factory):
+    operator, account, _, relayer, initializable, _ = relayer_factory
+
+    # signed with a key that does not own the account
+    bundle = await other.sign_relayed_transactions(
+        account, [(initializable.contract_address, 'initialize', [])]
+    )
+
+    await assert_revert(
+        relay(operator, relayer, [bundle]),
+        reverted_with="Account: invalid signature"
+    )
+
+
+@pytest.mark.asyncio
+async def test_relay_replayed_bundle(relayer_factory):
+    operator, account, _, relayer, initializable, _ = relayer_factory
+
+    bundle = await signer.sign_relayed_transactions(
+        account, [(initializable.contract_address, 'initialize', [])]
+    )
+    await relay(operator, relayer, [bundle])
+
+    await assert_revert(
+        relay(operator, relayer, [bundle]),
+        reverted_with="Account: nonce is invalid"
+    )
+
+
+@pytest.mark.asyncio
+async def test_relay_bundle_out_of_bounds(relayer_factory):
+    operator, account, _, relayer, initializable, _ = relayer_factory
+
+    bundle = await signer.sign_relayed_transactions(
+        account, [(initializable.contract_address, 'initialize', [])]
+    )
+    bundles, call_array, calldata, signatures = pack_relayed_bundles([bundle])
+
+    await assert_revert(
+        other.send_transaction(operator, relayer.contract_address, 'relay', [
+            len(bundles), *[x for bundle in bundles for x in bundle],
+            len(call_array), *[x for call in call_array for x in call],
+            len(calldata), *calldata,
+            # drop the last felt of the signature
+            len(signatures) - 1, *signatures[:-1]
+        ]),
+        reverted_with="Relayer: bundle out of bounds"
+    )
@@ -0,0 +1,159 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import assert_revert, get_contract_class, cached_contract, TRUE, FALSE
+from signers import MockEthSigner
+
+signer = MockEthSigner(b'\x01' * 32)
+other = MockEthSigner(b'\x02' * 32)
+
+IACCOUNT_ID = 0xf10dbd44
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_cls = get_contract_class('Secp256k1Account')
+    init_cls = get_contract_class("Initializable")
+
+    return account_cls, init_cls
+
+
+@pytest.fixture(scope='module')
+async def account_init(contract_defs):
+    account_cls, init_cls = contract_defs
+    starknet = await Starknet.empty()
+
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[*signer.public_key_x, *signer.public_key_y]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[*signer.public_key_x, *signer.public_key_y]
+    )
+    initializable = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[],
+    )
+
+    return starknet, account1, account2, initializable
+
+
+@pytest.fixture
+def account_factory(contract_defs, account_init):
+    account_cls, init_cls = contract_defs
+    _, account1, account2, initializable = account_init
+    _state = account1.state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    initializable = cached_contract(_state, init_cls, initializable)
+
+    return account1, account2, initializable
+
+
+@pytest.mark.asyncio
+async def test_constructor(account_factory):
+    account, *_ = account_factory
+
+    execution_info = await account.get_public_key().call()
+    assert execution_info.result == (signer.public_key_x, signer.public_key_y)
+
+    execution_info = await account.supportsInterface(IACCOUNT_ID).call()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+async def test_constructor_invalid_public_key(contract_defs, account_init):
+    account_cls, _ = contract_defs
+    starknet, *_ = account_init
+
+    # not on the curve
+    await assert_revert(
+        starknet.deploy(
+            contract_class=account_cls,
+            constructor_calldata=[*signer.public_key_x, *other.public_key_y]
+        ),
+        reverted_with="Account: invalid secp256k1 public key"
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute(account_factory):
+    account, _, initializable = account_factory
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (FALSE,)
+
+    _, hash, signature = await signer.send_transactions(account, [(initializable.contract_address, 'initialize', [])])
+
+    execution_info = await account.is_valid_signature(hash, signature).call()
+    assert execution_info.result == (TRUE,)
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (TRUE,)
+
+    # should revert if signature is not correct
+    await assert_revert(
+        account.is_valid_signature(hash - 1, signature).call(),
+        reverted_with="Account: invalid secp256k1 signature"
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_invalid_signer(account_factory):
+    account, _, initializable = account_factory
+
+    await assert_revert(
+        other.send_transactions(account, [(initializable.contract_address, 'initialize', [])]),
+        reverted_with="Account: invalid secp256k1 signature"
+    )
+
+
+@ pytest.mark.asyncio
+async def test_nonce(account_factory):
+    account, _, initializable = account_factory
+
+    await signer.send_transactions(account, [(initializable.contract_address, 'initialized', [])])
+
+    execution_info = await account.get_nonce().call()
+    current_nonce = execution_info.result.res
+
+    await assert_revert(
+        signer.send_transactions(
+            account, [(initializable.contract_address, 'initialize', [])], current_nonce - 1),
+        reverted_with="Account: nonce is invalid"
+    )
+
+    await signer.send_transactions(account, [(initializable.contract_address, 'initialize', [])], current_nonce)
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+async def test_public_key_setter(account_factory):
+    account, _, initializable = account_factory
+
+    await signer.send_transactions(account, [(account.contract_address, 'set_public_key', [
+        *other.public_key_x, *other.public_key_y
+    ])])
+
+    execution_info = await account.get_public_key().call()
+    assert execution_info.result == (other.public_key_x, other.public_key_y)
+
+    await other.send_transactions(account, [(initializable.contract_address, 'initialize', [])])
+
+    execution_info = await initializable.initialized().call()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+async def test_public_key_setter_different_account(account_factory):
+    account, bad_account, _ = account_factory
+
+    await assert_revert(
+        signer.send_transactions(
+            bad_account,
+            [(account.contract_address, 'set_public_key', [*other.public_key_x, *other.public_key_y])]
+        ),
+        reverted_with="Account: caller is not this account"
+    )
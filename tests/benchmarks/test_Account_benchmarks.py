@@ -0,0 +1,52 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import get_contract_class, get_account_steps, TRUE
+
+
+signer = MockSigner(123456789987654321)
+
+CALLS_LENS = [10, 100]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    init_cls = get_contract_class('Initializable')
+
+    return account_cls, init_cls
+
+
+@pytest.fixture
+async def account_factory(contract_classes):
+    account_cls, init_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    initializable = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[]
+    )
+    return account, initializable
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('calls_len', CALLS_LENS)
+async def test_execute_discard_responses(account_factory, calls_len):
+    account, initializable = account_factory
+    calls = [(initializable.contract_address, 'initialized', [])] * calls_len
+
+    tx_exec_info = await signer.send_transactions(account, calls)
+    assert len(tx_exec_info.result.response) == calls_len
+    copy_steps = get_account_steps(tx_exec_info)
+
+    await signer.send_transactions(account, [(account.contract_address, 'set_discard_responses', [TRUE])])
+
+    tx_exec_info = await signer.send_transactions(account, calls)
+    assert tx_exec_info.result.response == []
+    discard_steps = get_account_steps(tx_exec_info)
+
+    print(f"\n__execute__ x{calls_len}: {copy_steps} account steps, discarding responses: {discard_steps} account steps")
+    assert discard_steps < copy_steps
@@ -0,0 +1,72 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    to_uint, str_to_felt, get_contract_class, get_contract_steps
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# testing vars
+INIT_SUPPLY = to_uint(1000)
+AMOUNT = to_uint(200)
+NAME = str_to_felt("Mintable Token")
+SYMBOL = str_to_felt("MTKN")
+DECIMALS = 18
+BATCH_SIZES = [5, 20]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc20_cls = get_contract_class('ERC20Mintable')
+
+    return account_cls, erc20_cls
+
+
+@pytest.fixture
+async def erc20_factory(contract_classes):
+    account_cls, erc20_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc20 = await starknet.deploy(
+        contract_class=erc20_cls,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            DECIMALS,
+            *INIT_SUPPLY,
+            account.contract_address,        # recipient
+            account.contract_address         # owner
+        ]
+    )
+    return erc20, account
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_mintBatch_vs_single_mints(erc20_factory, batch_size):
+    erc20, account = erc20_factory
+    single_recipients = [1000 + i for i in range(batch_size)]
+    batch_recipients = [2000 + i for i in range(batch_size)]
+
+    single_steps = 0
+    for recipient in single_recipients:
+        tx_exec_info = await signer.send_transaction(
+            account, erc20.contract_address, 'mint', [recipient, *AMOUNT]
+        )
+        single_steps += get_contract_steps(tx_exec_info)
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            batch_size, *batch_recipients,
+            batch_size, *AMOUNT * batch_size
+        ])
+    batch_steps = get_contract_steps(tx_exec_info)
+
+    print(f"\nmint x{batch_size}: {single_steps} steps, mintBatch: {batch_steps} steps")
+    assert batch_steps <= single_steps
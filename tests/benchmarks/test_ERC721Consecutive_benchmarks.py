@@ -0,0 +1,93 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, to_uint, get_contract_class, get_contract_steps
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random user address
+RECIPIENT = 555
+BATCH_SIZES = [5, 20]
+# distances from the start of a run for ownerOf lookups
+LOOKUP_OFFSETS = [0, 10, 100]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721MintableBurnable')
+    consecutive_cls = get_contract_class('ERC721ConsecutiveMintableBurnable')
+
+    return account_cls, erc721_cls, consecutive_cls
+
+
+@pytest.fixture
+async def erc721_factory(contract_classes):
+    account_cls, erc721_cls, consecutive_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    consecutive = await starknet.deploy(
+        contract_class=consecutive_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    return erc721, consecutive, account
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_consecutive_mint_vs_single_mints(erc721_factory, batch_size):
+    erc721, consecutive, account = erc721_factory
+
+    single_steps = 0
+    for token_id in range(batch_size):
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, 'mint', [
+                RECIPIENT, *to_uint(token_id)]
+        )
+        single_steps += get_contract_steps(tx_exec_info)
+
+    tx_exec_info = await signer.send_transaction(
+        account, consecutive.contract_address, 'mint', [RECIPIENT, batch_size]
+    )
+    batch_steps = get_contract_steps(tx_exec_info)
+
+    print(f"\nmint x{batch_size}: {single_steps} steps, consecutive mint: {batch_steps} steps")
+    assert batch_steps < single_steps
+
+
+@pytest.mark.asyncio
+async def test_consecutive_ownerOf_lookup_cost(erc721_factory):
+    _, consecutive, account = erc721_factory
+
+    await signer.send_transaction(
+        account, consecutive.contract_address, 'mint', [
+            RECIPIENT, max(LOOKUP_OFFSETS) + 1]
+    )
+
+    costs = []
+    for offset in LOOKUP_OFFSETS:
+        execution_info = await consecutive.ownerOf(to_uint(offset)).call()
+        assert execution_info.result == (RECIPIENT,)
+        costs.append(execution_info.call_info.execution_resources.n_steps)
+
+    print("\nownerOf steps by offset in run:", dict(zip(LOOKUP_OFFSETS, costs)))
+    # the lookup cost grows with the distance to the start of the run
+    assert costs == sorted(costs)
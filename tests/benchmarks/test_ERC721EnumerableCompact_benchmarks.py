@@ -0,0 +1,89 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, to_uint, get_contract_class, get_contract_steps,
+    get_syscall_counts
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random user address
+RECIPIENT = 555
+# tokens minted before measuring, so that burns and transfers swap indexes
+N_TOKENS = 3
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    enumerable_cls = get_contract_class('ERC721EnumerableMintableBurnable')
+    compact_cls = get_contract_class('ERC721EnumerableCompactMintableBurnable')
+
+    return account_cls, enumerable_cls, compact_cls
+
+
+@pytest.fixture
+async def erc721_factory(contract_classes):
+    account_cls, enumerable_cls, compact_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    contracts = []
+    for erc721_cls in [enumerable_cls, compact_cls]:
+        contracts.append(await starknet.deploy(
+            contract_class=erc721_cls,
+            constructor_calldata=[
+                str_to_felt("Non Fungible Token"),  # name
+                str_to_felt("NFT"),                 # ticker
+                account.contract_address            # owner
+            ]
+        ))
+    return contracts, account
+
+
+async def measure(account, erc721, method, calldata):
+    """Returns the steps and storage writes of a transaction."""
+    before = get_syscall_counts(erc721).get('storage_write', 0)
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, method, calldata
+    )
+    after = get_syscall_counts(erc721).get('storage_write', 0)
+    return get_contract_steps(tx_exec_info), after - before
+
+
+async def measure_operations(erc721, account):
+    for token_id in range(N_TOKENS):
+        await signer.send_transaction(
+            account, erc721.contract_address, 'mint', [
+                account.contract_address, *to_uint(token_id)]
+        )
+
+    return {
+        'mint': await measure(account, erc721, 'mint', [
+            account.contract_address, *to_uint(N_TOKENS)]),
+        'transferFrom': await measure(account, erc721, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(0)]),
+        'burn': await measure(account, erc721, 'burn', [*to_uint(1)]),
+    }
+
+
+@pytest.mark.asyncio
+async def test_compact_vs_enumerable(erc721_factory):
+    (enumerable, compact), account = erc721_factory
+
+    enumerable_costs = await measure_operations(enumerable, account)
+    compact_costs = await measure_operations(compact, account)
+
+    print("\n(steps, storage writes)")
+    for operation in enumerable_costs:
+        print(f"{operation}: enumerable {enumerable_costs[operation]}, compact {compact_costs[operation]}")
+
+    for operation in enumerable_costs:
+        enumerable_steps, enumerable_writes = enumerable_costs[operation]
+        compact_steps, compact_writes = compact_costs[operation]
+        assert compact_steps < enumerable_steps
+        assert compact_writes < enumerable_writes
@@ -0,0 +1,68 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, to_uint, get_contract_class, get_contract_steps,
+    get_syscall_counts
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random user address
+RECIPIENT = 555
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    enumerable_cls = get_contract_class('ERC721EnumerableMintableBurnable')
+    sequential_cls = get_contract_class('ERC721EnumerableSequentialMintable')
+
+    return account_cls, enumerable_cls, sequential_cls
+
+
+@pytest.fixture
+async def erc721_factory(contract_classes):
+    account_cls, enumerable_cls, sequential_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    contracts = []
+    for erc721_cls in [enumerable_cls, sequential_cls]:
+        contracts.append(await starknet.deploy(
+            contract_class=erc721_cls,
+            constructor_calldata=[
+                str_to_felt("Non Fungible Token"),  # name
+                str_to_felt("NFT"),                 # ticker
+                account.contract_address            # owner
+            ]
+        ))
+    return contracts, account
+
+
+async def measure(account, erc721, calldata):
+    """Returns the steps and storage writes of a mint."""
+    before = get_syscall_counts(erc721).get('storage_write', 0)
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mint', calldata
+    )
+    after = get_syscall_counts(erc721).get('storage_write', 0)
+    return get_contract_steps(tx_exec_info), after - before
+
+
+@pytest.mark.asyncio
+async def test_sequential_mint_vs_enumerable_mint(erc721_factory):
+    (enumerable, sequential), account = erc721_factory
+
+    enumerable_steps, enumerable_writes = await measure(
+        account, enumerable, [RECIPIENT, *to_uint(0)])
+    sequential_steps, sequential_writes = await measure(
+        account, sequential, [RECIPIENT])
+
+    print(f"\nmint (steps, storage writes): enumerable {(enumerable_steps, enumerable_writes)}, sequential {(sequential_steps, sequential_writes)}")
+    assert sequential_steps < enumerable_steps
+    # all_tokens and all_tokens_index are two Uint256, four storage slots
+    assert sequential_writes == enumerable_writes - 4
@@ -0,0 +1,81 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import str_to_felt, to_uint, get_contract_class
+
+
+signer = MockSigner(123456789987654321)
+
+PAGE_SIZES = [10, 100, 1000]
+# mint calls sent in a single transaction
+MINTS_PER_TX = 100
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721EnumerableMintableBurnable')
+
+    return account_cls, erc721_cls
+
+
+@pytest.fixture(scope='module')
+async def erc721_minted(contract_classes):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    for start in range(0, max(PAGE_SIZES), MINTS_PER_TX):
+        await signer.send_transactions(account, [
+            (erc721.contract_address, 'mint', [
+                account.contract_address, *to_uint(token_id)])
+            for token_id in range(start, start + MINTS_PER_TX)
+        ])
+    return erc721, account
+
+
+@pytest.mark.asyncio
+async def test_page_cost_by_size(erc721_minted):
+    erc721, account = erc721_minted
+
+    tokens_steps = []
+    owner_steps = []
+    for page_size in PAGE_SIZES:
+        execution_info = await erc721.tokens(to_uint(0), page_size).call()
+        assert len(execution_info.result.tokenIds) == page_size
+        tokens_steps.append(execution_info.call_info.execution_resources.n_steps)
+
+        execution_info = await erc721.tokensOfOwner(
+            account.contract_address, to_uint(0), page_size).call()
+        assert len(execution_info.result.tokenIds) == page_size
+        owner_steps.append(execution_info.call_info.execution_resources.n_steps)
+
+    print("\ntokens steps by page size:", dict(zip(PAGE_SIZES, tokens_steps)))
+    print("tokensOfOwner steps by page size:", dict(zip(PAGE_SIZES, owner_steps)))
+
+
+@pytest.mark.asyncio
+async def test_page_vs_single_calls(erc721_minted):
+    erc721, _ = erc721_minted
+    page_size = min(PAGE_SIZES)
+
+    single_steps = 0
+    for index in range(page_size):
+        execution_info = await erc721.tokenByIndex(to_uint(index)).call()
+        single_steps += execution_info.call_info.execution_resources.n_steps
+
+    execution_info = await erc721.tokens(to_uint(0), page_size).call()
+    page_steps = execution_info.call_info.execution_resources.n_steps
+
+    print(f"\ntokenByIndex x{page_size}: {single_steps} steps, tokens: {page_steps} steps")
+    assert page_steps < single_steps
@@ -0,0 +1,244 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, to_uint, get_contract_class, get_contract_steps,
+    get_storage_reads, get_call_count
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random user address
+RECIPIENT = 555
+BATCH_SIZES = [5, 20]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721MintableBurnable')
+
+    return account_cls, erc721_cls
+
+
+@pytest.fixture
+async def erc721_factory(contract_classes):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    return erc721, account
+
+
+async def mint_tokens(erc721, account, token_ids):
+    for token_id in token_ids:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'mint', [
+                account.contract_address, *to_uint(token_id)]
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_batchTransferFrom_vs_transferFrom(erc721_factory, batch_size):
+    erc721, account = erc721_factory
+    single_ids = range(batch_size)
+    batch_ids = range(batch_size, 2 * batch_size)
+    await mint_tokens(erc721, account, [*single_ids, *batch_ids])
+
+    single_steps = 0
+    for token_id in single_ids:
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, 'transferFrom', [
+                account.contract_address, RECIPIENT, *to_uint(token_id)]
+        )
+        single_steps += get_contract_steps(tx_exec_info)
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            batch_size,
+            *[felt for token_id in batch_ids for felt in to_uint(token_id)]
+        ]
+    )
+    batch_steps = get_contract_steps(tx_exec_info)
+
+    print(f"\ntransferFrom x{batch_size}: {single_steps} steps, batchTransferFrom: {batch_steps} steps")
+    assert batch_steps < single_steps
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('contract_name', [
+    'ERC721MintableBurnable', 'ERC721EnumerableMintableBurnable'
+])
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_mintBatch_burnBatch_vs_mint_burn(contract_classes, contract_name, batch_size):
+    account_cls, _ = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=get_contract_class(contract_name),
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    single_ids = range(batch_size)
+    batch_ids = range(batch_size, 2 * batch_size)
+    batch_calldata = [
+        batch_size, *[felt for token_id in batch_ids for felt in to_uint(token_id)]
+    ]
+
+    steps = {}
+    for method in ['mint', 'burn']:
+        single_steps = 0
+        for token_id in single_ids:
+            calldata = [*to_uint(token_id)]
+            if method == 'mint':
+                calldata = [account.contract_address, *calldata]
+            tx_exec_info = await signer.send_transaction(
+                account, erc721.contract_address, method, calldata
+            )
+            single_steps += get_contract_steps(tx_exec_info)
+
+        calldata = batch_calldata
+        if method == 'mint':
+            calldata = [account.contract_address, *calldata]
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, f'{method}Batch', calldata
+        )
+        steps[method] = (single_steps, get_contract_steps(tx_exec_info))
+
+    for method, (single_steps, batch_steps) in steps.items():
+        print(f"\n{contract_name} {method} x{batch_size}: {single_steps} steps, {method}Batch: {batch_steps} steps")
+        assert batch_steps < single_steps
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_mintBatch_consecutive_transfer_event(erc721_factory, batch_size):
+    erc721, account = erc721_factory
+
+    results = {}
+    for enabled in [0, 1]:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'setConsecutiveTransferEvent', [enabled]
+        )
+        token_ids = range(enabled * batch_size, (enabled + 1) * batch_size)
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, 'mintBatch', [
+                RECIPIENT,
+                batch_size,
+                *[felt for token_id in token_ids for felt in to_uint(token_id)]
+            ]
+        )
+        events = [
+            event for event in tx_exec_info.raw_events
+            if event.from_address == erc721.contract_address
+        ]
+        # keys and data are published for every event
+        event_felts = sum(len(event.keys) + len(event.data) for event in events)
+        results[enabled] = (len(events), event_felts, get_contract_steps(tx_exec_info))
+
+    print(f"\nmintBatch x{batch_size} (events, event felts, steps): "
+          f"Transfer {results[0]}, ConsecutiveTransfer {results[1]}")
+    assert results[1][0] == 1
+    assert results[1][1] < results[0][1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('batch_size', BATCH_SIZES)
+async def test_safeBatchTransferFrom_receiver_probes(contract_classes, batch_size):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    recipient = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    await mint_tokens(erc721, account, range(batch_size))
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            recipient.contract_address,
+            batch_size,
+            *[felt for token_id in range(batch_size) for felt in to_uint(token_id)],
+            0
+        ]
+    )
+    probes = get_call_count(tx_exec_info, recipient.contract_address, 'supportsInterface')
+
+    print(f"\nsafeBatchTransferFrom x{batch_size} to an account: "
+          f"{probes} supportsInterface calls, {get_contract_steps(tx_exec_info)} steps")
+    # IERC721Receiver and IAccount, instead of both for every token
+    assert probes == 2
+
+
+# Uint256 values take two storage slots
+@pytest.mark.asyncio
+@pytest.mark.parametrize('contract_name, caller, expected_reads', [
+    # owner, approval, balances
+    ('ERC721MintableBurnable', 'owner', 1 + 1 + 4),
+    # owner, approval, operator approval, balances
+    ('ERC721MintableBurnable', 'operator', 1 + 1 + 1 + 4),
+    # same as above, plus the owner index of the token
+    ('ERC721EnumerableMintableBurnable', 'owner', 1 + 1 + 4 + 2),
+    ('ERC721EnumerableMintableBurnable', 'operator', 1 + 1 + 1 + 4 + 2),
+])
+async def test_transferFrom_storage_reads(contract_classes, contract_name, caller, expected_reads):
+    account_cls, _ = contract_classes
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=get_contract_class(contract_name),
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account.contract_address            # owner
+        ]
+    )
+    await mint_tokens(erc721, account, [0])
+
+    caller_address = account.contract_address
+    if caller == 'operator':
+        caller_address = RECIPIENT
+        await signer.send_transaction(
+            account, erc721.contract_address, 'setApprovalForAll', [RECIPIENT, 1]
+        )
+
+    reads = await get_storage_reads(erc721, 'transferFrom', [
+        account.contract_address, RECIPIENT, *to_uint(0)], caller_address)
+
+    print(f"\n{contract_name} transferFrom as {caller}: {reads} storage reads")
+    assert reads == expected_reads
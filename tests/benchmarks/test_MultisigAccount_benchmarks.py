@@ -0,0 +1,45 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockMultisigSigner
+from utils import get_contract_class, get_account_steps
+
+
+SIGNERS_LEN = 10
+THRESHOLDS = [1, 2, 5, 10]
+
+signer = MockMultisigSigner([123456789987654321 + i for i in range(SIGNERS_LEN)])
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('MultisigAccount')
+    init_cls = get_contract_class('Initializable')
+
+    return account_cls, init_cls
+
+
+@pytest.mark.asyncio
+async def test_execute_threshold_steps(contract_classes):
+    account_cls, init_cls = contract_classes
+    starknet = await Starknet.empty()
+    initializable = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[]
+    )
+
+    steps = []
+    for threshold in THRESHOLDS:
+        account = await starknet.deploy(
+            contract_class=account_cls,
+            constructor_calldata=[SIGNERS_LEN, *signer.public_keys, threshold]
+        )
+        tx_exec_info = await signer.send_transaction(
+            account, initializable.contract_address, 'initialized', [], list(range(threshold))
+        )
+        steps.append(get_account_steps(tx_exec_info))
+
+    for threshold, account_steps in zip(THRESHOLDS, steps):
+        print(f"\n__execute__ {threshold}-of-{SIGNERS_LEN}: {account_steps} account steps")
+
+    # each signature adds one iteration of the verification loop
+    assert all(fewer < more for fewer, more in zip(steps, steps[1:]))
@@ -0,0 +1,60 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockEthSigner
+from utils import get_contract_class, get_account_steps, get_account_builtins
+
+
+signer = MockEthSigner(b'\x01' * 32)
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    eth_account_cls = get_contract_class('EthAccount')
+    secp256k1_account_cls = get_contract_class('Secp256k1Account')
+    init_cls = get_contract_class('Initializable')
+
+    return eth_account_cls, secp256k1_account_cls, init_cls
+
+
+@pytest.fixture
+async def account_factory(contract_classes):
+    eth_account_cls, secp256k1_account_cls, init_cls = contract_classes
+    starknet = await Starknet.empty()
+    eth_account = await starknet.deploy(
+        contract_class=eth_account_cls,
+        constructor_calldata=[signer.eth_address]
+    )
+    secp256k1_account = await starknet.deploy(
+        contract_class=secp256k1_account_cls,
+        constructor_calldata=[*signer.public_key_x, *signer.public_key_y]
+    )
+    initializable = await starknet.deploy(
+        contract_class=init_cls,
+        constructor_calldata=[]
+    )
+    return eth_account, secp256k1_account, initializable
+
+
+@pytest.mark.asyncio
+async def test_execute_public_key_vs_eth_address(account_factory):
+    eth_account, secp256k1_account, initializable = account_factory
+    calls = [(initializable.contract_address, 'initialized', [])]
+
+    results = {}
+    for name, account in [('EthAccount', eth_account), ('Secp256k1Account', secp256k1_account)]:
+        tx_exec_info, *_ = await signer.send_transactions(account, calls)
+        builtins = get_account_builtins(tx_exec_info)
+        results[name] = (
+            get_account_steps(tx_exec_info),
+            builtins.get('range_check_builtin', 0),
+            builtins.get('bitwise_builtin', 0)
+        )
+        print(f"\n{name}.__execute__: {results[name][0]} account steps, "
+              f"{results[name][1]} range checks, {results[name][2]} bitwise")
+
+    eth_steps, eth_range_checks, eth_bitwise = results['EthAccount']
+    steps, range_checks, bitwise = results['Secp256k1Account']
+    assert steps < eth_steps
+    assert range_checks < eth_range_checks
+    # no keccak, so no bitwise operations
+    assert bitwise == 0 < eth_bitwise
@@ -58,6 +58,46 @@ func revokeRole{
     return ()
 end
 
+@external
+func grantRoles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    AccessControl.grant_roles(role, users_len, users)
+    return ()
+end
+
+@external
+func revokeRoles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    AccessControl.revoke_roles(role, users_len, users)
+    return ()
+end
+
+@external
+func grantRolesBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+    AccessControl.grant_roles_batch(roles_len, roles, users_len, users)
+    return ()
+end
+
+@external
+func revokeRolesBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+    AccessControl.revoke_roles_batch(roles_len, roles, users_len, users)
+    return ()
+end
+
 @external
 func renounceRole{
         syscall_ptr : felt*,
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
+from openzeppelin.access.accesscontrol.library import AccessControl
+from openzeppelin.access.accesscontrol.enumerable.library import AccessControlEnumerable
+from openzeppelin.introspection.erc165.library import ERC165
+from openzeppelin.utils.constants.library import DEFAULT_ADMIN_ROLE
+
+@constructor
+func constructor{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(admin: felt):
+    AccessControlEnumerable.initializer()
+    AccessControlEnumerable._grant_role(DEFAULT_ADMIN_ROLE, admin)
+    return ()
+end
+
+@view
+func hasRole{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt) -> (hasRole: felt):
+    let (hasRole) = AccessControl.has_role(role, user)
+    return (hasRole)
+end
+
+@view
+func getRoleAdmin{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt) -> (admin: felt):
+    return AccessControl.get_role_admin(role)
+end
+
+@external
+func grantRole{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt):
+    AccessControlEnumerable.grant_role(role, user)
+    return ()
+end
+
+@external
+func revokeRole{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt):
+    AccessControlEnumerable.revoke_role(role, user)
+    return ()
+end
+
+@external
+func grantRoles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    AccessControlEnumerable.grant_roles(role, users_len, users)
+    return ()
+end
+
+@external
+func revokeRoles{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, users_len: felt, users: felt*):
+    AccessControlEnumerable.revoke_roles(role, users_len, users)
+    return ()
+end
+
+@external
+func grantRolesBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+    AccessControlEnumerable.grant_roles_batch(roles_len, roles, users_len, users)
+    return ()
+end
+
+@external
+func revokeRolesBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(roles_len: felt, roles: felt*, users_len: felt, users: felt*):
+    AccessControlEnumerable.revoke_roles_batch(roles_len, roles, users_len, users)
+    return ()
+end
+
+@external
+func renounceRole{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, user: felt):
+    AccessControlEnumerable.renounce_role(role, user)
+    return ()
+end
+
+@view
+func getRoleMember{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, index: felt) -> (account: felt):
+    return AccessControlEnumerable.get_role_member(role, index)
+end
+
+@view
+func getRoleMemberCount{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt) -> (count: felt):
+    return AccessControlEnumerable.get_role_member_count(role)
+end
+
+@view
+func getRoleMembers{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, offset: felt, limit: felt) -> (accounts_len: felt, accounts: felt*):
+    return AccessControlEnumerable.get_role_members(role, offset, limit)
+end
+
+# ONLY FOR MOCKS, DON'T EXPOSE IN PRODUCTION
+@external
+func setRoleAdmin{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(role: felt, admin: felt):
+    AccessControl._set_role_admin(role, admin)
+    return ()
+end
+
+@view
+func supportsInterface{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    } (interfaceId: felt) -> (success: felt):
+    let (success) = ERC165.supports_interface(interfaceId)
+    return (success)
+end
@@ -193,6 +193,23 @@ func safeMint{
     return ()
 end
 
+@external
+func safeMintBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        to: felt,
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    Ownable.assert_only_owner()
+    ERC721._safe_mint_batch(to, tokenIds_len, tokenIds, data_len, data)
+    return ()
+end
+
 @external
 func setTokenURI{
         pedersen_ptr: HashBuiltin*,
@@ -1,7 +1,87 @@
 from nile.signer import Signer, from_call_to_call_array, get_transaction_hash
-from utils import to_uint
+from starkware.cairo.common.hash_state import compute_hash_on_elements
+from starkware.starknet.definitions.general_config import StarknetChainId
+from utils import to_uint, str_to_felt
 import eth_keys
 
+RELAYED_HASH_PREFIX = str_to_felt('StarkNet Relayed Execute')
+
+
+def decode_framed_response(response):
+    """
+    Splits the response of an account framing its responses into the
+    response of each call, in call order.
+
+    Examples
+    ---------
+    >>> decode_framed_response([1, 42, 0, 2, 7, 8])
+    [[42], [], [7, 8]]
+
+    """
+    responses = []
+    offset = 0
+    while offset < len(response):
+        size = response[offset]
+        responses.append(list(response[offset + 1:offset + 1 + size]))
+        offset += 1 + size
+    return responses
+
+
+def get_relayed_hash(account_address, call_array, calldata, nonce):
+    """Returns the hash an account signs to have its calls relayed."""
+    return compute_hash_on_elements([
+        RELAYED_HASH_PREFIX,
+        account_address,
+        compute_hash_on_elements([x for t in call_array for x in t]),
+        compute_hash_on_elements(calldata),
+        nonce,
+        StarknetChainId.TESTNET.value
+    ])
+
+
+def pack_relayed_bundles(bundles):
+    """
+    Packs signed bundles into the arguments of `Relayer.relay`, each bundle
+    pointing at its slice of the shared call array, calldata and signatures.
+
+    Examples
+    ---------
+    >>> bundle = await signer.sign_relayed_transactions(account, calls)
+    >>> await relayer.relay(*pack_relayed_bundles([bundle])).invoke()
+
+    """
+    packed = []
+    call_array = []
+    calldata = []
+    signatures = []
+    for (account_address, bundle_call_array, bundle_calldata, nonce, signature) in bundles:
+        packed.append((
+            account_address,
+            len(call_array), len(bundle_call_array),
+            len(calldata), len(bundle_calldata),
+            nonce,
+            len(signatures), len(signature)
+        ))
+        call_array.extend(bundle_call_array)
+        calldata.extend(bundle_calldata)
+        signatures.extend(signature)
+    return packed, call_array, calldata, signatures
+
+
+async def _get_calls_and_nonce(account, calls, nonce):
+    if nonce is None:
+        execution_info = await account.get_nonce().call()
+        nonce, = execution_info.result
+
+    build_calls = []
+    for call in calls:
+        build_call = list(call)
+        build_call[0] = hex(build_call[0])
+        build_calls.append(build_call)
+
+    (call_array, calldata) = from_call_to_call_array(build_calls)
+    return call_array, calldata, nonce
+
 
 class MockSigner():
     """
@@ -57,6 +137,80 @@ class MockSigner():
             hex(account.contract_address), build_calls, nonce, max_fee)
         return await account.__execute__(call_array, calldata, nonce).invoke(signature=[sig_r, sig_s])
 
+    async def sign_relayed_transactions(self, account, calls, nonce=None):
+        """Returns a bundle of calls signed to be relayed, see `pack_relayed_bundles`."""
+        call_array, calldata, nonce = await _get_calls_and_nonce(account, calls, nonce)
+        message_hash = get_relayed_hash(account.contract_address, call_array, calldata, nonce)
+        sig_r, sig_s = self.signer.sign(message_hash)
+        return (account.contract_address, call_array, calldata, nonce, [sig_r, sig_s])
+
+
+class MockSessionSigner(MockSigner):
+    """
+    Utility for sending transactions signed by a session key of an Account,
+    like MockSigner, see `Account.add_session_key`.
+
+    Examples
+    ---------
+    >>> session = MockSessionSigner(5678)
+    >>> await signer.send_transaction(
+            account, account.contract_address, 'add_session_key',
+            [session.public_key, expires_at, 1, contract_address, selector, 1, token, *cap]
+        )
+    >>> await session.send_transaction(account, contract_address, 'contract_method', [arg_1])
+
+    """
+
+    async def send_transactions(self, account, calls, nonce=None, max_fee=0):
+        call_array, calldata, nonce = await _get_calls_and_nonce(account, calls, nonce)
+        message_hash = get_transaction_hash(
+            account.contract_address, call_array, calldata, nonce, max_fee
+        )
+        sig_r, sig_s = self.signer.sign(message_hash)
+        return await account.__execute__(call_array, calldata, nonce).invoke(
+            signature=[self.public_key, sig_r, sig_s]
+        )
+
+
+class MockMultisigSigner():
+    """
+    Utility for sending transactions signed by several keys to a MultisigAccount on Starknet.
+
+    Parameters
+    ----------
+
+    private_keys : list of int, in signer index order
+
+    Examples
+    ---------
+    Sending a transaction signed by the first and third signers
+
+    >>> signer = MockMultisigSigner([1234, 5678, 9012])
+    >>> await signer.send_transaction(
+            account, contract_address, 'contract_method', [arg_1], signer_indexes=[0, 2]
+        )
+
+    """
+
+    def __init__(self, private_keys):
+        self.signers = [Signer(private_key) for private_key in private_keys]
+        self.public_keys = [signer.public_key for signer in self.signers]
+
+    async def send_transaction(self, account, to, selector_name, calldata, signer_indexes, nonce=None, max_fee=0):
+        return await self.send_transactions(account, [(to, selector_name, calldata)], signer_indexes, nonce, max_fee)
+
+    async def send_transactions(self, account, calls, signer_indexes, nonce=None, max_fee=0):
+        call_array, calldata, nonce = await _get_calls_and_nonce(account, calls, nonce)
+        message_hash = get_transaction_hash(
+            account.contract_address, call_array, calldata, nonce, max_fee
+        )
+
+        signature = []
+        for index in signer_indexes:
+            signature.extend([index, *self.signers[index].sign(message_hash)])
+
+        return await account.__execute__(call_array, calldata, nonce).invoke(signature=signature)
+
 
 class MockEthSigner():
     """
@@ -70,6 +224,10 @@ class MockEthSigner():
     def __init__(self, private_key):
         self.signer = eth_keys.keys.PrivateKey(private_key)
         self.eth_address = int(self.signer.public_key.to_checksum_address(), 0)
+        # uncompressed public key, as stored by the Secp256k1Account
+        public_key = self.signer.public_key.to_bytes()
+        self.public_key_x = to_uint(int.from_bytes(public_key[:32], "big"))
+        self.public_key_y = to_uint(int.from_bytes(public_key[32:], "big"))
 
     async def send_transaction(self, account, to, selector_name, calldata, nonce=None, max_fee=0):
         return await self.send_transactions(account, [(to, selector_name, calldata)], nonce, max_fee)
@@ -99,3 +257,17 @@ class MockEthSigner():
         return await account.__execute__(call_array, calldata, nonce).invoke(
             signature=[signature.v, *sig_r, *sig_s]
         ), message_hash, [signature.v, *sig_r, *sig_s]
+
+    async def sign_relayed_transactions(self, account, calls, nonce=None):
+        call_array, calldata, nonce = await _get_calls_and_nonce(account, calls, nonce)
+        message_hash = get_relayed_hash(account.contract_address, call_array, calldata, nonce)
+
+        signature = self.signer.sign_msg_hash(
+            (message_hash).to_bytes(32, byteorder="big"))
+        sig_r = to_uint(signature.r)
+        sig_s = to_uint(signature.s)
+
+        return (
+            account.contract_address, call_array, calldata, nonce,
+            [signature.v, *sig_r, *sig_s]
+        )
@@ -0,0 +1,679 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, ZERO_ADDRESS, TRUE, FALSE, assert_revert, assert_revert_entry_point,
+    INVALID_UINT256,
+    assert_event_emitted, get_contract_class, cached_contract, to_uint,
+    get_call_count
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random token IDs
+IDS = [to_uint(1), to_uint(42), to_uint(5042)]
+# random amounts, one per token ID
+AMOUNTS = [to_uint(100), to_uint(1), to_uint(2500)]
+# test token
+ID = IDS[0]
+AMOUNT = AMOUNTS[0]
+# random user address
+RECIPIENT = 555
+# random data (mimicking bytes in Solidity)
+DATA = [0x42, 0x89, 0x55]
+# random URIs
+SAMPLE_URI_1 = str_to_felt('mock://mytoken/{id}.json')
+SAMPLE_URI_2 = str_to_felt('mock://mytoken.v2/{id}')
+
+# selector ids
+IERC165_ID = 0x01ffc9a7
+IERC1155_ID = 0xd9b67a26
+IERC1155_METADATA_URI_ID = 0x0e89341c
+UNSUPPORTED_ID = 0xabcd1234
+
+
+def flatten(uints):
+    return [felt for uint in uints for felt in uint]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc1155_cls = get_contract_class('ERC1155MintableBurnable')
+    erc1155_holder_cls = get_contract_class('ERC1155Holder')
+    unsupported_cls = get_contract_class('Initializable')
+
+    return account_cls, erc1155_cls, erc1155_holder_cls, unsupported_cls
+
+
+@pytest.fixture(scope='module')
+async def erc1155_init(contract_classes):
+    account_cls, erc1155_cls, erc1155_holder_cls, unsupported_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc1155 = await starknet.deploy(
+        contract_class=erc1155_cls,
+        constructor_calldata=[
+            SAMPLE_URI_1,               # uri
+            account1.contract_address   # owner
+        ]
+    )
+    erc1155_holder = await starknet.deploy(
+        contract_class=erc1155_holder_cls,
+        constructor_calldata=[]
+    )
+    unsupported = await starknet.deploy(
+        contract_class=unsupported_cls,
+        constructor_calldata=[]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc1155,
+        erc1155_holder,
+        unsupported
+    )
+
+
+@pytest.fixture
+def erc1155_factory(contract_classes, erc1155_init):
+    account_cls, erc1155_cls, erc1155_holder_cls, unsupported_cls = contract_classes
+    state, account1, account2, erc1155, erc1155_holder, unsupported = erc1155_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    erc1155 = cached_contract(_state, erc1155_cls, erc1155)
+    erc1155_holder = cached_contract(_state, erc1155_holder_cls, erc1155_holder)
+    unsupported = cached_contract(_state, unsupported_cls, unsupported)
+
+    return erc1155, account1, account2, erc1155_holder, unsupported
+
+
+@pytest.fixture
+async def erc1155_minted(erc1155_factory):
+    erc1155, account, account2, erc1155_holder, unsupported = erc1155_factory
+    # mint every token ID to account in one transaction
+    await signer.send_transaction(
+        account, erc1155.contract_address, 'mintBatch', [
+            account.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS),
+            0
+        ]
+    )
+
+    return erc1155, account, account2, erc1155_holder, unsupported
+
+
+#
+# Constructor
+#
+
+
+@pytest.mark.asyncio
+async def test_constructor(erc1155_factory):
+    erc1155, account, _, _, _ = erc1155_factory
+
+    execution_info = await erc1155.uri(ID).invoke()
+    assert execution_info.result == (SAMPLE_URI_1,)
+
+    execution_info = await erc1155.owner().invoke()
+    assert execution_info.result == (account.contract_address,)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('interface_id, result', [
+    [IERC165_ID, TRUE],
+    [IERC1155_ID, TRUE],
+    [IERC1155_METADATA_URI_ID, TRUE],
+    [UNSUPPORTED_ID, FALSE],
+])
+async def test_supportsInterface(erc1155_factory, interface_id, result):
+    erc1155, _, _, _, _ = erc1155_factory
+
+    execution_info = await erc1155.supportsInterface(interface_id).invoke()
+    assert execution_info.result == (result,)
+
+
+#
+# balanceOf
+#
+
+
+@pytest.mark.asyncio
+async def test_balanceOf(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    for (token_id, amount) in zip(IDS, AMOUNTS):
+        execution_info = await erc1155.balanceOf(account.contract_address, token_id).invoke()
+        assert execution_info.result == (amount,)
+
+    execution_info = await erc1155.balanceOf(RECIPIENT, ID).invoke()
+    assert execution_info.result == (to_uint(0),)
+
+
+@pytest.mark.asyncio
+async def test_balanceOf_zero_address(erc1155_minted):
+    erc1155, _, _, _, _ = erc1155_minted
+
+    await assert_revert(
+        erc1155.balanceOf(ZERO_ADDRESS, ID).invoke(),
+        reverted_with="ERC1155: balance query for the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_balanceOf_invalid_id(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    await assert_revert(
+        erc1155.balanceOf(account.contract_address, INVALID_UINT256).invoke(),
+        reverted_with="ERC1155: id is not a valid Uint256"
+    )
+
+
+@pytest.mark.asyncio
+async def test_balanceOfBatch(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+    accounts = [account.contract_address] * len(IDS) + [RECIPIENT]
+    ids = IDS + [ID]
+
+    execution_info = await erc1155.balanceOfBatch(accounts, ids).invoke()
+    assert execution_info.result.balances == AMOUNTS + [to_uint(0)]
+
+
+@pytest.mark.asyncio
+async def test_balanceOfBatch_length_mismatch(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    await assert_revert(
+        erc1155.balanceOfBatch([account.contract_address], IDS).invoke(),
+        reverted_with="ERC1155: accounts and ids length mismatch"
+    )
+
+
+#
+# setApprovalForAll
+#
+
+
+@pytest.mark.asyncio
+async def test_setApprovalForAll(erc1155_factory):
+    erc1155, account, spender, _, _ = erc1155_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='ApprovalForAll',
+        data=[account.contract_address, spender.contract_address, TRUE]
+    )
+
+    execution_info = await erc1155.isApprovedForAll(
+        account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+async def test_setApprovalForAll_self(erc1155_factory):
+    erc1155, account, _, _, _ = erc1155_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'setApprovalForAll', [
+            account.contract_address, TRUE]),
+        reverted_with="ERC1155: setting approval status for self"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setApprovalForAll_non_boolean(erc1155_factory):
+    erc1155, account, spender, _, _ = erc1155_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'setApprovalForAll', [
+            spender.contract_address, 2]),
+        reverted_with="ERC1155: approved is not a Cairo boolean"
+    )
+
+
+#
+# safeTransferFrom
+#
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom(erc1155_minted):
+    erc1155, account, account2, _, _ = erc1155_minted
+    amount = to_uint(40)
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            account2.contract_address,
+            *ID,
+            *amount,
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='TransferSingle',
+        data=[
+            account.contract_address,
+            account.contract_address,
+            account2.contract_address,
+            *ID,
+            *amount
+        ]
+    )
+
+    execution_info = await erc1155.balanceOf(account.contract_address, ID).invoke()
+    assert execution_info.result == (to_uint(60),)
+
+    execution_info = await erc1155.balanceOf(account2.contract_address, ID).invoke()
+    assert execution_info.result == (amount,)
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_from_operator(erc1155_minted):
+    erc1155, account, spender, _, _ = erc1155_minted
+
+    await signer.send_transaction(
+        account, erc1155.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    await signer.send_transaction(
+        spender, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            spender.contract_address,
+            *ID,
+            *AMOUNT,
+            0
+        ]
+    )
+
+    execution_info = await erc1155.balanceOf(spender.contract_address, ID).invoke()
+    assert execution_info.result == (AMOUNT,)
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_not_approved(erc1155_minted):
+    erc1155, account, spender, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        spender, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            spender.contract_address,
+            *ID,
+            *AMOUNT,
+            0
+        ]),
+        reverted_with="ERC1155: caller is not owner nor approved"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_insufficient_balance(erc1155_minted):
+    erc1155, account, account2, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            account2.contract_address,
+            *ID,
+            *to_uint(101),
+            0
+        ]),
+        reverted_with="ERC1155: insufficient balance"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_to_zero_address(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            ZERO_ADDRESS,
+            *ID,
+            *AMOUNT,
+            0
+        ]),
+        reverted_with="ERC1155: cannot transfer to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_to_receiver(erc1155_minted):
+    erc1155, account, _, erc1155_holder, _ = erc1155_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            erc1155_holder.contract_address,
+            *ID,
+            *AMOUNT,
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    holder = erc1155_holder.contract_address
+    assert get_call_count(tx_exec_info, holder, 'supportsInterface') == 1
+    assert get_call_count(tx_exec_info, holder, 'onERC1155Received') == 1
+
+    execution_info = await erc1155.balanceOf(holder, ID).invoke()
+    assert execution_info.result == (AMOUNT,)
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_to_unsupported_contract(erc1155_minted):
+    erc1155, account, _, _, unsupported = erc1155_minted
+
+    await assert_revert_entry_point(signer.send_transaction(
+        account, erc1155.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            unsupported.contract_address,
+            *ID,
+            *AMOUNT,
+            0
+        ]),
+        invalid_selector='supportsInterface'
+    )
+
+
+#
+# safeBatchTransferFrom
+#
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom(erc1155_minted):
+    erc1155, account, account2, _, _ = erc1155_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            account2.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS),
+            len(DATA), *DATA
+        ]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='TransferBatch',
+        data=[
+            account.contract_address,
+            account.contract_address,
+            account2.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS)
+        ]
+    )
+
+    accounts = [account.contract_address] * len(IDS) + [account2.contract_address] * len(IDS)
+    execution_info = await erc1155.balanceOfBatch(accounts, IDS + IDS).invoke()
+    assert execution_info.result.balances == [to_uint(0)] * len(IDS) + AMOUNTS
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom_to_receiver(erc1155_minted):
+    erc1155, account, _, erc1155_holder, _ = erc1155_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            erc1155_holder.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS),
+            len(DATA), *DATA
+        ]
+    )
+
+    # the receiver is probed and notified once for the whole batch
+    holder = erc1155_holder.contract_address
+    assert get_call_count(tx_exec_info, holder, 'supportsInterface') == 1
+    assert get_call_count(tx_exec_info, holder, 'onERC1155BatchReceived') == 1
+    assert get_call_count(tx_exec_info, holder, 'onERC1155Received') == 0
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom_length_mismatch(erc1155_minted):
+    erc1155, account, account2, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            account2.contract_address,
+            len(IDS), *flatten(IDS),
+            1, *AMOUNT,
+            0
+        ]),
+        reverted_with="ERC1155: ids and amounts length mismatch"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom_to_unsupported_contract(erc1155_minted):
+    erc1155, account, _, _, unsupported = erc1155_minted
+
+    await assert_revert_entry_point(signer.send_transaction(
+        account, erc1155.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            unsupported.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS),
+            0
+        ]),
+        invalid_selector='supportsInterface'
+    )
+
+
+#
+# mint
+#
+
+
+@pytest.mark.asyncio
+async def test_mint(erc1155_factory):
+    erc1155, account, _, _, _ = erc1155_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'mint', [
+            account.contract_address, *ID, *AMOUNT, 0]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='TransferSingle',
+        data=[
+            account.contract_address,
+            ZERO_ADDRESS,
+            account.contract_address,
+            *ID,
+            *AMOUNT
+        ]
+    )
+
+    execution_info = await erc1155.balanceOf(account.contract_address, ID).invoke()
+    assert execution_info.result == (AMOUNT,)
+
+
+@pytest.mark.asyncio
+async def test_mint_to_zero_address(erc1155_factory):
+    erc1155, account, _, _, _ = erc1155_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'mint', [
+            ZERO_ADDRESS, *ID, *AMOUNT, 0]),
+        reverted_with="ERC1155: cannot mint to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_not_owner(erc1155_factory):
+    erc1155, _, not_owner, _, _ = erc1155_factory
+
+    await assert_revert(signer.send_transaction(
+        not_owner, erc1155.contract_address, 'mint', [
+            not_owner.contract_address, *ID, *AMOUNT, 0]),
+        reverted_with="Ownable: caller is not the owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_to_receiver(erc1155_factory):
+    erc1155, account, _, erc1155_holder, _ = erc1155_factory
+    holder = erc1155_holder.contract_address
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'mintBatch', [
+            holder,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS),
+            len(DATA), *DATA
+        ]
+    )
+
+    assert get_call_count(tx_exec_info, holder, 'onERC1155BatchReceived') == 1
+
+    execution_info = await erc1155.balanceOfBatch([holder] * len(IDS), IDS).invoke()
+    assert execution_info.result.balances == AMOUNTS
+
+
+#
+# burn
+#
+
+
+@pytest.mark.asyncio
+async def test_burn(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+    amount = to_uint(40)
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'burn', [
+            account.contract_address, *ID, *amount]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='TransferSingle',
+        data=[
+            account.contract_address,
+            account.contract_address,
+            ZERO_ADDRESS,
+            *ID,
+            *amount
+        ]
+    )
+
+    execution_info = await erc1155.balanceOf(account.contract_address, ID).invoke()
+    assert execution_info.result == (to_uint(60),)
+
+
+@pytest.mark.asyncio
+async def test_burn_not_approved(erc1155_minted):
+    erc1155, account, spender, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        spender, erc1155.contract_address, 'burn', [
+            account.contract_address, *ID, *AMOUNT]),
+        reverted_with="ERC1155: caller is not owner nor approved"
+    )
+
+
+@pytest.mark.asyncio
+async def test_burnBatch(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc1155.contract_address, 'burnBatch', [
+            account.contract_address,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS)
+        ]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc1155.contract_address,
+        name='TransferBatch',
+        data=[
+            account.contract_address,
+            account.contract_address,
+            ZERO_ADDRESS,
+            len(IDS), *flatten(IDS),
+            len(AMOUNTS), *flatten(AMOUNTS)
+        ]
+    )
+
+    execution_info = await erc1155.balanceOfBatch(
+        [account.contract_address] * len(IDS), IDS).invoke()
+    assert execution_info.result.balances == [to_uint(0)] * len(IDS)
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_insufficient_balance(erc1155_minted):
+    erc1155, account, _, _, _ = erc1155_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc1155.contract_address, 'burnBatch', [
+            account.contract_address,
+            2, *ID, *ID,
+            2, *AMOUNT, *AMOUNT
+        ]),
+        reverted_with="ERC1155: insufficient balance"
+    )
+
+
+#
+# setURI
+#
+
+
+@pytest.mark.asyncio
+async def test_setURI(erc1155_factory):
+    erc1155, account, _, _, _ = erc1155_factory
+
+    await signer.send_transaction(
+        account, erc1155.contract_address, 'setURI', [SAMPLE_URI_2]
+    )
+
+    # the URI is shared by every token ID
+    for token_id in IDS:
+        execution_info = await erc1155.uri(token_id).invoke()
+        assert execution_info.result == (SAMPLE_URI_2,)
+
+
+@pytest.mark.asyncio
+async def test_setURI_not_owner(erc1155_factory):
+    erc1155, _, not_owner, _, _ = erc1155_factory
+
+    await assert_revert(signer.send_transaction(
+        not_owner, erc1155.contract_address, 'setURI', [SAMPLE_URI_2]),
+        reverted_with="Ownable: caller is not the owner"
+    )
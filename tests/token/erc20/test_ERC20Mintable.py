@@ -170,3 +170,113 @@ async def test_mint_invalid_uint256(token_factory):
         [RECIPIENT, *INVALID_UINT256]),
         reverted_with="ERC20: amount is not a valid Uint256"
     )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch(token_factory):
+    erc20, account = token_factory
+    recipients = [RECIPIENT, RECIPIENT + 1, account.contract_address]
+    amounts = [AMOUNT, UINT_ONE, AMOUNT]
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            len(recipients), *recipients,
+            len(amounts), *[x for amount in amounts for x in amount]
+        ])
+
+    # check new supply
+    execution_info = await erc20.totalSupply().invoke()
+    expected_supply = INIT_SUPPLY
+    for amount in amounts:
+        expected_supply = add_uint(expected_supply, amount)
+    assert execution_info.result.totalSupply == expected_supply
+
+    # check balances
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == AMOUNT
+
+    execution_info = await erc20.balanceOf(RECIPIENT + 1).invoke()
+    assert execution_info.result.balance == UINT_ONE
+
+    execution_info = await erc20.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == add_uint(INIT_SUPPLY, AMOUNT)
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_emits_events(token_factory):
+    erc20, account = token_factory
+    recipients = [RECIPIENT, RECIPIENT + 1]
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            len(recipients), *recipients,
+            2, *AMOUNT, *UINT_ONE
+        ])
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[ZERO_ADDRESS, RECIPIENT, *AMOUNT]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[ZERO_ADDRESS, RECIPIENT + 1, *UINT_ONE]
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_length_mismatch(token_factory):
+    erc20, account = token_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            2, RECIPIENT, RECIPIENT + 1,
+            1, *AMOUNT
+        ]),
+        reverted_with="ERC20: recipients and amounts length mismatch"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_to_zero_address(token_factory):
+    erc20, account = token_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            2, RECIPIENT, ZERO_ADDRESS,
+            2, *AMOUNT, *AMOUNT
+        ]),
+        reverted_with="ERC20: cannot mint to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_overflow(token_factory):
+    erc20, account = token_factory
+    # the sum of the batch overflows even though each amount fits
+    pass_amount = sub_uint(MAX_UINT256, INIT_SUPPLY)
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            2, RECIPIENT, RECIPIENT + 1,
+            2, *pass_amount, *UINT_ONE
+        ]),
+        reverted_with="ERC20: mint overflow"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_invalid_uint256(token_factory):
+    erc20, account = token_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'mintBatch', [
+            1, RECIPIENT,
+            1, *INVALID_UINT256
+        ]),
+        reverted_with="ERC20: amount is not a valid Uint256"
+    )
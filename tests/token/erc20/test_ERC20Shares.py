@@ -0,0 +1,241 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    to_uint, str_to_felt, ZERO_ADDRESS, get_contract_class, cached_contract,
+    assert_revert, assert_event_emitted
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# testing vars
+RECIPIENT = 123
+INIT_SUPPLY = to_uint(1000)
+AMOUNT = to_uint(200)
+NAME = str_to_felt("Shares Token")
+SYMBOL = str_to_felt("STKN")
+DECIMALS = 18
+INDEX_ONE = 10 ** 18
+# one share is worth 1.5 tokens
+INDEX_ONE_AND_HALF = to_uint(INDEX_ONE * 3 // 2)
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc20_cls = get_contract_class('ERC20Shares')
+
+    return account_cls, erc20_cls
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_classes):
+    account_cls, erc20_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc20 = await starknet.deploy(
+        contract_class=erc20_cls,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            DECIMALS,
+            *INIT_SUPPLY,
+            account1.contract_address,        # recipient
+            account1.contract_address         # owner
+        ]
+    )
+    return (
+        starknet.state,
+        account1,
+        erc20
+    )
+
+
+@pytest.fixture
+def token_factory(contract_classes, erc20_init):
+    account_cls, erc20_cls = contract_classes
+    state, account1, erc20 = erc20_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    erc20 = cached_contract(_state, erc20_cls, erc20)
+
+    return erc20, account1
+
+
+@pytest.mark.asyncio
+async def test_constructor(token_factory):
+    erc20, account = token_factory
+
+    execution_info = await erc20.index().call()
+    assert execution_info.result.index == to_uint(INDEX_ONE)
+
+    execution_info = await erc20.balanceOf(account.contract_address).call()
+    assert execution_info.result.balance == INIT_SUPPLY
+
+    execution_info = await erc20.sharesOf(account.contract_address).call()
+    assert execution_info.result.shares == INIT_SUPPLY
+
+    execution_info = await erc20.totalSupply().call()
+    assert execution_info.result.totalSupply == INIT_SUPPLY
+
+
+@pytest.mark.asyncio
+async def test_setIndex_updates_balances(token_factory):
+    erc20, account = token_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *AMOUNT]
+    )
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    execution_info = await erc20.balanceOf(account.contract_address).call()
+    assert execution_info.result.balance == to_uint(1200)
+
+    execution_info = await erc20.balanceOf(RECIPIENT).call()
+    assert execution_info.result.balance == to_uint(300)
+
+    execution_info = await erc20.totalSupply().call()
+    assert execution_info.result.totalSupply == to_uint(1500)
+
+    # shares are left untouched
+    execution_info = await erc20.totalShares().call()
+    assert execution_info.result.totalShares == INIT_SUPPLY
+
+
+@pytest.mark.asyncio
+async def test_setIndex_emits_event(token_factory):
+    erc20, account = token_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='IndexUpdated',
+        data=[*to_uint(INDEX_ONE), *INDEX_ONE_AND_HALF]
+    )
+
+
+@pytest.mark.asyncio
+async def test_setIndex_zero(token_factory):
+    erc20, account = token_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*to_uint(0)]),
+        reverted_with="ERC20Shares: index cannot be zero"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transfer_after_setIndex(token_factory):
+    erc20, account = token_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    # 300 tokens are 200 shares
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *to_uint(300)]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[account.contract_address, RECIPIENT, *to_uint(300)]
+    )
+
+    execution_info = await erc20.sharesOf(RECIPIENT).call()
+    assert execution_info.result.shares == AMOUNT
+
+    execution_info = await erc20.balanceOf(RECIPIENT).call()
+    assert execution_info.result.balance == to_uint(300)
+
+    execution_info = await erc20.balanceOf(account.contract_address).call()
+    assert execution_info.result.balance == to_uint(1200)
+
+
+@pytest.mark.asyncio
+async def test_transfer_exceeds_balance_after_setIndex(token_factory):
+    erc20, account = token_factory
+
+    # halve the value of every share
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*to_uint(INDEX_ONE // 2)]
+    )
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *to_uint(501)]),
+        reverted_with="ERC20: transfer amount exceeds balance"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_after_setIndex(token_factory):
+    erc20, account = token_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'mint', [RECIPIENT, *to_uint(300)]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[ZERO_ADDRESS, RECIPIENT, *to_uint(300)]
+    )
+
+    execution_info = await erc20.sharesOf(RECIPIENT).call()
+    assert execution_info.result.shares == AMOUNT
+
+    execution_info = await erc20.totalSupply().call()
+    assert execution_info.result.totalSupply == to_uint(1800)
+
+
+@pytest.mark.asyncio
+async def test_transfer_above_balance_after_setIndex(token_factory):
+    erc20, account = token_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    # 1000 shares are 1500 tokens, 1501 tokens round up to 1001 shares
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *to_uint(1501)]),
+        reverted_with="ERC20: transfer amount exceeds balance"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transfer_dust_after_setIndex(token_factory):
+    erc20, account = token_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'setIndex', [*INDEX_ONE_AND_HALF]
+    )
+
+    # one token is worth less than one share, it still costs a full share
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *to_uint(1)]
+    )
+
+    execution_info = await erc20.sharesOf(account.contract_address).call()
+    assert execution_info.result.shares == to_uint(999)
+
+    execution_info = await erc20.sharesOf(RECIPIENT).call()
+    assert execution_info.result.shares == to_uint(1)
@@ -0,0 +1,158 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, str_to_felt_array, felt_array_to_str, assert_revert,
+    get_contract_class, cached_contract, to_uint
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random token IDs
+TOKENS = [to_uint(5042), to_uint(0), to_uint(2 ** 200 + 1)]
+# test token
+TOKEN = TOKENS[0]
+# longer than a single short string
+BASE_URI = 'ipfs://QmXoypizjW3WknFiJnKLwHCnL72vedxjQkDDP1mXWo6uco/'
+# random URI
+SAMPLE_URI = str_to_felt('mock://mytoken.v1')
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721BaseURIMintableBurnable')
+
+    return account_cls, erc721_cls
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_classes):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account1.contract_address           # owner
+        ]
+    )
+    # mint tokens to account and set the base URI
+    for token in TOKENS:
+        await signer.send_transaction(
+            account1, erc721.contract_address, 'mint', [
+                account1.contract_address, *token]
+        )
+    base_uri = str_to_felt_array(BASE_URI)
+    await signer.send_transaction(
+        account1, erc721.contract_address, 'setBaseURI', [
+            len(base_uri), *base_uri]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc721
+    )
+
+
+@pytest.fixture
+def erc721_factory(contract_classes, erc721_init):
+    account_cls, erc721_cls = contract_classes
+    state, account1, account2, erc721 = erc721_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    erc721 = cached_contract(_state, erc721_cls, erc721)
+
+    return erc721, account1, account2
+
+
+@pytest.mark.asyncio
+async def test_baseURI(erc721_factory):
+    erc721, _, _ = erc721_factory
+
+    execution_info = await erc721.baseURI().call()
+    assert felt_array_to_str(execution_info.result.baseURI) == BASE_URI
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('token', TOKENS)
+async def test_tokenURI(erc721_factory, token):
+    erc721, _, _ = erc721_factory
+
+    execution_info = await erc721.tokenURI(token).call()
+    token_id = token[0] + (token[1] << 128)
+    assert felt_array_to_str(execution_info.result.tokenURI) == BASE_URI + str(token_id)
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_without_base_uri(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [0]
+    )
+
+    execution_info = await erc721.tokenURI(TOKEN).call()
+    assert execution_info.result.tokenURI == []
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_override(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setTokenURI', [*TOKEN, SAMPLE_URI]
+    )
+
+    execution_info = await erc721.tokenURI(TOKEN).call()
+    assert execution_info.result.tokenURI == [SAMPLE_URI]
+
+    # other tokens still resolve from the base URI
+    execution_info = await erc721.tokenURI(TOKENS[1]).call()
+    assert felt_array_to_str(execution_info.result.tokenURI) == BASE_URI + '0'
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_nonexistent_token(erc721_factory):
+    erc721, _, _ = erc721_factory
+
+    await assert_revert(
+        erc721.tokenURI(to_uint(999)).call(),
+        reverted_with="ERC721_Metadata: URI query for nonexistent token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setBaseURI_overwrites_longer_uri(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    base_uri = str_to_felt_array('mock://v2/')
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [
+            len(base_uri), *base_uri]
+    )
+
+    execution_info = await erc721.tokenURI(TOKEN).call()
+    assert felt_array_to_str(execution_info.result.tokenURI) == 'mock://v2/5042'
+
+
+@pytest.mark.asyncio
+async def test_setBaseURI_not_owner(erc721_factory):
+    erc721, _, other = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        other, erc721.contract_address, 'setBaseURI', [1, SAMPLE_URI]),
+        reverted_with="Ownable: caller is not the owner"
+    )
@@ -0,0 +1,362 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, ZERO_ADDRESS, assert_revert, assert_event_emitted,
+    get_contract_class, cached_contract, to_uint, decode_transfer_events, TRUE
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# size of the first run
+QUANTITY = 5
+# random user address
+RECIPIENT = 555
+# random data (mimicking bytes in Solidity)
+DATA = [0x42, 0x89, 0x55]
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721ConsecutiveMintableBurnable')
+    erc721_holder_cls = get_contract_class('ERC721Holder')
+
+    return account_cls, erc721_cls, erc721_holder_cls
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_classes):
+    account_cls, erc721_cls, erc721_holder_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account1.contract_address           # owner
+        ]
+    )
+    erc721_holder = await starknet.deploy(
+        contract_class=erc721_holder_cls,
+        constructor_calldata=[]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc721,
+        erc721_holder
+    )
+
+
+@pytest.fixture
+def erc721_factory(contract_classes, erc721_init):
+    account_cls, erc721_cls, erc721_holder_cls = contract_classes
+    state, account1, account2, erc721, erc721_holder = erc721_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    erc721 = cached_contract(_state, erc721_cls, erc721)
+    erc721_holder = cached_contract(_state, erc721_holder_cls, erc721_holder)
+
+    return erc721, account1, account2, erc721_holder
+
+
+@pytest.fixture
+async def erc721_minted(erc721_factory):
+    erc721, account, account2, erc721_holder = erc721_factory
+    # mint tokens 0 to QUANTITY - 1 to account
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [
+            account.contract_address, QUANTITY]
+    )
+
+    return erc721, account, account2, erc721_holder
+
+
+async def assert_owners(erc721, owners):
+    for token_id, owner in enumerate(owners):
+        execution_info = await erc721.ownerOf(to_uint(token_id)).call()
+        assert execution_info.result == (owner,)
+
+
+#
+# mint
+#
+
+
+@pytest.mark.asyncio
+async def test_mint(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    execution_info = await erc721.balanceOf(account.contract_address).call()
+    assert execution_info.result == (to_uint(QUANTITY),)
+
+    execution_info = await erc721.nextTokenId().call()
+    assert execution_info.result == (to_uint(QUANTITY),)
+
+    await assert_owners(erc721, [account.contract_address] * QUANTITY)
+
+
+@pytest.mark.asyncio
+async def test_mint_emits_events(erc721_factory):
+    erc721, account, _, _ = erc721_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, 3]
+    )
+
+    for token_id in range(3):
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[ZERO_ADDRESS, RECIPIENT, *to_uint(token_id)]
+        )
+
+
+@pytest.mark.asyncio
+async def test_mint_consecutive_transfer_event(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setConsecutiveTransferEvent', [TRUE]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, 3]
+    )
+
+    # a single event covers the whole run
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc721.contract_address,
+        name='ConsecutiveTransfer',
+        data=[*to_uint(QUANTITY), *to_uint(QUANTITY + 2), ZERO_ADDRESS, RECIPIENT]
+    )
+
+    assert decode_transfer_events(tx_exec_info, erc721.contract_address) == [
+        (ZERO_ADDRESS, RECIPIENT, token_id) for token_id in range(QUANTITY, QUANTITY + 3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mint_consecutive_runs(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, 3]
+    )
+
+    execution_info = await erc721.nextTokenId().call()
+    assert execution_info.result == (to_uint(QUANTITY + 3),)
+
+    await assert_owners(
+        erc721, [account.contract_address] * QUANTITY + [RECIPIENT] * 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_zero_quantity(erc721_factory):
+    erc721, account, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, 0]),
+        reverted_with="ERC721Consecutive: quantity must be between 1 and 1000"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_exceeds_max_batch_size(erc721_factory):
+    erc721, account, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, 1001]),
+        reverted_with="ERC721Consecutive: quantity must be between 1 and 1000"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_to_zero_address(erc721_factory):
+    erc721, account, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'mint', [ZERO_ADDRESS, 1]),
+        reverted_with="ERC721: cannot mint to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_ownerOf_nonexistent_token(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.ownerOf(to_uint(QUANTITY)).call(),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+
+
+#
+# transferFrom
+#
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_splits_run(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(2)]
+    )
+
+    await assert_owners(erc721, [
+        account.contract_address,
+        account.contract_address,
+        RECIPIENT,
+        account.contract_address,
+        account.contract_address
+    ])
+
+    execution_info = await erc721.balanceOf(account.contract_address).call()
+    assert execution_info.result == (to_uint(QUANTITY - 1),)
+
+    execution_info = await erc721.balanceOf(RECIPIENT).call()
+    assert execution_info.result == (to_uint(1),)
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_last_token(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(QUANTITY - 1)]
+    )
+
+    await assert_owners(
+        erc721, [account.contract_address] * (QUANTITY - 1) + [RECIPIENT]
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_approved_user(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *to_uint(3)]
+    )
+
+    execution_info = await erc721.getApproved(to_uint(3)).call()
+    assert execution_info.result == (spender.contract_address,)
+
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(3)]
+    )
+
+    execution_info = await erc721.ownerOf(to_uint(3)).call()
+    assert execution_info.result == (RECIPIENT,)
+
+    # approvals are cleared
+    execution_info = await erc721.getApproved(to_uint(3)).call()
+    assert execution_info.result == (ZERO_ADDRESS,)
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_not_owner(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        spender, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(1)]),
+        reverted_with="ERC721: either is not approved or the caller is the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_to_receiver(erc721_minted):
+    erc721, account, _, erc721_holder = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            erc721_holder.contract_address,
+            *to_uint(1),
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    await assert_owners(erc721, [
+        account.contract_address,
+        erc721_holder.contract_address,
+        account.contract_address,
+        account.contract_address,
+        account.contract_address
+    ])
+
+
+#
+# burn
+#
+
+
+@pytest.mark.asyncio
+async def test_burn_splits_run(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'burn', [*to_uint(0)]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc721.contract_address,
+        name='Transfer',
+        data=[account.contract_address, ZERO_ADDRESS, *to_uint(0)]
+    )
+
+    await assert_revert(
+        erc721.ownerOf(to_uint(0)).call(),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+
+    for token_id in range(1, QUANTITY):
+        execution_info = await erc721.ownerOf(to_uint(token_id)).call()
+        assert execution_info.result == (account.contract_address,)
+
+    execution_info = await erc721.balanceOf(account.contract_address).call()
+    assert execution_info.result == (to_uint(QUANTITY - 1),)
+
+
+@pytest.mark.asyncio
+async def test_burn_consecutive_tokens(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    for token_id in [2, 1]:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'burn', [*to_uint(token_id)]
+        )
+
+    for token_id in [0, 3, 4]:
+        execution_info = await erc721.ownerOf(to_uint(token_id)).call()
+        assert execution_info.result == (account.contract_address,)
+
+    # burned tokens cannot be transferred
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(1)]),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
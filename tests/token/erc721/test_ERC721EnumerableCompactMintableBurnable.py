@@ -0,0 +1,190 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, MAX_UINT256, get_contract_class, cached_contract,
+    TRUE, assert_revert, to_uint
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# random token IDs
+TOKENS = [
+    to_uint(5042), to_uint(793), to_uint(321), MAX_UINT256, to_uint(8)
+]
+# total tokens as uint
+TOTAL_TOKENS = to_uint(len(TOKENS))
+# random user address
+RECIPIENT = 555
+# selector id
+ENUMERABLE_INTERFACE_ID = 0x780e9d63
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721EnumerableCompactMintableBurnable')
+
+    return account_cls, erc721_cls
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_classes):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account1.contract_address           # owner
+        ]
+    )
+    # mint tokens to account
+    for token in TOKENS:
+        await signer.send_transaction(
+            account1, erc721.contract_address, 'mint', [
+                account1.contract_address, *token]
+        )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc721
+    )
+
+
+@pytest.fixture
+def erc721_minted(contract_classes, erc721_init):
+    account_cls, erc721_cls = contract_classes
+    state, account1, account2, erc721 = erc721_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    erc721 = cached_contract(_state, erc721_cls, erc721)
+
+    return erc721, account1, account2
+
+
+@pytest.mark.asyncio
+async def test_supportsInterface(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.supportsInterface(ENUMERABLE_INTERFACE_ID).invoke()
+    assert execution_info.result == (TRUE,)
+
+
+@pytest.mark.asyncio
+async def test_totalSupply(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (TOTAL_TOKENS,)
+
+
+@pytest.mark.asyncio
+async def test_tokenByIndex(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    for i in range(0, len(TOKENS)):
+        execution_info = await erc721.tokenByIndex(to_uint(i)).invoke()
+        assert execution_info.result == (TOKENS[i],)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('index', [to_uint(len(TOKENS)), to_uint(2 ** 128)])
+async def test_tokenByIndex_greater_than_supply(erc721_minted, index):
+    erc721, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokenByIndex(index).invoke(),
+        reverted_with="ERC721Enumerable: global index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokenOfOwnerByIndex_greater_than_balance(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokenOfOwnerByIndex(
+            account.contract_address, TOTAL_TOKENS).invoke(),
+        reverted_with="ERC721Enumerable: owner index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokenOfOwnerByIndex_after_transfer(erc721_minted):
+    erc721, account, other = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, other.contract_address, *TOKENS[1]]
+    )
+
+    execution_info = await erc721.tokenOfOwnerByIndex(
+        other.contract_address, to_uint(0)).invoke()
+    assert execution_info.result == (TOKENS[1],)
+
+    # the last token takes the place of the transferred one
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [
+        TOKENS[0], TOKENS[-1], *TOKENS[2:-1]]
+
+
+@pytest.mark.asyncio
+async def test_tokenByIndex_burn_first_token(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burn', [*TOKENS[0]]
+    )
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(len(TOKENS) - 1),)
+
+    execution_info = await erc721.tokens(to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[-1], *TOKENS[1:-1]]
+
+
+@pytest.mark.asyncio
+async def test_tokenByIndex_burn_and_mint(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    for token in TOKENS:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'burn', [*token]
+        )
+
+    await assert_revert(
+        erc721.tokenByIndex(to_uint(0)).invoke(),
+        reverted_with="ERC721Enumerable: global index out of bounds"
+    )
+
+    for token in TOKENS:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'mint', [
+                account.contract_address, *token]
+        )
+
+    execution_info = await erc721.tokens(to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == TOKENS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit', [(1, 2), (3, 10), (2 ** 128, 1)])
+async def test_tokens(erc721_minted, offset, limit):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokens(to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == TOKENS[offset:offset + limit]
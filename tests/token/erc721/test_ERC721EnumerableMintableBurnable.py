@@ -309,3 +309,196 @@ async def test_tokenByIndex_burn_and_mint(erc721_minted):
     for i in range(0, len(TOKENS)):
         execution_info = await erc721.tokenByIndex(to_uint(i)).invoke()
         assert execution_info.result == (TOKENS[i],)
+
+
+#
+# tokens
+#
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit', [(0, 5), (1, 2), (3, 10), (5, 1)])
+async def test_tokens(erc721_minted, offset, limit):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokens(to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == TOKENS[offset:offset + limit]
+
+
+@pytest.mark.asyncio
+async def test_tokens_after_burn(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burn', [*TOKENS[0]]
+    )
+
+    # the last token takes the place of the burned one
+    execution_info = await erc721.tokens(to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[-1], *TOKENS[1:-1]]
+
+
+@pytest.mark.asyncio
+async def test_tokens_negative_limit(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokens(to_uint(0), -1).invoke(),
+        reverted_with="ERC721Enumerable: limit cannot be negative"
+    )
+
+
+#
+# tokensOfOwner
+#
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit', [(0, 5), (2, 2), (4, 10), (6, 1)])
+async def test_tokensOfOwner(erc721_minted, offset, limit):
+    erc721, account, _ = erc721_minted
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == TOKENS[offset:offset + limit]
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_after_transfer(erc721_minted):
+    erc721, account, other = erc721_minted
+
+    for token in TOKENS[1:3]:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'transferFrom', [
+                account.contract_address, other.contract_address, *token]
+        )
+
+    execution_info = await erc721.tokensOfOwner(
+        other.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == TOKENS[1:3]
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert sorted(execution_info.result.tokenIds) == sorted(
+        [TOKENS[0], *TOKENS[3:]])
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_owner_with_no_tokens(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokensOfOwner(
+        RECIPIENT, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == []
+
+
+#
+# mintBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_mintBatch(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            account.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (TOTAL_TOKENS,)
+
+    execution_info = await erc721.tokens(to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == TOKENS
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == TOKENS
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_after_mint(erc721_minted):
+    erc721, account, _ = erc721_minted
+    new_tokens = [to_uint(1), to_uint(2)]
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            account.contract_address,
+            len(new_tokens),
+            *[felt for token in new_tokens for felt in token]
+        ]
+    )
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(len(TOKENS) + len(new_tokens)),)
+
+    execution_info = await erc721.tokenOfOwnerByIndex(
+        account.contract_address, TOTAL_TOKENS).invoke()
+    assert execution_info.result == (new_tokens[0],)
+
+    execution_info = await erc721.tokenByIndex(
+        add_uint(TOTAL_TOKENS, to_uint(1))).invoke()
+    assert execution_info.result == (new_tokens[1],)
+
+
+#
+# burnBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_burnBatch(erc721_minted):
+    erc721, account, _ = erc721_minted
+    burned = [TOKENS[0], TOKENS[3]]
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            len(burned),
+            *[felt for token in burned for felt in token]
+        ]
+    )
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(len(TOKENS) - len(burned)),)
+
+    # same order as burning the tokens one by one
+    expected = [TOKENS[4], TOKENS[1], TOKENS[2]]
+    execution_info = await erc721.tokens(to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == expected
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == expected
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_all_tokens(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(0),)
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == []
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_unowned_token(erc721_minted):
+    erc721, _, other = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        other, erc721.contract_address, 'burnBatch', [1, *TOKENS[0]]),
+        reverted_with="ERC721: burn from incorrect owner"
+    )
@@ -0,0 +1,156 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from signers import MockSigner
+from utils import (
+    str_to_felt, get_contract_class, cached_contract, assert_revert,
+    assert_event_emitted, to_uint, ZERO_ADDRESS
+)
+
+
+signer = MockSigner(123456789987654321)
+
+# number of tokens minted by the fixture
+N_TOKENS = 4
+TOKENS = [to_uint(token_id) for token_id in range(N_TOKENS)]
+# random user address
+RECIPIENT = 555
+
+
+@pytest.fixture(scope='module')
+def contract_classes():
+    account_cls = get_contract_class('Account')
+    erc721_cls = get_contract_class('ERC721EnumerableSequentialMintable')
+
+    return account_cls, erc721_cls
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_classes):
+    account_cls, erc721_cls = contract_classes
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_class=account_cls,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_class=erc721_cls,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT"),                 # ticker
+            account1.contract_address           # owner
+        ]
+    )
+    # mint tokens 0 to N_TOKENS - 1 to account
+    for _ in range(N_TOKENS):
+        await signer.send_transaction(
+            account1, erc721.contract_address, 'mint', [
+                account1.contract_address]
+        )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc721
+    )
+
+
+@pytest.fixture
+def erc721_minted(contract_classes, erc721_init):
+    account_cls, erc721_cls = contract_classes
+    state, account1, account2, erc721 = erc721_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_cls, account1)
+    account2 = cached_contract(_state, account_cls, account2)
+    erc721 = cached_contract(_state, erc721_cls, erc721)
+
+    return erc721, account1, account2
+
+
+@pytest.mark.asyncio
+async def test_mint(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT]
+    )
+    assert tx_exec_info.result.response == [*to_uint(N_TOKENS)]
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc721.contract_address,
+        name='Transfer',
+        data=[ZERO_ADDRESS, RECIPIENT, *to_uint(N_TOKENS)]
+    )
+
+    execution_info = await erc721.ownerOf(to_uint(N_TOKENS)).invoke()
+    assert execution_info.result == (RECIPIENT,)
+
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(N_TOKENS + 1),)
+
+    execution_info = await erc721.tokenOfOwnerByIndex(RECIPIENT, to_uint(0)).invoke()
+    assert execution_info.result == (to_uint(N_TOKENS),)
+
+
+@pytest.mark.asyncio
+async def test_mint_not_owner(erc721_minted):
+    erc721, _, other = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        other, erc721.contract_address, 'mint', [RECIPIENT]),
+        reverted_with="Ownable: caller is not the owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokenByIndex(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    for i in range(N_TOKENS):
+        execution_info = await erc721.tokenByIndex(to_uint(i)).invoke()
+        assert execution_info.result == (TOKENS[i],)
+
+
+@pytest.mark.asyncio
+async def test_tokenByIndex_greater_than_supply(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokenByIndex(to_uint(N_TOKENS)).invoke(),
+        reverted_with="ERC721Enumerable: global index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit', [(0, N_TOKENS), (1, 2), (3, 10), (N_TOKENS, 1)])
+async def test_tokens(erc721_minted, offset, limit):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokens(to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == TOKENS[offset:offset + limit]
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_after_transfer(erc721_minted):
+    erc721, account, other = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, other.contract_address, *TOKENS[1]]
+    )
+
+    execution_info = await erc721.tokensOfOwner(
+        other.contract_address, to_uint(0), N_TOKENS).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[1]]
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), N_TOKENS).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[0], TOKENS[3], TOKENS[2]]
+
+    # the global enumeration is not affected by transfers
+    execution_info = await erc721.tokens(to_uint(0), N_TOKENS).invoke()
+    assert execution_info.result.tokenIds == TOKENS
@@ -3,7 +3,8 @@ from starkware.starknet.testing.starknet import Starknet
 from signers import MockSigner
 from utils import (
     str_to_felt, ZERO_ADDRESS, TRUE, FALSE, assert_revert, INVALID_UINT256,
-    assert_event_emitted, get_contract_class, cached_contract, to_uint, sub_uint, add_uint
+    assert_event_emitted, get_contract_class, cached_contract, to_uint, from_uint, sub_uint, add_uint,
+    decode_transfer_events
 )
 
 
@@ -226,6 +227,39 @@ async def test_ownerOf_invalid_uint256(erc721_factory):
     )
 
 
+
+@pytest.mark.asyncio
+async def test_ownersOf(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, spender.contract_address, *TOKENS[1]]
+    )
+
+    execution_info = await erc721.ownersOf(
+        TOKENS, [account.contract_address, spender.contract_address, RECIPIENT]
+    ).invoke()
+    assert execution_info.result.owners == [
+        account.contract_address, spender.contract_address
+    ]
+    assert execution_info.result.balances == [to_uint(1), to_uint(1), to_uint(0)]
+
+
+@pytest.mark.asyncio
+async def test_ownersOf_nonexistent_token(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    # nonexistent and invalid tokens are reported as zero instead of reverting
+    execution_info = await erc721.ownersOf(
+        [TOKEN, NONEXISTENT_TOKEN, INVALID_UINT256], []
+    ).invoke()
+    assert execution_info.result.owners == [
+        account.contract_address, ZERO_ADDRESS, ZERO_ADDRESS
+    ]
+    assert execution_info.result.balances == []
+
+
 #
 # mint
 #
@@ -421,6 +455,275 @@ async def test_burn_from_zero_address(erc721_minted):
     )
 
 
+#
+# mintBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_mintBatch(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            RECIPIENT,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    for token in TOKENS:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[ZERO_ADDRESS, RECIPIENT, *token]
+        )
+
+        execution_info = await erc721.ownerOf(token).invoke()
+        assert execution_info.result == (RECIPIENT,)
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_duplicate_token_id(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            RECIPIENT, 2, *TOKEN, *TOKEN]),
+        reverted_with="ERC721: token already minted"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_to_zero_address(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            ZERO_ADDRESS, 1, *TOKEN]),
+        reverted_with="ERC721: cannot mint to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_by_not_owner(erc721_factory):
+    erc721, _, not_owner, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        not_owner, erc721.contract_address, 'mintBatch', [
+            RECIPIENT, 1, *TOKEN]),
+        reverted_with="Ownable: caller is not the owner"
+    )
+
+
+#
+# burnBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_burnBatch(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKEN]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    for token in TOKENS:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[account.contract_address, ZERO_ADDRESS, *token]
+        )
+
+        await assert_revert(
+            erc721.ownerOf(token).invoke(),
+            reverted_with="ERC721: owner query for nonexistent token"
+        )
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    assert execution_info.result == (to_uint(0),)
+
+    # approvals are cleared, minting the token again starts without one
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, *TOKEN]
+    )
+    execution_info = await erc721.getApproved(TOKEN).invoke()
+    assert execution_info.result == (ZERO_ADDRESS,)
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_unowned_token(erc721_minted):
+    erc721, account, other, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        other, erc721.contract_address, 'burnBatch', [1, *TOKEN]),
+        reverted_with="ERC721: burn from incorrect owner"
+    )
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            2, *TOKEN, *NONEXISTENT_TOKEN]),
+        reverted_with="ERC721: burn from incorrect owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_from_zero_address(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.burnBatch([TOKEN]).invoke(),
+        reverted_with="ERC721: cannot burn from the zero address"
+    )
+
+
+#
+# ConsecutiveTransfer
+#
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_consecutive_transfer_event(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+    token_ids = [1, 2, 3, 7, 8]
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setConsecutiveTransferEvent', [TRUE]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            RECIPIENT,
+            len(token_ids),
+            *[felt for token_id in token_ids for felt in to_uint(token_id)]
+        ]
+    )
+
+    # one event per run of consecutive ids
+    for first_id, last_id in [(1, 3), (7, 8)]:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='ConsecutiveTransfer',
+            data=[*to_uint(first_id), *to_uint(last_id), ZERO_ADDRESS, RECIPIENT]
+        )
+
+    assert decode_transfer_events(tx_exec_info, erc721.contract_address) == [
+        (ZERO_ADDRESS, RECIPIENT, token_id) for token_id in token_ids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_consecutive_transfer_event(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+    token_ids = [4, 5, 6]
+    calldata = [
+        len(token_ids),
+        *[felt for token_id in token_ids for felt in to_uint(token_id)]
+    ]
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            account.contract_address, *calldata]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setConsecutiveTransferEvent', [TRUE]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address, RECIPIENT, *calldata]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc721.contract_address,
+        name='ConsecutiveTransfer',
+        data=[*to_uint(4), *to_uint(6), account.contract_address, RECIPIENT]
+    )
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(token_ids)),)
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_consecutive_transfer_event(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setConsecutiveTransferEvent', [TRUE]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    # ids that do not follow each other make runs of one token
+    assert decode_transfer_events(tx_exec_info, erc721.contract_address) == [
+        (account.contract_address, ZERO_ADDRESS, from_uint(token)) for token in TOKENS
+    ]
+
+
+@pytest.mark.asyncio
+async def test_consecutive_transfer_event_disabled(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            RECIPIENT, 2, *to_uint(1), *to_uint(2)]
+    )
+
+    for token_id in [1, 2]:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[ZERO_ADDRESS, RECIPIENT, *to_uint(token_id)]
+        )
+
+    # `Transfer` events decode to the same transfers
+    assert decode_transfer_events(tx_exec_info, erc721.contract_address) == [
+        (ZERO_ADDRESS, RECIPIENT, 1), (ZERO_ADDRESS, RECIPIENT, 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_setConsecutiveTransferEvent_invalid_bool(erc721_factory):
+    erc721, account, _, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'setConsecutiveTransferEvent', [2]),
+        reverted_with="ERC721: enabled is not a Cairo boolean"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setConsecutiveTransferEvent_by_not_owner(erc721_factory):
+    erc721, _, not_owner, _, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        not_owner, erc721.contract_address, 'setConsecutiveTransferEvent', [TRUE]),
+        reverted_with="Ownable: caller is not the owner"
+    )
+
+
 #
 # approve
 #
@@ -572,6 +875,29 @@ async def test_getApproved_invalid_uint256(erc721_minted):
     )
 
 
+@pytest.mark.asyncio
+async def test_getApprovedBatch(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKENS[1]]
+    )
+
+    execution_info = await erc721.getApprovedBatch(TOKENS).invoke()
+    assert execution_info.result.approved == [ZERO_ADDRESS, spender.contract_address]
+
+
+@pytest.mark.asyncio
+async def test_getApprovedBatch_nonexistent_token(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.getApprovedBatch([TOKEN, NONEXISTENT_TOKEN]).invoke(),
+        reverted_with="ERC721: approved query for nonexistent token"
+    )
+
+
 #
 # setApprovalForAll
 #
@@ -684,6 +1010,75 @@ async def test_setApprovalForAll_operator_is_zero_address(erc721_minted):
     )
 
 
+#
+# setApprovalsForAll
+#
+
+
+@pytest.mark.asyncio
+async def test_setApprovalsForAll(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+    operators = [spender.contract_address, RECIPIENT]
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalsForAll', [
+            len(operators), *operators, 2, TRUE, TRUE]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalsForAll', [
+            len(operators), *operators, 2, FALSE, TRUE]
+    )
+
+    for (operator, approved) in zip(operators, [FALSE, TRUE]):
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='ApprovalForAll',
+            data=[account.contract_address, operator, approved]
+        )
+
+        execution_info = await erc721.isApprovedForAll(
+            account.contract_address, operator).invoke()
+        assert execution_info.result == (approved,)
+
+
+@pytest.mark.asyncio
+async def test_setApprovalsForAll_length_mismatch(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'setApprovalsForAll', [
+                2, spender.contract_address, RECIPIENT, 1, TRUE]),
+        reverted_with="ERC721: operators and approved length mismatch"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setApprovalsForAll_owner_is_operator(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'setApprovalsForAll', [
+                2, spender.contract_address, account.contract_address, 2, TRUE, TRUE]),
+        reverted_with="ERC721: approve to caller"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setApprovalsForAll_operator_is_zero_address(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'setApprovalsForAll', [
+                2, spender.contract_address, ZERO_ADDRESS, 2, TRUE, TRUE]),
+        reverted_with="ERC721: either the caller or operator is the zero address"
+    )
+
+
 #
 # transferFrom
 #
@@ -1130,6 +1525,193 @@ async def test_safeTransferFrom_invalid_uint256(erc721_minted):
     )
 
 
+#
+# batchTransferFrom
+#
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_owner(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    for token in TOKENS:
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[account.contract_address, RECIPIENT, *token]
+        )
+
+        execution_info = await erc721.ownerOf(token).invoke()
+        assert execution_info.result == (RECIPIENT,)
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    assert execution_info.result == (to_uint(0),)
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_operator(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_approved_user(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    # approve spender for every token in the batch
+    for token in TOKENS:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'approve', [
+                spender.contract_address, *token]
+        )
+
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]
+    )
+
+    for token in TOKENS:
+        # checks approval is cleared for token_id
+        execution_info = await erc721.getApproved(token).invoke()
+        assert execution_info.result == (0,)
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_when_not_approved_for_every_token(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    # approve spender for the first token only
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKENS[0]]
+    )
+
+    await assert_revert(signer.send_transaction(
+        spender, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token]
+        ]),
+        reverted_with="ERC721: either is not approved or the caller is the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_incorrect_owner(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            2,
+            *TOKEN,
+            *NONEXISTENT_TOKEN
+        ]),
+        reverted_with="ERC721: transfer from incorrect owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_to_zero_address(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'batchTransferFrom', [
+            account.contract_address,
+            ZERO_ADDRESS,
+            1,
+            *TOKEN
+        ]),
+        reverted_with="ERC721: cannot transfer to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_batchTransferFrom_from_zero_address(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    # caller address is `0` when not using an account contract
+    await assert_revert(
+        erc721.batchTransferFrom(
+            account.contract_address,
+            RECIPIENT,
+            [TOKEN]
+        ).invoke(),
+        reverted_with="ERC721: either the caller or from_ is the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom(erc721_minted):
+    erc721, account, _, erc721_holder = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'safeBatchTransferFrom', [
+            account.contract_address,
+            erc721_holder.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token],
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(erc721_holder.contract_address).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+
+@pytest.mark.asyncio
+async def test_safeBatchTransferFrom_to_unsupported_contract(erc721_unsupported):
+    erc721, account, _, _, unsupported = erc721_unsupported
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'safeBatchTransferFrom', [
+                account.contract_address,
+                unsupported.contract_address,
+                len(TOKENS),
+                *[felt for token in TOKENS for felt in token],
+                len(DATA),
+                *DATA
+            ])
+    )
+
+
 #
 # tokenURI
 #
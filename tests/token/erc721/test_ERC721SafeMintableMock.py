@@ -3,7 +3,8 @@ from starkware.starknet.testing.starknet import Starknet
 from signers import MockSigner
 from utils import (
     str_to_felt, ZERO_ADDRESS, INVALID_UINT256, assert_revert,
-    assert_event_emitted, get_contract_class, cached_contract, to_uint
+    assert_event_emitted, get_contract_class, cached_contract, to_uint,
+    get_call_count
 )
 
 
@@ -11,6 +12,8 @@ signer = MockSigner(123456789987654321)
 
 # random token id
 TOKEN = to_uint(5042)
+# random token ids
+TOKENS = [to_uint(5042), to_uint(793), to_uint(321)]
 # random data (mimicking bytes in Solidity)
 DATA = [0x42, 0x89, 0x55]
 
@@ -219,3 +222,81 @@ async def test_safeMint_invalid_uint256(erc721_factory):
         ]),
         reverted_with="ERC721: token_id is not a valid Uint256"
     )
+
+
+@pytest.mark.asyncio
+async def test_safeMintBatch_to_erc721_supported_contract(erc721_factory):
+    erc721, account, _, erc721_holder, _ = erc721_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'safeMintBatch', [
+            erc721_holder.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token],
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(erc721_holder.contract_address).call()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+    # the receiver is probed once, and notified of every token
+    assert get_call_count(
+        tx_exec_info, erc721_holder.contract_address, 'supportsInterface') == 1
+    assert get_call_count(
+        tx_exec_info, erc721_holder.contract_address, 'onERC721Received') == len(TOKENS)
+
+
+@pytest.mark.asyncio
+async def test_safeMintBatch_to_account(erc721_factory):
+    erc721, account, recipient, _, _ = erc721_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'safeMintBatch', [
+            recipient.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token],
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    for token in TOKENS:
+        execution_info = await erc721.ownerOf(token).call()
+        assert execution_info.result == (recipient.contract_address,)
+
+    # IERC721Receiver and IAccount, once for the whole batch
+    assert get_call_count(
+        tx_exec_info, recipient.contract_address, 'supportsInterface') == 2
+
+
+@pytest.mark.asyncio
+async def test_safeMintBatch_to_unsupported_contract(erc721_factory):
+    erc721, account, _, _, unsupported = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'safeMintBatch', [
+            unsupported.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token],
+            len(DATA),
+            *DATA
+        ])
+    )
+
+
+@pytest.mark.asyncio
+async def test_safeMintBatch_from_not_owner(erc721_factory):
+    erc721, _, other, erc721_holder, _ = erc721_factory
+
+    await assert_revert(signer.send_transaction(
+        other, erc721.contract_address, 'safeMintBatch', [
+            erc721_holder.contract_address,
+            len(TOKENS),
+            *[felt for token in TOKENS for felt in token],
+            len(DATA),
+            *DATA
+        ]),
+        reverted_with="Ownable: caller is not the owner"
+    )
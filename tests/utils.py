@@ -39,6 +39,18 @@ def felt_to_str(felt):
     return b_felt.decode()
 
 
+def str_to_felt_array(text):
+    """Splits a string into short strings of at most 31 characters."""
+    return [str_to_felt(text[i:i + 31]) for i in range(0, len(text), 31)]
+
+
+def felt_array_to_str(felts):
+    """Decodes and concatenates an array of short strings."""
+    return "".join(
+        felt.to_bytes(31, "big").lstrip(b"\x00").decode() for felt in felts
+    )
+
+
 def uint(a):
     return(a, 0)
 
@@ -111,6 +123,86 @@ def assert_event_emitted(tx_exec_info, from_address, name, data):
     ) in tx_exec_info.raw_events
 
 
+def decode_transfer_events(tx_exec_info, from_address):
+    """Returns the (from, to, token id) tuples of the ERC721 `Transfer` and
+    `ConsecutiveTransfer` events emitted by a contract, in emission order.
+    `ConsecutiveTransfer` ranges are expanded, the way an indexer would."""
+    transfer_key = get_selector_from_name('Transfer')
+    consecutive_key = get_selector_from_name('ConsecutiveTransfer')
+    transfers = []
+    for event in tx_exec_info.raw_events:
+        if event.from_address != from_address:
+            continue
+        if event.keys == [transfer_key]:
+            from_, to, *token_id = event.data
+            transfers.append((from_, to, from_uint(token_id)))
+        elif event.keys == [consecutive_key]:
+            first_id = from_uint(event.data[0:2])
+            last_id = from_uint(event.data[2:4])
+            from_, to = event.data[4:6]
+            transfers.extend(
+                (from_, to, token_id) for token_id in range(first_id, last_id + 1)
+            )
+    return transfers
+
+
+def get_contract_steps(tx_exec_info):
+    """Returns the Cairo steps spent in the calls an account forwarded to contracts."""
+    return sum(
+        call.execution_resources.n_steps
+        for call in tx_exec_info.call_info.internal_calls
+    )
+
+
+def get_account_steps(tx_exec_info):
+    """Returns the Cairo steps an account spent itself, excluding the calls it forwarded."""
+    return tx_exec_info.call_info.execution_resources.n_steps - get_contract_steps(tx_exec_info)
+
+
+def get_account_builtins(tx_exec_info):
+    """Returns the builtin instances an account used itself, excluding the calls it forwarded."""
+    builtins = dict(tx_exec_info.call_info.execution_resources.builtin_instance_counter)
+    for call in tx_exec_info.call_info.internal_calls:
+        for name, count in call.execution_resources.builtin_instance_counter.items():
+            builtins[name] -= count
+    return builtins
+
+
+def get_call_count(tx_exec_info, to_address, selector_name):
+    """Returns how many calls to `selector_name` on `to_address` a transaction made."""
+    selector = get_selector_from_name(selector_name)
+
+    def count(call_info):
+        own = int(
+            call_info.contract_address == to_address
+            and call_info.selector == selector
+        )
+        return own + sum(count(call) for call in call_info.internal_calls)
+
+    return count(tx_exec_info.call_info)
+
+
+def get_syscall_counts(contract):
+    """Returns how many times each syscall was executed so far in the state of a contract."""
+    return dict(contract.state.state.syscall_counter)
+
+
+async def get_storage_reads(contract, selector_name, calldata, caller_address):
+    """
+    Invokes a contract method directly as `caller_address` and returns the
+    number of storage slots read during the call, including nested calls.
+    """
+    before = get_syscall_counts(contract).get('storage_read', 0)
+    await contract.state.invoke_raw(
+        contract_address=contract.contract_address,
+        selector=selector_name,
+        calldata=calldata,
+        caller_address=caller_address,
+        max_fee=0
+    )
+    return get_syscall_counts(contract).get('storage_read', 0) - before
+
+
 def _get_path_from_name(name):
     """Return the contract path by contract name."""
     dirs = ["src", "tests/mocks"]